@@ -9,18 +9,21 @@ and includes secure password handling.
 
 import os
 import json
-import time
+import base64
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 
-from bs4 import BeautifulSoup
-import requests
 import openai
 import click
 
 from flask import Flask, jsonify, request
 from flask_sqlalchemy import SQLAlchemy  
-from sqlalchemy import or_, text
+from sqlalchemy import and_, or_, case, delete, text, func, inspect, literal_column, tuple_, update
 from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import load_only
 from flask_cors import CORS
 from flask.cli import with_appcontext
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
@@ -29,8 +32,18 @@ from dotenv import load_dotenv
 from apscheduler.schedulers.background import BackgroundScheduler
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from .search_index import (
+    TfidfSearchIndex, BM25SearchIndex, IndexFormatError, MANIFEST_NAME, index_lock, parse_field_boosts
+)
+from .rate_limiter import TokenBucket
+from .bill_text import extract_pre_text_from_response, parse_bill_html, DEFAULT_CHUNK_SIZE
+from .pipeline import bounded_map, batched, completed
+from .congress_client import CongressApiClient, ResponseCache, NOT_MODIFIED
+from .search_cache import SearchCache, LocalCacheBackend, DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS
+from .summarizer import (
+    OpenAISummaryClient, StubSummaryClient, ChunkedSummarizer, DEFAULT_MODEL, DEFAULT_CHUNK_TOKENS,
+    DEFAULT_CHUNK_WORKERS, PROMPT_VERSION, CHUNK_PROMPT_VERSION, summary_cache_key
+)
 
 # ------------------------------------------------------------------------------
 # Application and Configuration
@@ -64,6 +77,18 @@ jwt = JWTManager(app)
 
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
+# Directory of the persisted search indexes shared by all workers.
+app.config["SEARCH_INDEX_PATH"] = os.getenv(
+    "SEARCH_INDEX_PATH", os.path.join(app.instance_path, "search_index")
+)
+# Per-field search boosts, e.g. "title=3,ai_summary=1.5,full_text=0" to skip full text.
+app.config["SEARCH_FIELD_BOOSTS"] = parse_field_boosts(os.getenv("SEARCH_FIELD_BOOSTS", ""))
+# Bounds of the per-worker search result cache; a size of 0 disables it.
+app.config["SEARCH_CACHE_SIZE"] = int(os.getenv("SEARCH_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
+app.config["SEARCH_CACHE_TTL"] = float(os.getenv("SEARCH_CACHE_TTL", DEFAULT_TTL_SECONDS))
+# Number of most relevant matches a search sorted by date or votes orders to pick its results.
+app.config["SEARCH_SORT_CANDIDATES"] = int(os.getenv("SEARCH_SORT_CANDIDATES", 1000))
+
 # ------------------------------------------------------------------------------
 # Data Model Entities
 # ------------------------------------------------------------------------------
@@ -81,7 +106,9 @@ class User(db.Model):
         ethnicity (str): Ethnic group the user belongs to (e.g. Hispanic or Latino, white, asian)
         state (str): state the user lives in. 
         political_affiliation (str): Political leaning (e.g., Democrat, Republican, Independent).
-        voted_bills (JSON): A dictionary storing bill IDs as keys and the corresponding vote value as values.
+        legacy_voted_bills (JSON): The ``voted_bills`` column that stored votes as a
+            dictionary of bill IDs to vote values before ``UserVote``; only read by
+            ``migrate_user_votes``, which empties it.
     """
     __tablename__ = "users"
     id = db.Column(db.Integer, primary_key=True)
@@ -95,8 +122,14 @@ class User(db.Model):
     state = db.Column(db.String(50), nullable=True)
     political_affiliation = db.Column(db.String(50), nullable=True)  
     
-    voted_bills = db.Column(MutableDict.as_mutable(db.JSON), default=dict, nullable=False)
-    
+    legacy_voted_bills = db.Column("voted_bills", MutableDict.as_mutable(db.JSON), default=dict, nullable=False)
+
+    @property
+    def voted_bills(self) -> dict:
+        """The user's votes as a dictionary of bill IDs (as strings) to vote values, read from ``UserVote``."""
+        votes = db.session.query(UserVote.bill_id, UserVote.status).filter_by(user_id=self.id)
+        return {str(bill_id): status for bill_id, status in votes}
+
     def set_password(self, password: str) -> None:
         """Hash and set the user's password."""
         self.password_hash = generate_password_hash(password)
@@ -125,6 +158,12 @@ class Bill(db.Model):
         text_preview (str): A preview snippet of the bill's text.
         full_text (str): The full text of the bill.
         ai_summary (str): An AI-generated summary of the bill.
+        summary_hash (str): ``summary_cache_key`` of the text ``ai_summary`` was generated
+            from; when it no longer matches the bill's text, the summary is regenerated.
+            None for summaries not generated by the summary queue, which are kept.
+        detail_etag (str): ``ETag`` of the API details the stored bill was scraped from.
+        detail_last_modified (str): ``Last-Modified`` of those details. Both are sent
+            back by later scrapes, so an unchanged bill is answered with a 304.
         vote_count (int): A counter to identify bills with the most activity.
         created_at (datetime): The timestamp when the bill record was created.
         updated_at (datetime): The timestamp when the bill record was last updated.
@@ -144,38 +183,288 @@ class Bill(db.Model):
     text_preview = db.Column(db.Text)
     full_text = db.Column(db.Text)
     ai_summary = db.Column(db.Text)
+    summary_hash = db.Column(db.String(64))
+    detail_etag = db.Column(db.String(256))
+    detail_last_modified = db.Column(db.String(64))
     vote_count = db.Column(db.Integer, nullable=False, default=0)
     upvote_count = db.Column(db.Integer, nullable=False, default=0) 
     downvote_count = db.Column(db.Integer, nullable=False, default=0)
     created_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, onupdate=datetime.now(timezone.utc))
 
-class BillSearchEntry(db.Model):
-    __tablename__ = "bill_search_entries"
-    id = db.Column(db.Integer, primary_key=True)
-    bill_id = db.Column(db.Integer, db.ForeignKey("bills.id"), unique=True, nullable=False)
-    combined_text = db.Column(db.Text, nullable=False)
-
-def build_bill_search_entries():
-    bills = Bill.query.all()
-    for bill in bills:
-        parts = []
-        if bill.title:
-            parts.append(bill.title)
-        if bill.ai_summary:
-            parts.append(bill.ai_summary)
-        if bill.full_text:
-            parts.append(bill.full_text)
-        # Combine the three fields into one document.
-        combined_text = " ".join(parts)
-        
-        entry = BillSearchEntry.query.filter_by(bill_id=bill.id).first()
-        if not entry:
-            entry = BillSearchEntry(bill_id=bill.id, combined_text=combined_text)
-            db.session.add(entry)
-        else:
-            entry.combined_text = combined_text
+    # Natural key used by the scraper's upserts, and composite indexes serving
+    # keyset pagination on the common sort columns.
+    __table_args__ = (
+        db.Index("uq_bills_congress_type_number", "congress", "bill_type", "bill_number", unique=True),
+        db.Index("ix_bills_created_at_id", "created_at", "id"),
+        db.Index("ix_bills_latest_action_date_id", "latest_action_date", "id"),
+        db.Index("ix_bills_vote_count_id", "vote_count", "id"),
+    )
+
+def _search_documents(bill_ids=None) -> tuple:
+    """
+    Load the searchable fields of bills, reading only the fields that are indexed.
+
+    Args:
+        bill_ids (Iterable[int], optional): Restrict to these bills; all bills when omitted.
+    Returns:
+        tuple: ``(bill_ids, documents)`` where each document maps field name to text.
+    """
+    fields = [field for field, boost in app.config["SEARCH_FIELD_BOOSTS"].items() if boost > 0]
+    query = db.session.query(Bill.id, *[getattr(Bill, field) for field in fields])
+    if bill_ids is not None:
+        query = query.filter(Bill.id.in_(bill_ids))
+    rows = query.all()
+    return [row[0] for row in rows], [dict(zip(fields, row[1:])) for row in rows]
+
+def build_bill_search_entries(bill_ids=None):
+    """
+    Bring the search indexes up to date with the title, AI summary and full text of bills.
+
+    Each field is indexed separately and weighted by ``SEARCH_FIELD_BOOSTS``; fields
+    with a boost of zero are not read or indexed.
+
+    Args:
+        bill_ids (Iterable[int], optional): Only re-index these bills, applying them to
+            the search indexes incrementally. When omitted, every bill is processed and
+            the indexes are rebuilt from scratch.
+    """
+    if bill_ids is None:
+        rebuild_search_index()
+        return
+    bill_ids = list(bill_ids)
+    if bill_ids:
+        update_search_index(*_search_documents(bill_ids))
+
+# ------------------------------------------------------------------------------
+# Search Index
+# ------------------------------------------------------------------------------
+# Index implementations by search mode; each is stored in its own subdirectory.
+SEARCH_INDEX_TYPES = {
+    "tfidf": TfidfSearchIndex,
+    "bm25": BM25SearchIndex,
+}
+
+_search_indexes = {}
+_search_index_stamps = {}
+_search_index_lock = threading.RLock()
+# Marks the thread holding the cross-process write lock, which makes it reentrant.
+_search_index_writer = threading.local()
+# Times a search index is read again after it was replaced while being loaded.
+SEARCH_INDEX_LOAD_ATTEMPTS = 3
+
+# Ranked results of /api/search_tfidf, keyed on the query and the index version.
+search_cache = SearchCache(LocalCacheBackend(app.config["SEARCH_CACHE_SIZE"], app.config["SEARCH_CACHE_TTL"]))
+
+def _search_index_dir(mode: str) -> str:
+    """Return the directory holding the persisted index for ``mode``."""
+    return os.path.join(app.config["SEARCH_INDEX_PATH"], mode)
+
+def _search_index_manifest_stamp(mode: str):
+    """
+    Identify the current on-disk index manifest, or return None if it is absent.
+
+    Every save moves a new file into place, so the inode changes even when two saves
+    fall within the resolution of the modification time.
+    """
+    try:
+        stat = os.stat(os.path.join(_search_index_dir(mode), MANIFEST_NAME))
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+@contextmanager
+def search_index_write_lock():
+    """
+    Hold the search indexes for a read-modify-save, against other threads and processes.
+
+    Reentrant within the holding thread, so a rebuild can be started while updating.
+    The file lock is taken before ``_search_index_lock``, so searches in this worker
+    are not held up while another process writes.
+    """
+    if getattr(_search_index_writer, "active", False):
+        yield
+        return
+    with index_lock(app.config["SEARCH_INDEX_PATH"]), _search_index_lock:
+        _search_index_writer.active = True
+        try:
+            yield
+        finally:
+            _search_index_writer.active = False
+
+def _publish_search_index(mode: str, index, replace: bool = False) -> None:
+    """Save ``index`` to disk and make it the index served by this worker for ``mode``."""
+    index.save(_search_index_dir(mode), replace=replace)
+    _search_indexes[mode] = index
+    _search_index_stamps[mode] = _search_index_manifest_stamp(mode)
+    # Entries of the previous index can no longer be hit; free them right away.
+    search_cache.clear()
+
+def rebuild_search_index() -> dict:
+    """
+    Build every search index over all bills and save them to disk.
+
+    Other workers notice the newer indexes on their next search and reload them.
+
+    Returns:
+        dict: The freshly built index for each search mode.
+    """
+    boosts = app.config["SEARCH_FIELD_BOOSTS"]
+    with search_index_write_lock():
+        bill_ids, documents = _search_documents()
+        for mode, index_type in SEARCH_INDEX_TYPES.items():
+            _publish_search_index(mode, index_type(boosts=boosts).build(bill_ids, documents), replace=True)
+    app.logger.info(f"Rebuilt search indexes with {len(bill_ids)} bills")
+    return dict(_search_indexes)
+
+def update_search_index(bill_ids: list, documents: list) -> None:
+    """
+    Add or replace the documents of the given bills in every search index.
+
+    Updates are applied to copies, so searches running concurrently keep using
+    the previous indexes until the new ones are saved. The write lock is held from
+    loading the latest saved indexes until the updated ones are saved, so updates
+    from other processes are never overwritten.
+
+    Args:
+        bill_ids (list[int]): Bill ids whose documents changed.
+        documents (list[dict]): The new searchable fields of each bill.
+    """
+    with search_index_write_lock():
+        for mode in SEARCH_INDEX_TYPES:
+            index = get_search_index(mode).copy().upsert(bill_ids, documents)
+            _publish_search_index(mode, index)
+    app.logger.info(f"Updated {len(bill_ids)} bills in the search indexes")
+
+def _load_search_index(mode: str):
+    """
+    Return the saved index for ``mode``, reading it only if it changed since last loaded.
+
+    Returns:
+        TfidfSearchIndex | BM25SearchIndex: The index, or None if it is missing,
+        unreadable or was built with different field boosts.
+    """
+    for _ in range(SEARCH_INDEX_LOAD_ATTEMPTS):
+        stamp = _search_index_manifest_stamp(mode)
+        current = _search_indexes.get(mode)
+        if current is not None and stamp == _search_index_stamps.get(mode):
+            return current
+        if stamp is None:
+            return None
+        try:
+            index = SEARCH_INDEX_TYPES[mode].load(_search_index_dir(mode), previous=current)
+            configured = {field: boost for field, boost in app.config["SEARCH_FIELD_BOOSTS"].items() if boost > 0}
+            if index.boosts != configured:
+                raise IndexFormatError("field boosts changed")
+        except IndexFormatError as e:
+            if _search_index_manifest_stamp(mode) != stamp:
+                # Replaced while being read, e.g. a segment was merged away; read the new one.
+                continue
+            app.logger.warning(f"Discarding {mode} search index: {e}")
+            return None
+        _search_indexes[mode] = index
+        _search_index_stamps[mode] = stamp
+        return index
+    return None
+
+def get_search_index(mode: str = "tfidf"):
+    """
+    Return the search index for ``mode`` in this worker, loading it from disk on first use.
+
+    The index is re-read whenever another process has saved a newer version, and all
+    indexes are rebuilt from the database if one is missing, was written in an older
+    format or was built with different field boosts.
+
+    Args:
+        mode (str): One of the keys of ``SEARCH_INDEX_TYPES``.
+    Returns:
+        TfidfSearchIndex | BM25SearchIndex: The current index for the mode.
+    """
+    with _search_index_lock:
+        index = _load_search_index(mode)
+        if index is not None:
+            return index
+    with search_index_write_lock():
+        # Another process may have rebuilt the indexes while this one waited.
+        index = _load_search_index(mode)
+        if index is not None:
+            return index
+        return rebuild_search_index()[mode]
+
+# ------------------------------------------------------------------------------
+# PostgreSQL Full-Text Search
+# ------------------------------------------------------------------------------
+# Text search configuration used for both the stored vectors and the queries.
+FULLTEXT_CONFIG = "english"
+
+# The search vector is a generated column, so PostgreSQL keeps it in sync with the
+# title (weight A), AI summary (B) and text preview (C) on every insert and update.
+FULLTEXT_MIGRATION = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""
+    ALTER TABLE bills ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{FULLTEXT_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{FULLTEXT_CONFIG}', coalesce(ai_summary, '')), 'B') ||
+        setweight(to_tsvector('{FULLTEXT_CONFIG}', coalesce(text_preview, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_bills_search_vector ON bills USING GIN (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_bills_title_trgm ON bills USING GIN (title gin_trgm_ops)",
+]
+
+_fulltext_available = None
+
+def migrate_fulltext_search() -> bool:
+    """
+    Add the search vector column and its GIN and trigram indexes to the bills table.
+
+    The statements are idempotent. Databases other than PostgreSQL are left untouched.
+
+    Returns:
+        bool: True if the migration ran, False if the database is not PostgreSQL.
+    """
+    global _fulltext_available
+    if db.engine.dialect.name != "postgresql":
+        return False
+    for statement in FULLTEXT_MIGRATION:
+        db.session.execute(text(statement))
     db.session.commit()
+    _fulltext_available = True
+    return True
+
+def fulltext_search_available() -> bool:
+    """
+    Return whether /api/search can use PostgreSQL full-text search.
+
+    This is the case on PostgreSQL once ``migrate-fulltext-search`` has added the
+    search vector column; the result is cached for the lifetime of the worker.
+    """
+    global _fulltext_available
+    if _fulltext_available is None:
+        _fulltext_available = db.engine.dialect.name == "postgresql" and any(
+            column["name"] == "search_vector" for column in inspect(db.engine).get_columns("bills")
+        )
+    return _fulltext_available
+
+def fulltext_search_query(keyword: str):
+    """
+    Build a query for bills matching ``keyword``, most relevant first.
+
+    Bills whose search vector matches the keyword are ranked with ``ts_rank``;
+    substring matches on the title (served by the trigram index) are kept so that
+    partial words still find bills, ranked after the full-text matches.
+
+    Args:
+        keyword (str): Search keywords in web search syntax (quotes, ``or``, ``-``).
+    Returns:
+        Query: A query over ``Bill``.
+    """
+    search_vector = literal_column("bills.search_vector")
+    ts_query = func.websearch_to_tsquery(FULLTEXT_CONFIG, keyword)
+    return Bill.query.filter(
+        or_(search_vector.op("@@")(ts_query), Bill.title.ilike(f"%{keyword}%"))
+    ).order_by(func.ts_rank(search_vector, ts_query).desc(), Bill.latest_action_date.desc())
 
 
 def default_demographics():
@@ -234,16 +523,72 @@ def default_demographics():
 
 class Vote(db.Model):
     """
-    Association model that stores a vote cast by a user on a bill.
+    Legacy storage of the vote demographics of a bill as one JSON document.
+
+    Superseded by ``VoteCounter``; ``migrate_vote_counters`` moves existing records
+    into counters and deletes them.
 
     Attributes:
         bill_id (int): Foreign key referencing the Bill being voted on.
-        vote_status (str): The vote status (e.g., 'yes', 'no', 'abstain').
+        demographics (JSON): Counters shaped like ``default_demographics()``.
     """
     __tablename__ = "votes"
     bill_id = db.Column(db.Integer, db.ForeignKey("bills.id"), primary_key=True)
     demographics = db.Column(MutableDict.as_mutable(db.JSON), nullable=False, default=default_demographics)
 
+class VoteCounter(db.Model):
+    """
+    Number of votes of one kind on a bill from voters in one demographic bucket.
+
+    Each vote increments one counter per dimension with a single atomic statement, so
+    concurrent votes never overwrite each other's counts. Counters that were never
+    incremented have no row and count zero.
+
+    Attributes:
+        bill_id (int): Foreign key referencing the Bill being voted on.
+        vote_status (str): "upvote" or "downvote".
+        dimension (str): The demographic dimension, e.g. "age_distribution".
+        bucket (str): The voter's bucket in that dimension, e.g. "18_to_30".
+        count (int): Number of such votes.
+    """
+    __tablename__ = "vote_counters"
+    bill_id = db.Column(db.Integer, db.ForeignKey("bills.id", ondelete="CASCADE"), primary_key=True)
+    vote_status = db.Column(db.String(10), primary_key=True)
+    dimension = db.Column(db.String(40), primary_key=True)
+    bucket = db.Column(db.String(64), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+class UserVote(db.Model):
+    """
+    The current vote of a user on a bill.
+
+    The unique index allows one row per user and bill, so a vote can only be cast once;
+    the vote endpoint changes it with conditional statements that fail when a
+    concurrent request changed it first. The other indexes serve "who voted on bill X"
+    and a user's votes listed by recency.
+
+    Attributes:
+        id (int): Primary key for the vote.
+        user_id (int): Foreign key referencing the voting User.
+        bill_id (int): Foreign key referencing the Bill voted on.
+        status (str): "upvote" or "downvote".
+        created_at (datetime): The timestamp when the vote was cast.
+        updated_at (datetime): The timestamp when the vote was last changed.
+    """
+    __tablename__ = "user_votes"
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    bill_id = db.Column(db.Integer, db.ForeignKey("bills.id", ondelete="CASCADE"), nullable=False)
+    status = db.Column(db.String(10), nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.Index("uq_user_votes_user_bill", "user_id", "bill_id", unique=True),
+        db.Index("ix_user_votes_bill_status", "bill_id", "status"),
+        db.Index("ix_user_votes_user_updated", "user_id", "updated_at", "id"),
+    )
+
 class ScrapeTracking(db.Model):
     """
     Model to track the current offset for scheduled batch scrapes.
@@ -252,64 +597,303 @@ class ScrapeTracking(db.Model):
         id (int): Primary key for the tracking record.
         type (str): Type of tracking record (e.g., "offset").
         offset (int): Current offset value for batch scraping.
+        high_water_mark (datetime): For the incremental sync, the time up to which
+            changed bills have been processed; for a backfill, the end of the listing
+            snapshot it pages through.
+        listing_count (int): For a backfill, the size of its listing at the last page.
     """
     __tablename__ = "scrape_tracking"
     id = db.Column(db.Integer, primary_key=True)
     type = db.Column(db.String(50), unique=True, nullable=False)
     offset = db.Column(db.Integer, default=0)
-    
+    high_water_mark = db.Column(db.DateTime)
+    listing_count = db.Column(db.Integer)
+
+class ScrapeFailure(db.Model):
+    """
+    A bill that could not be scraped, kept so that it can be retried.
+
+    Attributes:
+        id (int): Primary key for the failure record.
+        congress (int): The Congress number of the bill.
+        bill_type (str): The type of the bill.
+        bill_number (str): The bill number.
+        bill_data (dict): The bill's entry from the bill listing, to process it again.
+        error (str): The error of the latest attempt.
+        attempts (int): Number of failed attempts.
+        created_at (datetime): The timestamp of the first failure.
+        updated_at (datetime): The timestamp of the latest failure.
+    """
+    __tablename__ = "scrape_failures"
+    id = db.Column(db.Integer, primary_key=True)
+    congress = db.Column(db.Integer, nullable=False)
+    bill_type = db.Column(db.String(20), nullable=False)
+    bill_number = db.Column(db.String(20), nullable=False)
+    bill_data = db.Column(db.JSON, nullable=False)
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, nullable=False, default=1)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.Index("uq_scrape_failures_congress_type_number", "congress", "bill_type", "bill_number", unique=True),
+    )
+
+class SummaryJob(db.Model):
+    """
+    Queued request to generate the AI summary of a bill.
+
+    The scraper stores bills without waiting for a summary and enqueues one job per
+    bill; ``run_summary_jobs`` drains the queue and fills in ``Bill.ai_summary``.
+
+    Attributes:
+        id (int): Primary key for the job.
+        bill_id (int): Foreign key referencing the Bill to summarize; one job per bill.
+        status (str): "pending", "running", "done" or "failed".
+        attempts (int): Number of times the job was claimed.
+        next_attempt_at (datetime): Earliest time a pending job may be claimed.
+        last_error (str): The error of the latest failed attempt.
+        created_at (datetime): The timestamp when the job was enqueued.
+        updated_at (datetime): The timestamp of the latest status change; running jobs
+            not updated within ``SUMMARY_JOB_LEASE`` seconds are claimed again.
+    """
+    __tablename__ = "summary_jobs"
+    id = db.Column(db.Integer, primary_key=True)
+    bill_id = db.Column(db.Integer, db.ForeignKey("bills.id", ondelete="CASCADE"), unique=True, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    # Claiming scans pending jobs in due order.
+    __table_args__ = (
+        db.Index("ix_summary_jobs_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+class SummaryCacheEntry(db.Model):
+    """
+    AI summary of a text, shared by every bill with the same text.
+
+    Attributes:
+        content_hash (str): ``summary_cache_key`` of the text, model and prompt version.
+        model (str): The model that produced the summary.
+        prompt_version (str): Version of the prompt the summary was produced with.
+        summary (str): The summary.
+        created_at (datetime): The timestamp when the summary was generated.
+    """
+    __tablename__ = "summary_cache"
+    content_hash = db.Column(db.String(64), primary_key=True)
+    model = db.Column(db.String(100), nullable=False)
+    prompt_version = db.Column(db.String(20), nullable=False)
+    summary = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+def dialect_insert(table):
+    """
+    Start an ``INSERT`` on ``table`` that supports ``ON CONFLICT`` on the current database.
+
+    Args:
+        table (Table): The table to insert into.
+    Returns:
+        Insert: A PostgreSQL or SQLite insert construct.
+    """
+    if db.engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
 # ------------------------------------------------------------------------------
 # Scraper Class
 # ------------------------------------------------------------------------------
 CONGRESS_API_KEY = os.getenv("CONGRESS_API_KEY")
 API_RATE_LIMIT = float(os.getenv("API_RATE_LIMIT", "2"))
+# Requests allowed back to back after an idle period; the sustained rate stays API_RATE_LIMIT.
+API_RATE_BURST = float(os.getenv("API_RATE_BURST", "1"))
+# Bills processed concurrently by the scrape-bills command.
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", "4"))
+# Processes parsing bill text HTML; 0 parses on the fetching threads while downloading.
+SCRAPE_PARSE_WORKERS = int(os.getenv("SCRAPE_PARSE_WORKERS", "0"))
+# Downloaded HTML documents waiting to be parsed, at most, per scrape.
+SCRAPE_PARSE_BACKLOG = int(os.getenv("SCRAPE_PARSE_BACKLOG", "16"))
+# Bills written to the database per statement while scraping.
+SCRAPE_WRITE_BATCH = int(os.getenv("SCRAPE_WRITE_BATCH", "50"))
+
+# Directory recording raw API and HTML responses; unset to not record them.
+SCRAPER_CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR")
+# Serve every scraper request from SCRAPER_CACHE_DIR instead of the network.
+SCRAPER_REPLAY = os.getenv("SCRAPER_REPLAY", "").lower() in ("1", "true") and bool(SCRAPER_CACHE_DIR)
+
+def make_congress_api_client(cache_dir: str = None, replay: bool = False) -> CongressApiClient:
+    """
+    Create an API client, optionally recording responses to or replaying them from ``cache_dir``.
+
+    Replaying clients skip the rate limiter, since they never reach the API.
+
+    Args:
+        cache_dir (str, optional): Directory of the on-disk response cache.
+        replay (bool): Answer requests only from the cache.
+    Returns:
+        CongressApiClient: The configured client.
+    """
+    return CongressApiClient(
+        rate_limiter=None if replay else api_rate_limiter,
+        pool_size=max(SCRAPE_WORKERS, 10),
+        cache=ResponseCache(cache_dir) if cache_dir else None,
+        replay=replay,
+    )
+
+# One budget and one connection pool for the whole process, shared by every scraper
+# and worker thread.
+api_rate_limiter = TokenBucket(API_RATE_LIMIT, API_RATE_BURST)
+congress_api_client = make_congress_api_client(SCRAPER_CACHE_DIR, SCRAPER_REPLAY)
 CONGRESS_API_BASE = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3")
 
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def scrape_parse_pool():
+    """
+    Return the process pool parsing bill text for every scraper, starting it on first use.
+
+    Workers are spawned rather than forked, so they hold no copy of the app's threads or
+    database connections; they only import ``bill_text``.
+
+    Returns:
+        ProcessPoolExecutor: The shared pool of ``SCRAPE_PARSE_WORKERS`` processes, or
+        None if ``SCRAPE_PARSE_WORKERS`` is 0.
+    """
+    global _parse_pool
+    if SCRAPE_PARSE_WORKERS <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=SCRAPE_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+# Length of the text preview stored with each bill and sent for summarization.
+TEXT_PREVIEW_LENGTH = 1000
+
+class BillText:
+    """
+    The text of one bill version, as retrieved by ``CongressionalScraper.get_bill_text``.
+
+    Attributes:
+        full_text (str): The full text of the bill; empty if it could not be retrieved.
+        version_type (str): The text version, e.g. "Introduced in House".
+        version_date (str): The date of the text version.
+        source_url (str): The URL the formatted text was downloaded from.
+        html (bytes): The downloaded formatted text, while it awaits parsing into
+            ``full_text``; None once parsed.
+        encoding (str): The charset of ``html``.
+    """
+    def __init__(self, full_text: str = "", version_type: str = None, version_date: str = None,
+                 source_url: str = None, html: bytes = None, encoding: str = None):
+        self.full_text = full_text
+        self.version_type = version_type
+        self.version_date = version_date
+        self.source_url = source_url
+        self.html = html
+        self.encoding = encoding
+
+    def __bool__(self) -> bool:
+        return bool(self.full_text)
+
+    @property
+    def preview(self) -> str:
+        """The first ``TEXT_PREVIEW_LENGTH`` characters of the text, with an ellipsis if cut."""
+        if len(self.full_text) > TEXT_PREVIEW_LENGTH:
+            return self.full_text[:TEXT_PREVIEW_LENGTH] + "..."
+        return self.full_text
+
 #credit to akash for developing this
 class CongressionalScraper:
     """
     A class responsible for scraping congressional bill data from an external API.
 
-    This class handles rate limiting for API requests and provides methods to:
+    Requests go through a ``CongressApiClient``, which pools connections, enforces the
+    rate limit and retries transient failures. The class provides methods to:
       - Fetch detailed bill information from a given URL.
-      - Retrieve a text preview or the full text of a bill.
+      - Retrieve the text of a bill, with its preview and version metadata.
       - Process bill data by checking for existing records in the database and inserting or updating them.
       - Perform batch scraping and daily updates.
 
     Attributes:
         headers (dict): Headers to use for API requests, including the API key.
-        last_request_time (float): Timestamp of the last API request, used for rate limiting.
+        client (CongressApiClient): HTTP client used for every request.
+        changed_bill_ids (set): Ids of bills inserted or updated by this scraper, used to
+            refresh only those bills in the search index.
+        parse_pool (Executor): Pool parsing bill text HTML, or None to parse it on the
+            fetching threads.
     """
-    def __init__(self):
-        """Initialize the CongressionalScraper with API headers and rate limiting parameters."""
+    def __init__(self, client: CongressApiClient = None, parse_pool=None):
+        """
+        Initialize the CongressionalScraper with API headers and its HTTP client.
+
+        Args:
+            client (CongressApiClient, optional): Client to send requests with; defaults
+                to the process-wide ``congress_api_client``.
+            parse_pool (Executor, optional): Pool parsing bill text HTML; defaults to the
+                shared ``scrape_parse_pool()``, if ``SCRAPE_PARSE_WORKERS`` is set.
+        """
         self.headers = {"X-API-Key": CONGRESS_API_KEY}
-        self.last_request_time = 0
+        self.client = congress_api_client if client is None else client
+        self.parse_pool = scrape_parse_pool() if parse_pool is None else parse_pool
+        self.changed_bill_ids = set()
+        # Bills that failed since the last take_failures(), by (congress, type, number).
+        self.failures = {}
+        self._failures_lock = threading.Lock()
+        # Detail URLs of fetched bills not stored yet, by (congress, type, number).
+        self._detail_urls = {}
+
+    def _record_failure(self, key: tuple, bill_data: dict, error) -> None:
+        """Remember that a bill failed; ``bill_data`` may be None if it is filled in later."""
+        with self._failures_lock:
+            self.failures[key] = {"bill_data": bill_data, "error": str(error)}
+        self._forget_bill_details(key)
+
+    def _forget_bill_details(self, key: tuple) -> None:
+        """
+        Drop the stored validators of a bill's details, so its next scrape fetches it in full.
 
-    def _rate_limit(self) -> None:
+        Called when a bill was not stored with its text: a later ``304 Not Modified``
+        for its details would otherwise skip it while its text is still missing.
         """
-        Implement rate limiting to ensure API requests adhere to the allowed rate.
+        url = self._detail_urls.pop(key, None)
+        if url:
+            self.client.validators.discard(url)
 
-        This method calculates the time elapsed since the last request and pauses if needed.
+    def take_failures(self) -> dict:
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        wait_time = 1 / API_RATE_LIMIT
-        if time_since_last_request < wait_time:
-            time.sleep(wait_time - time_since_last_request)
-        self.last_request_time = time.time()
-
-    def get_bill_details(self, url: str) -> dict:
+        Return the bills that failed since the last call, and forget them.
+
+        Returns:
+            dict: Maps ``(congress, bill_type, bill_number)`` to ``{"bill_data", "error"}``.
+        """
+        with self._failures_lock:
+            failures, self.failures = self.failures, {}
+        return failures
+
+    def get_bill_details(self, url: str, conditional: bool = False):
         """
         Fetch detailed bill information from the given URL.
 
         Args:
             url (str): The URL from which to fetch the bill details.
+            conditional (bool): Revalidate the previous response for this URL instead of
+                downloading it again if the bill has not changed.
         Returns:
             dict: A dictionary containing detailed bill information, or an empty dict on failure.
+            ``NOT_MODIFIED`` if ``conditional`` is set and the bill is unchanged.
         """
-        self._rate_limit()
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.client.get(url, headers=self.headers, conditional=conditional)
+            if response is NOT_MODIFIED:
+                return NOT_MODIFIED
             if response.status_code == 200:
                 return response.json().get("bill", {})
             app.logger.error(f"Error fetching bill details: Status {response.status_code}")
@@ -317,22 +901,28 @@ class CongressionalScraper:
             app.logger.error(f"Exception fetching bill details: {e}")
         return {}
 
-    def get_bill_text(self, congress: int, bill_type: str, bill_number: str, full_text: bool = False) -> str:
+    def get_bill_text(self, congress: int, bill_type: str, bill_number: str, parse: bool = True) -> BillText:
         """
-        Fetch the bill text from the external API.
+        Fetch the latest text version of a bill from the external API.
+
+        The text index and the formatted text are downloaded and parsed once; the
+        returned object carries both the full text and its preview. The formatted text
+        is streamed through ``extract_pre_text_from_response``, which stops reading at
+        the end of its ``<pre>`` element and never holds the whole HTML or a parse tree.
 
         Args:
             congress (int): The Congress number.
             bill_type (str): The type of the bill (e.g., 'H.R.', 'S.').
             bill_number (str): The bill number.
-            full_text (bool): If True, return the full text; otherwise, return a preview.
+            parse (bool): Parse the formatted text here. If False, its raw HTML is
+                returned in ``BillText.html`` to be parsed elsewhere, e.g. by
+                ``parse_bill_html`` in a worker process.
         Returns:
-            str: The bill text (either full or a preview), or an empty string on failure.
+            BillText: The bill text with its version metadata; empty on failure.
         """
-        self._rate_limit()
         texts_url = f"{CONGRESS_API_BASE}/bill/{congress}/{bill_type.lower()}/{bill_number}/text"
         try:
-            response = requests.get(texts_url, headers=self.headers)
+            response = self.client.get(texts_url, headers=self.headers)
             if response.status_code == 200:
                 data = response.json()
                 text_versions = data.get("textVersions", [])
@@ -343,53 +933,141 @@ class CongressionalScraper:
                     if htm_format:
                         htm_url = htm_format.get("url")
                         app.logger.info(f"Fetching HTML from: {htm_url}")
-                        self._rate_limit()
-                        htm_response = requests.get(htm_url)
+                        htm_response = self.client.get(htm_url, stream=True)
+                        if htm_response.status_code == 200 and not parse:
+                            try:
+                                html = b"".join(htm_response.iter_content(DEFAULT_CHUNK_SIZE))
+                            finally:
+                                htm_response.close()
+                            return BillText(
+                                version_type=latest_version.get("type"),
+                                version_date=latest_version.get("date"),
+                                source_url=htm_url,
+                                html=html,
+                                encoding=htm_response.encoding,
+                            )
                         if htm_response.status_code == 200:
-                            soup = BeautifulSoup(htm_response.text, 'html.parser')
-                            content = soup.find('pre')
-                            if content:
-                                text = content.get_text(separator=' ', strip=True)
-                                if full_text:
-                                    return text
-                                return text[:1000] + "..." if len(text) > 1000 else text
+                            content = extract_pre_text_from_response(htm_response)
+                            if content is not None:
+                                return BillText(
+                                    full_text=content,
+                                    version_type=latest_version.get("type"),
+                                    version_date=latest_version.get("date"),
+                                    source_url=htm_url,
+                                )
                             else:
                                 app.logger.error("No <pre> tag found in HTML content.")
                         else:
+                            htm_response.close()
                             app.logger.error(f"Failed to fetch HTML content: {htm_response.status_code}")
                     else:
                         app.logger.error("No HTML format found for bill text.")
-                return ""
+                return BillText()
             else:
                 app.logger.error(f"Error fetching bill texts: Status {response.status_code}. Response: {response.text}")
-                return ""
+                return BillText()
         except Exception as e:
             app.logger.error(f"Exception fetching bill text: {e}")
-            return ""
+            return BillText()
 
-    def process_bill(self, bill_data: dict) -> bool:
+    def _existing_bills(self, bills: list) -> dict:
         """
-        Process a single bill by fetching additional details and inserting or updating it in the database.
+        Look up which bills of a listing are already stored, with one query.
+
+        Args:
+            bills (list[dict]): Raw bill data from a bill listing.
+        Returns:
+            dict: Maps ``(congress, bill_type, bill_number)`` of stored bills to whether
+            they already have an AI summary.
+        """
+        keys = {
+            (bill["congress"], bill["type"], bill["number"])
+            for bill in bills if all(field in bill for field in ("congress", "type", "number"))
+        }
+        if not keys:
+            return {}
+        rows = db.session.query(Bill.congress, Bill.bill_type, Bill.bill_number, Bill.ai_summary).filter(
+            tuple_(Bill.congress, Bill.bill_type, Bill.bill_number).in_(keys)
+        )
+        return {(congress, bill_type, bill_number): bool(ai_summary)
+                for congress, bill_type, bill_number, ai_summary in rows}
+
+    def _load_detail_validators(self, bills: list) -> None:
+        """
+        Load the stored validators of a listing's bill details into the client, with one query.
+
+        Validators the client already holds are newer and kept, so a process revalidates
+        the details of every stored bill, not just of those it fetched itself.
+
+        Args:
+            bills (list[dict]): Raw bill data from a bill listing.
+        """
+        urls = {
+            (bill["congress"], bill["type"], bill["number"]): bill["url"]
+            for bill in bills if all(field in bill for field in ("congress", "type", "number", "url"))
+        }
+        if not urls:
+            return
+        rows = db.session.query(
+            Bill.congress, Bill.bill_type, Bill.bill_number, Bill.detail_etag, Bill.detail_last_modified
+        ).filter(
+            tuple_(Bill.congress, Bill.bill_type, Bill.bill_number).in_(urls),
+            or_(Bill.detail_etag.isnot(None), Bill.detail_last_modified.isnot(None)),
+        )
+        for congress, bill_type, bill_number, etag, last_modified in rows:
+            url = urls[(congress, bill_type, bill_number)]
+            if self.client.validators.get(url) is None:
+                self.client.validators.set(url, {"etag": etag, "last_modified": last_modified})
+
+    def prepare_bill(self, bill_data: dict, existing: dict) -> dict:
+        """
+        Fetch the details and text of a bill, without touching the database.
+
+        Safe to call from worker threads. The AI summary is not generated here; storing
+        the bill enqueues a ``SummaryJob`` for it instead.
 
         Args:
             bill_data (dict): Raw bill data obtained from the external source.
+            existing (dict): Stored bills, as returned by ``_existing_bills``.
         Returns:
-            bool: True if a new bill was inserted; False if an existing bill was updated or on error.
+            dict: Column values of the bill for ``store_bills``, or None if the bill is
+            unchanged since it was stored or could not be processed.
+        """
+        row, _ = self.fetch_bill(bill_data, existing)
+        return row
+
+    def fetch_bill(self, bill_data: dict, existing: dict, parse: bool = True) -> tuple:
+        """
+        Fetch the details and text of a bill like ``prepare_bill``, optionally leaving
+        its HTML unparsed.
+
+        Args:
+            bill_data (dict): Raw bill data obtained from the external source.
+            existing (dict): Stored bills, as returned by ``_existing_bills``.
+            parse (bool): Parse the bill text here. If False, the text columns of the row
+                stay empty until the returned text's ``html`` is parsed and
+                ``set_bill_text`` fills them in.
+        Returns:
+            tuple: ``(row, text)``, the column values and the ``BillText`` of the bill,
+            or ``(None, None)`` if the bill is unchanged or could not be processed.
         """
         try:
             congress = bill_data["congress"]
             bill_type = bill_data["type"]
             bill_number = bill_data["number"]
+            key = (congress, bill_type, bill_number)
             app.logger.info(f"Processing bill {bill_type}{bill_number}")
 
-            detailed_bill = self.get_bill_details(bill_data.get("url", ""))
+            detailed_bill = self.get_bill_details(bill_data.get("url", ""), conditional=True)
+            if detailed_bill is NOT_MODIFIED:
+                # Unchanged since it was last fetched; nothing to do if we stored it then.
+                if key in existing:
+                    app.logger.info(f"Bill {bill_type}{bill_number} not modified; skipping")
+                    return None, None
+                detailed_bill = self.get_bill_details(bill_data.get("url", ""))
             if not detailed_bill:
                 detailed_bill = bill_data
-
-            # Check if the bill already exists in the database.
-            existing_bill = Bill.query.filter_by(
-                congress=congress, bill_type=bill_type, bill_number=bill_number
-            ).first()
+            self._detail_urls[key] = bill_data.get("url", "")
 
             action_date = (
                 detailed_bill.get("latestAction", {}).get("actionDate")
@@ -401,146 +1079,1204 @@ class CongressionalScraper:
             except ValueError:
                 latest_action_date = datetime.now(timezone.utc)
 
-            bill_text = self.get_bill_text(congress, bill_type, bill_number)
-            full_text = self.get_bill_text(congress, bill_type, bill_number, full_text=True)
-            ai_summary = None
-            if bill_text:
-                if existing_bill and existing_bill.ai_summary:
-                    ai_summary = existing_bill.ai_summary
-                else:
-                    try:
-                        ai_summary_response = openai.ChatCompletion.create(
-                            model="gpt-4o",
-                            messages=[
-                                {
-                                    "role": "system",
-                                    "content": "You are a professional congressional analyst. Summarize the following bill text concisely and objectively in 6-8 sentences."
-                                },
-                                {"role": "user", "content": bill_text}
-                            ],
-                            max_tokens=300
-                        )
-                        ai_summary = ai_summary_response.choices[0].message.content
-                        app.logger.info(f"Generated AI summary for {bill_type}{bill_number}")
-                    except Exception as e:
-                        app.logger.error(f"Error generating AI summary: {e}")
+            text_result = self.get_bill_text(congress, bill_type, bill_number, parse=parse)
+            if not text_result and text_result.html is None:
+                self._forget_bill_details(key)
+            congress_url = f"https://www.congress.gov/bill/{congress}th-congress/{bill_type.lower()}/{bill_number}"
+            try:
+                update_date = datetime.strptime(bill_data["updateDate"], "%Y-%m-%d")
+            except (KeyError, ValueError):
+                update_date = datetime.now(timezone.utc)
+
+            row = {
+                "congress": congress,
+                "bill_type": bill_type,
+                "bill_number": bill_number,
+                "title": detailed_bill.get("title", bill_data.get("title", "")),
+                "latest_action_date": latest_action_date,
+                "origin_chamber": bill_data.get("originChamber", ""),
+                "sponsor": detailed_bill.get("sponsor", {}).get("name", "Unknown"),
+                "latest_action": detailed_bill.get("latestAction", bill_data.get("latestAction", {})),
+                "update_date": update_date,
+                "url": congress_url,
+                "ai_summary": None,
+                "vote_count": 0,
+                "created_at": datetime.now(timezone.utc),
+            }
+            return self.set_bill_text(row, text_result), text_result
+
+        except Exception as e:
+            app.logger.error(f"Error processing bill: {e}")
+            app.logger.error("Bill data: " + json.dumps(bill_data, indent=2))
+            self._record_failure(
+                (bill_data.get("congress"), bill_data.get("type"), bill_data.get("number")), bill_data, e
+            )
+            return None, None
+
+    @staticmethod
+    def set_bill_text(row: dict, text: BillText) -> dict:
+        """Fill in the text columns of a prepared bill from its text, returning the row."""
+        row["text_preview"] = text.preview
+        row["full_text"] = text.full_text
+        return row
+
+    def _upsert_bills(self, rows: list) -> list:
+        """
+        Write bills with a single ``INSERT ... ON CONFLICT DO UPDATE`` statement.
+
+        New bills are inserted as given. For bills that already exist, the same fields as
+        before are refreshed (title, latest action, update date, text), while an existing
+        AI summary, and an existing full text when none was retrieved, are kept. A kept
+        summary of a changed text stays until ``enqueue_summary_jobs`` replaces it.
+
+        Args:
+            rows (list[dict]): Column values from ``prepare_bill``.
+        Returns:
+            list[int]: Ids of the inserted or updated bills.
+        """
+        bills = Bill.__table__
+        statement = dialect_insert(bills).values(rows)
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[bills.c.congress, bills.c.bill_type, bills.c.bill_number],
+            set_={
+                "title": excluded.title,
+                "latest_action": excluded.latest_action,
+                "update_date": excluded.update_date,
+                "text_preview": excluded.text_preview,
+                "full_text": func.coalesce(func.nullif(excluded.full_text, ""), bills.c.full_text),
+                "ai_summary": func.coalesce(func.nullif(bills.c.ai_summary, ""), excluded.ai_summary),
+                "detail_etag": excluded.detail_etag,
+                "detail_last_modified": excluded.detail_last_modified,
+                "updated_at": datetime.now(timezone.utc),
+            },
+        ).returning(bills.c.id)
+        return [row.id for row in db.session.execute(statement)]
+
+    def store_bills(self, rows: list, existing: dict) -> int:
+        """
+        Insert or update prepared bills in one statement and one commit.
+
+        Summary jobs for bills that have text but no summary of it are enqueued in the same
+        transaction. If the batch fails, it is rolled back and the bills are written one
+        at a time, so a single bad row only loses that bill; it is recorded in ``failures``.
+        Each bill is stored with the validators of its details, which are None for bills
+        stored without their text.
+
+        Args:
+            rows (list[dict]): Column values from ``prepare_bill``.
+            existing (dict): Stored bills, as returned by ``_existing_bills``.
+        Returns:
+            int: The number of new bills inserted.
+        """
+        if not rows:
+            return 0
+        # A listing can repeat a bill; one statement may only touch each row once.
+        rows = list({(row["congress"], row["bill_type"], row["bill_number"]): row for row in rows}.values())
+        for row in rows:
+            url = self._detail_urls.get((row["congress"], row["bill_type"], row["bill_number"]))
+            validators = (self.client.validators.get(url) if url else None) or {}
+            row["detail_etag"], row["detail_last_modified"] = validators.get("etag"), validators.get("last_modified")
+        try:
+            bill_ids = self._upsert_bills(rows)
+            enqueue_summary_jobs(bill_ids)
+            db.session.commit()
+            self.changed_bill_ids.update(bill_ids)
+            stored = rows
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Error storing batch of {len(rows)} bills, retrying one by one: {e}")
+            stored = []
+            for row in rows:
+                try:
+                    bill_ids = self._upsert_bills([row])
+                    enqueue_summary_jobs(bill_ids)
+                    db.session.commit()
+                    self.changed_bill_ids.update(bill_ids)
+                    stored.append(row)
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.error(f"Error storing bill {row['bill_type']}{row['bill_number']}: {e}")
+                    self._record_failure((row["congress"], row["bill_type"], row["bill_number"]), None, e)
+        for row in stored:
+            self._detail_urls.pop((row["congress"], row["bill_type"], row["bill_number"]), None)
+        inserted = [row for row in stored if (row["congress"], row["bill_type"], row["bill_number"]) not in existing]
+        app.logger.info(f"Stored {len(stored)} bills ({len(inserted)} new)")
+        return len(inserted)
+
+    def process_bills(self, bills: list, workers: int = 1, batch_size: int = SCRAPE_WRITE_BATCH) -> int:
+        """
+        Process a list of bills and write them to the database in batches.
+
+        Bills that fail are logged and added to ``failures``. Processing is a pipeline of
+        three stages running at the same time:
+
+        - fetch: bills are downloaded, optionally by several worker threads at once that
+          overlap their network latency while the shared rate limiter keeps the overall
+          request rate within budget;
+        - parse: with a ``parse_pool``, the HTML of the bill texts is parsed there, so
+          CPU-bound parsing runs on all cores instead of contending for the interpreter
+          with the fetching threads; without one, it is parsed while being downloaded;
+        - write: every ``batch_size`` prepared bills are upserted together on the
+          calling thread, the only one using the database session.
+
+        Each stage holds only a bounded number of bills ahead of the next one
+        (``2 * workers`` fetched, ``SCRAPE_PARSE_BACKLOG`` awaiting parsing), so a slow
+        stage holds back the ones before it instead of buffering a whole listing.
+
+        Args:
+            bills (list[dict]): Raw bill data from a bill listing.
+            workers (int): Number of bills fetched concurrently.
+            batch_size (int): Number of bills written per statement.
+        Returns:
+            int: The number of new bills inserted.
+        """
+        existing = self._existing_bills(bills)
+        self._load_detail_validators(bills)
+
+        def fetch(bill):
+            if self.parse_pool is None:
+                return self.prepare_bill(bill, existing), None
+            return self.fetch_bill(bill, existing, parse=False)
+
+        inserted = 0
+        # Threads are only started by submit, so the executor costs nothing when unused.
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(bills)))) as executor:
+            if workers > 1 and len(bills) > 1:
+                submit = lambda bill: executor.submit(fetch, bill)
+            else:
+                submit = lambda bill: completed(fetch, bill)
+            fetched = bounded_map(submit, bills, 2 * workers)
+            parsed = bounded_map(self._submit_parse, self._fetched_bills(fetched), SCRAPE_PARSE_BACKLOG)
+            for rows in batched(self._parsed_rows(parsed), batch_size):
+                inserted += self.store_bills(rows, existing)
+                # A listing can repeat a bill; it is only new in the first batch storing it.
+                for row in rows:
+                    existing.setdefault((row.get("congress"), row.get("bill_type"), row.get("bill_number")), False)
+        # Bills that failed to store are retried from their listing entry.
+        listing = {(bill.get("congress"), bill.get("type"), bill.get("number")): bill for bill in bills}
+        with self._failures_lock:
+            for key, failure in self.failures.items():
+                if failure["bill_data"] is None:
+                    failure["bill_data"] = listing.get(key)
+        return inserted
+
+    def _fetched_bills(self, fetched):
+        """Yield the ``(row, text)`` of the bills fetched successfully, in listing order."""
+        for bill, future in fetched:
+            row, text = future.result()
+            if row is not None:
+                yield row, text
+
+    def _submit_parse(self, fetched: tuple):
+        """Start parsing the HTML of a fetched bill in the ``parse_pool``, if it has any."""
+        row, text = fetched
+        if text is None or text.html is None:
+            return completed(lambda: None)
+        return self.parse_pool.submit(parse_bill_html, text.html, text.encoding)
+
+    def _parsed_rows(self, parsed):
+        """Yield the rows of parsed bills with their text filled in; parse errors are recorded as failures."""
+        for (row, text), future in parsed:
+            if text is None or text.html is None:
+                yield row
+                continue
+            key = (row["congress"], row["bill_type"], row["bill_number"])
+            try:
+                content = future.result()
+            except Exception as e:
+                app.logger.error(f"Error parsing text of bill {row['bill_type']}{row['bill_number']}: {e}")
+                self._record_failure(key, None, e)
+                continue
+            if content is None:
+                app.logger.error("No <pre> tag found in HTML content.")
+                self._forget_bill_details(key)
+            text.full_text, text.html = content or "", None
+            yield self.set_bill_text(row, text)
+
+    def process_bill(self, bill_data: dict) -> bool:
+        """
+        Process a single bill by fetching additional details and inserting or updating it in the database.
+
+        Args:
+            bill_data (dict): Raw bill data obtained from the external source.
+        Returns:
+            bool: True if a new bill was inserted; False if an existing bill was updated or on error.
+        """
+        return self.process_bills([bill_data]) == 1
+
+    def batch_scrape(self, congress: int, offset: int = 0, limit: int = 20, workers: int = 1) -> tuple:
+        """
+        Perform batch scraping of bills from the external API.
+
+        Args:
+            congress (int): The Congress number to scrape.
+            offset (int, optional): Pagination offset; defaults to 0.
+            limit (int, optional): Number of bills to process in one batch; defaults to 20.
+            workers (int, optional): Number of bills processed concurrently; defaults to 1.
+        Returns:
+            tuple: A tuple containing:
+                - processed_count (int): Number of new bills processed.
+                - batch_count (int): Number of bills fetched in the current batch.
+                - total_count (int): Total available count of bills from the API.
+        """
+        try:
+            bills, total_count = self.fetch_bill_page(congress, offset, limit)
+            processed_count = self.process_bills(bills, workers)
+            return processed_count, len(bills), total_count
+        except Exception as e:
+            app.logger.error(f"Exception in batch scrape: {e}")
+            return 0, 0, 0
+
+    def fetch_bill_page(self, congress: int, offset: int, limit: int, changed_from: datetime = None,
+                        changed_to: datetime = None) -> tuple:
+        """
+        Fetch one page of the bill listing of a Congress.
+
+        Args:
+            congress (int): The Congress number.
+            offset (int): Pagination offset.
+            limit (int): Page size; the API allows at most 250.
+            changed_from (datetime, optional): Only list bills updated at or after this time.
+            changed_to (datetime, optional): Only list bills updated before this time. A
+                fixed end keeps bills updated meanwhile from entering the listing.
+            Bills are listed by update time, oldest first, when either bound is given.
+        Returns:
+            tuple: ``(bills, total_count)``, the raw bill entries of the page and the
+            number of bills in the whole listing.
+        Raises:
+            RuntimeError: If the listing could not be fetched, so that callers can tell
+            a failed page from the end of the listing.
+        """
+        url = f"{CONGRESS_API_BASE}/bill/{congress}"
+        params = {
+            "offset": offset,
+            "limit": limit,
+            "format": "json"
+        }
+        if changed_from is not None:
+            params["fromDateTime"] = changed_from.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if changed_to is not None:
+            params["toDateTime"] = changed_to.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if changed_from is not None or changed_to is not None:
+            params["sort"] = "updateDate asc"
+        response = self.client.get(url, headers=self.headers, params=params)
+        if response.status_code != 200:
+            raise RuntimeError(f"Bill listing of Congress {congress} returned status {response.status_code}")
+        data = response.json()
+        return data.get("bills", []), data.get("pagination", {}).get("count", 0)
+
+    def daily_update(self, workers: int = 1) -> int:
+        """
+        Perform an update of new and modified bills from the external API.
+
+        Every bill changed since the last update is processed, however many there
+        are; after downtime the missed period is caught up. See ``sync_changed_bills``.
+
+        Args:
+            workers (int, optional): Number of bills processed concurrently; defaults to 1.
+        Returns:
+            int: The number of new bills processed during the update.
+        """
+        try:
+            return sync_changed_bills(self, workers=workers)["inserted"]
+        except Exception as e:
+            app.logger.error(f"Exception in daily update: {e}")
+            return 0
+
+# ------------------------------------------------------------------------------
+# Backfill
+# ------------------------------------------------------------------------------
+# API requests per scraped bill: its details, its text index and its formatted text.
+REQUESTS_PER_BILL = 3
+# Seconds of rate budget each backfill page is sized to; one page is one checkpoint.
+BACKFILL_PAGE_SECONDS = float(os.getenv("BACKFILL_PAGE_SECONDS", "60"))
+# Largest page the bill listing returns.
+MAX_PAGE_SIZE = 250
+# Failed bills are retried until they failed this many times.
+BACKFILL_MAX_ATTEMPTS = int(os.getenv("BACKFILL_MAX_ATTEMPTS", "5"))
+
+def backfill_page_size(rate: float = API_RATE_LIMIT, seconds: float = BACKFILL_PAGE_SECONDS) -> int:
+    """
+    Choose how many bills to process per page so that a page takes about ``seconds``.
+
+    Args:
+        rate (float): Sustained API requests per second.
+        seconds (float): Target duration of a page.
+    Returns:
+        int: The page size, between 1 and ``MAX_PAGE_SIZE``.
+    """
+    return max(1, min(MAX_PAGE_SIZE, int(rate * seconds / REQUESTS_PER_BILL)))
+
+def backfill_checkpoint(congress: int) -> ScrapeTracking:
+    """
+    Return the checkpoint of a Congress' backfill.
+
+    A new checkpoint starts at offset 0 of a snapshot of the listing ending now.
+    Checkpoints from before snapshots were kept are started over, since their offset
+    points into a listing ordered differently.
+    """
+    tracking = ScrapeTracking.query.filter_by(type=f"backfill:{congress}").first()
+    if tracking is None:
+        tracking = ScrapeTracking(type=f"backfill:{congress}")
+        db.session.add(tracking)
+    if tracking.high_water_mark is None:
+        tracking.offset, tracking.listing_count = 0, None
+        tracking.high_water_mark = datetime.now(timezone.utc)
+        db.session.commit()
+    return tracking
+
+def _bill_keys(bills: list) -> list:
+    """Return the ``(congress, bill_type, bill_number)`` keys of raw bill entries."""
+    return [(bill.get("congress"), bill.get("type"), bill.get("number")) for bill in bills]
+
+def record_scrape_failures(failures: dict, processed) -> None:
+    """
+    Bring the failure records up to date after processing some bills. The caller commits.
+
+    Args:
+        failures (dict): Failed bills, as returned by ``CongressionalScraper.take_failures``.
+        processed (Iterable[tuple]): Keys of the bills that were processed; earlier
+            failures of those that did not fail this time are cleared.
+    """
+    key_columns = tuple_(ScrapeFailure.congress, ScrapeFailure.bill_type, ScrapeFailure.bill_number)
+    succeeded = set(processed) - set(failures)
+    if succeeded:
+        ScrapeFailure.query.filter(key_columns.in_(succeeded)).delete(synchronize_session=False)
+    failures = {key: failure for key, failure in failures.items() if None not in key and failure["bill_data"]}
+    if not failures:
+        return
+    known = {
+        (record.congress, record.bill_type, record.bill_number): record
+        for record in ScrapeFailure.query.filter(key_columns.in_(failures))
+    }
+    now = datetime.now(timezone.utc)
+    for key, failure in failures.items():
+        record = known.get(key)
+        if record is None:
+            congress, bill_type, bill_number = key
+            db.session.add(ScrapeFailure(
+                congress=congress, bill_type=bill_type, bill_number=bill_number,
+                bill_data=failure["bill_data"], error=failure["error"], created_at=now, updated_at=now,
+            ))
+        else:
+            record.bill_data, record.error, record.updated_at = failure["bill_data"], failure["error"], now
+            record.attempts += 1
+
+def backfill_congress(scraper: CongressionalScraper, congress: int, limit: int, workers: int = 1,
+                      max_pages: int = None) -> dict:
+    """
+    Scrape the bill listing of a Congress from its checkpoint, one page at a time.
+
+    The listing is paged oldest update first up to the snapshot time stored in the
+    checkpoint, so bills updated during the backfill cannot shift it; they are left to
+    ``sync_changed_bills``. Such a bill leaves the snapshot, though, shifting the bills
+    after it back by one, so when the listing shrank the backfill steps back as many
+    bills. After each page the bills, their failure records and the advanced
+    checkpoint are committed, and the search indexes are updated, so an interrupted
+    backfill resumes with the first page it had not finished. Processing a bill twice
+    is harmless, since bills are upserted.
+
+    Args:
+        scraper (CongressionalScraper): The scraper to use.
+        congress (int): The Congress number.
+        limit (int): Bills per page.
+        workers (int): Number of bills processed concurrently.
+        max_pages (int, optional): Stop after this many pages; all pages when omitted.
+    Returns:
+        dict: ``pages``, ``bills``, ``inserted`` and ``failed`` counts, and ``complete``
+        (whether the end of the listing was reached).
+    Raises:
+        RuntimeError: If a page of the listing could not be fetched; the checkpoint
+            stays at that page.
+    """
+    tracking = backfill_checkpoint(congress)
+    snapshot = tracking.high_water_mark
+    if snapshot.tzinfo is None:
+        snapshot = snapshot.replace(tzinfo=timezone.utc)
+    result = {"pages": 0, "bills": 0, "inserted": 0, "failed": 0, "complete": False}
+    while max_pages is None or result["pages"] < max_pages:
+        bills, total = scraper.fetch_bill_page(congress, tracking.offset, limit, changed_to=snapshot)
+        if tracking.listing_count is not None and total < tracking.listing_count:
+            tracking.offset = max(tracking.offset - (tracking.listing_count - total), 0)
+            tracking.listing_count = total
+            db.session.commit()
+            continue
+        if not bills:
+            result["complete"] = True
+            break
+        result["inserted"] += scraper.process_bills(bills, workers)
+        failures = scraper.take_failures()
+        record_scrape_failures(failures, _bill_keys(bills))
+        tracking.offset += len(bills)
+        tracking.listing_count = total
+        db.session.commit()
+        build_bill_search_entries(scraper.changed_bill_ids)
+        scraper.changed_bill_ids.clear()
+        result["pages"] += 1
+        result["bills"] += len(bills)
+        result["failed"] += len(failures)
+        app.logger.info(f"Backfill of Congress {congress}: {tracking.offset} of {total} bills, "
+                        f"{len(failures)} failed on this page")
+        if tracking.offset >= total:
+            result["complete"] = True
+            break
+    return result
+
+def retry_scrape_failures(scraper: CongressionalScraper, limit: int, workers: int = 1) -> dict:
+    """
+    Process the recorded failed bills again, ``limit`` at a time.
+
+    Bills that fail again have their attempt count increased; bills that failed
+    ``BACKFILL_MAX_ATTEMPTS`` times are no longer retried but stay recorded.
+
+    Args:
+        scraper (CongressionalScraper): The scraper to use.
+        limit (int): Bills per batch.
+        workers (int): Number of bills processed concurrently.
+    Returns:
+        dict: ``retried`` and ``failed`` counts.
+    """
+    result = {"retried": 0, "failed": 0}
+    last_id = 0
+    while True:
+        records = (ScrapeFailure.query
+                   .filter(ScrapeFailure.attempts < BACKFILL_MAX_ATTEMPTS, ScrapeFailure.id > last_id)
+                   .order_by(ScrapeFailure.id).limit(limit).all())
+        if not records:
+            break
+        last_id = records[-1].id
+        bills = [record.bill_data for record in records]
+        scraper.process_bills(bills, workers)
+        failures = scraper.take_failures()
+        record_scrape_failures(failures, _bill_keys(bills))
+        db.session.commit()
+        build_bill_search_entries(scraper.changed_bill_ids)
+        scraper.changed_bill_ids.clear()
+        result["retried"] += len(bills)
+        result["failed"] += len(failures)
+    return result
+
+# ------------------------------------------------------------------------------
+# Incremental Sync
+# ------------------------------------------------------------------------------
+# Changes are synced in windows of at most this length; the high-water mark advances
+# after each window, so a long catch-up keeps its progress if it is interrupted.
+SYNC_WINDOW = timedelta(hours=float(os.getenv("SYNC_WINDOW_HOURS", "24")))
+# How often the scheduler syncs changed bills.
+SYNC_INTERVAL_MINUTES = float(os.getenv("SYNC_INTERVAL_MINUTES", "60"))
+# Bills per page of the changed-bill listing.
+SYNC_PAGE_SIZE = MAX_PAGE_SIZE
+
+def congress_for(date: datetime) -> int:
+    """Return the number of the Congress in session at ``date``; each one starts on January 3 of an odd year."""
+    year = date.year
+    if year % 2 and (date.month, date.day) < (1, 3):
+        year -= 1
+    return (year - 1789) // 2 + 1
+
+def current_congress() -> int:
+    """Return the number of the Congress currently in session."""
+    return congress_for(datetime.now(timezone.utc))
+
+def migrate_scrape_tracking() -> bool:
+    """
+    Add the high-water mark and listing count columns to an existing scrape_tracking table.
+
+    Returns:
+        bool: True if a column was added, False if both already existed.
+    """
+    columns = {column["name"] for column in inspect(db.engine).get_columns(ScrapeTracking.__tablename__)}
+    missing = [column for column in (ScrapeTracking.high_water_mark, ScrapeTracking.listing_count)
+               if column.name not in columns]
+    for column in missing:
+        column_type = column.type.compile(dialect=db.engine.dialect)
+        db.session.execute(text(f"ALTER TABLE scrape_tracking ADD COLUMN {column.name} {column_type}"))
+    db.session.commit()
+    return bool(missing)
+
+def migrate_detail_validators() -> bool:
+    """
+    Add the detail validator columns to an existing bills table.
+
+    Returns:
+        bool: True if the columns were added, False if they already existed.
+    """
+    columns = {column["name"] for column in inspect(db.engine).get_columns(Bill.__tablename__)}
+    missing = [column for column in (Bill.detail_etag, Bill.detail_last_modified) if column.name not in columns]
+    for column in missing:
+        column_type = column.type.compile(dialect=db.engine.dialect)
+        db.session.execute(text(f"ALTER TABLE bills ADD COLUMN {column.name} {column_type}"))
+    db.session.commit()
+    return bool(missing)
+
+def sync_changed_bills(scraper: CongressionalScraper, workers: int = 1, page_size: int = SYNC_PAGE_SIZE,
+                       now: datetime = None) -> dict:
+    """
+    Process every bill changed since the persisted high-water mark.
+
+    The period from the mark to now is split into windows of ``SYNC_WINDOW``. For each
+    window, the changed-bill listing of every Congress in session during it is paged
+    through in full, each page is processed concurrently and committed with its
+    failure records, and the mark is then advanced to the end of the window. Without
+    a mark, the sync starts one window ago.
+
+    Args:
+        scraper (CongressionalScraper): The scraper to use.
+        workers (int): Number of bills processed concurrently.
+        page_size (int): Bills per listing page.
+        now (datetime, optional): End of the sync; defaults to the current time.
+    Returns:
+        dict: ``windows``, ``pages``, ``bills``, ``inserted`` and ``failed`` counts.
+    Raises:
+        RuntimeError: If a listing page could not be fetched; the mark stays at the
+            start of that window, so the next sync retries it.
+    """
+    now = datetime.now(timezone.utc) if now is None else now
+    tracking = ScrapeTracking.query.filter_by(type="sync").first()
+    if tracking is None:
+        tracking = ScrapeTracking(type="sync", offset=0)
+        db.session.add(tracking)
+    mark = tracking.high_water_mark
+    if mark is None:
+        mark = now - SYNC_WINDOW
+    elif mark.tzinfo is None:
+        mark = mark.replace(tzinfo=timezone.utc)
+
+    result = {"windows": 0, "pages": 0, "bills": 0, "inserted": 0, "failed": 0}
+    while mark < now:
+        end = min(mark + SYNC_WINDOW, now)
+        for congress in range(congress_for(mark), congress_for(end) + 1):
+            offset = 0
+            while True:
+                bills, total = scraper.fetch_bill_page(congress, offset, page_size, mark, end)
+                if not bills:
+                    break
+                result["inserted"] += scraper.process_bills(bills, workers)
+                failures = scraper.take_failures()
+                record_scrape_failures(failures, _bill_keys(bills))
+                db.session.commit()
+                build_bill_search_entries(scraper.changed_bill_ids)
+                scraper.changed_bill_ids.clear()
+                result["pages"] += 1
+                result["bills"] += len(bills)
+                result["failed"] += len(failures)
+                offset += len(bills)
+                if offset >= total:
+                    break
+        tracking.high_water_mark = end
+        db.session.commit()
+        result["windows"] += 1
+        mark = end
+    app.logger.info(f"Synced {result['bills']} changed bills in {result['windows']} windows "
+                    f"({result['inserted']} new, {result['failed']} failed)")
+    return result
+
+# ------------------------------------------------------------------------------
+# AI Summary Jobs
+# ------------------------------------------------------------------------------
+# Model used for new summaries.
+SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", DEFAULT_MODEL)
+# Summaries requested from the model concurrently.
+SUMMARY_WORKERS = int(os.getenv("SUMMARY_WORKERS", "4"))
+# Jobs claimed per round; each round commits its results together.
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "20"))
+# Attempts before a job is marked failed.
+SUMMARY_MAX_ATTEMPTS = int(os.getenv("SUMMARY_MAX_ATTEMPTS", "5"))
+# Delay before the first retry in seconds; it doubles with every further attempt.
+SUMMARY_RETRY_BACKOFF = float(os.getenv("SUMMARY_RETRY_BACKOFF", "60"))
+SUMMARY_MAX_BACKOFF = 3600
+# Seconds after which a running job whose worker died is claimed again.
+SUMMARY_JOB_LEASE = float(os.getenv("SUMMARY_JOB_LEASE", "600"))
+# Longer bills are summarized in chunks of this many estimated tokens, with up to
+# SUMMARY_CHUNK_WORKERS chunks of each bill in flight (per summary worker).
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", DEFAULT_CHUNK_TOKENS))
+SUMMARY_CHUNK_WORKERS = int(os.getenv("SUMMARY_CHUNK_WORKERS", DEFAULT_CHUNK_WORKERS))
+
+summary_client = OpenAISummaryClient(SUMMARY_MODEL)
+
+# The text summarized for a bill: its full text, or the preview when none was retrieved.
+SUMMARY_SOURCE_TEXT = func.coalesce(func.nullif(Bill.full_text, ""), Bill.text_preview)
+
+def cached_summaries(keys) -> dict:
+    """
+    Look up summaries in the summary cache.
+
+    Args:
+        keys (Iterable[str]): ``summary_cache_key`` values.
+    Returns:
+        dict: Maps the keys found in the cache to their summaries.
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+    return dict(db.session.query(SummaryCacheEntry.content_hash, SummaryCacheEntry.summary)
+                .filter(SummaryCacheEntry.content_hash.in_(keys)))
+
+def cache_summaries(summaries: dict, model: str, prompt_version: str = PROMPT_VERSION) -> None:
+    """
+    Add summaries to the summary cache; entries that already exist are kept.
+
+    Args:
+        summaries (dict): Maps ``summary_cache_key`` values to summaries.
+        model (str): The model that produced the summaries.
+        prompt_version (str): Version of the prompt they answer.
+    """
+    if not summaries:
+        return
+    entries = SummaryCacheEntry.__table__
+    db.session.execute(dialect_insert(entries).values([
+        {"content_hash": key, "model": model, "prompt_version": prompt_version,
+         "summary": summary, "created_at": datetime.now(timezone.utc)}
+        for key, summary in summaries.items()
+    ]).on_conflict_do_nothing(index_elements=[entries.c.content_hash]))
+
+def enqueue_summary_jobs(bill_ids) -> int:
+    """
+    Queue summary jobs for the given bills that have text but no AI summary of it yet.
+
+    A bill needs a summary when it has none, or when its text changed since its summary
+    was generated, i.e. ``Bill.summary_hash`` differs from the key of the current text.
+    Summaries without a ``summary_hash``, e.g. written by hand, are kept. Bills whose
+    text was summarized before by the current model and prompt get the
+    cached summary right away instead of a job. Bills that already have a pending or
+    running job are left alone; finished or failed jobs are reset so the bill is
+    summarized again. The caller commits.
+
+    Args:
+        bill_ids (Iterable[int]): Bills that were inserted or updated.
+    Returns:
+        int: The number of jobs queued.
+    """
+    bill_ids = list(bill_ids)
+    if not bill_ids:
+        return 0
+    keys = {}
+    for bill_id, source_text, summary_hash in db.session.query(Bill.id, SUMMARY_SOURCE_TEXT, Bill.summary_hash).filter(
+        Bill.id.in_(bill_ids),
+        Bill.text_preview.isnot(None), Bill.text_preview != "",
+        or_(Bill.ai_summary.is_(None), Bill.ai_summary == "", Bill.summary_hash.isnot(None)),
+    ):
+        key = summary_cache_key(source_text, summary_client.model)
+        if key != summary_hash:
+            keys[bill_id] = key
+    cached = cached_summaries(keys.values())
+    if cached:
+        db.session.execute(update(Bill), [
+            {"id": bill_id, "ai_summary": cached[key], "summary_hash": key}
+            for bill_id, key in keys.items() if key in cached
+        ])
+    unsummarized = [bill_id for bill_id, key in keys.items() if key not in cached]
+    if not unsummarized:
+        return 0
+    jobs = {job.bill_id: job for job in SummaryJob.query.filter(SummaryJob.bill_id.in_(unsummarized))}
+    now = datetime.now(timezone.utc)
+    queued = 0
+    for bill_id in unsummarized:
+        job = jobs.get(bill_id)
+        if job is None:
+            db.session.add(SummaryJob(bill_id=bill_id, next_attempt_at=now))
+        elif job.status in ("done", "failed"):
+            job.status, job.attempts, job.next_attempt_at, job.updated_at = "pending", 0, now, now
+        else:
+            continue
+        queued += 1
+    return queued
+
+def migrate_summary_hashes(batch_size: int = 500) -> int:
+    """
+    Add ``summary_hash`` to an existing bills table and fill it in for stored summaries.
+
+    Summaries generated before the column existed are assumed to match the bill's
+    current text, so they are only regenerated once the text changes.
+
+    Args:
+        batch_size (int): Bills updated per statement.
+    Returns:
+        int: The number of summaries given a hash.
+    """
+    columns = {column["name"] for column in inspect(db.engine).get_columns(Bill.__tablename__)}
+    if "summary_hash" in columns:
+        return 0
+    column_type = Bill.summary_hash.type.compile(dialect=db.engine.dialect)
+    # Added and filled in one transaction, so an interrupted run starts over.
+    db.session.execute(text(f"ALTER TABLE bills ADD COLUMN summary_hash {column_type}"))
+    migrated = 0
+    last_id = 0
+    while True:
+        rows = db.session.query(Bill.id, SUMMARY_SOURCE_TEXT).filter(
+            Bill.id > last_id,
+            Bill.text_preview.isnot(None), Bill.text_preview != "",
+            Bill.ai_summary.isnot(None), Bill.ai_summary != "",
+        ).order_by(Bill.id).limit(batch_size).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        db.session.execute(update(Bill), [
+            {"id": bill_id, "summary_hash": summary_cache_key(source_text, summary_client.model)}
+            for bill_id, source_text in rows
+        ])
+        migrated += len(rows)
+    db.session.commit()
+    return migrated
+
+def due_summary_jobs(now: datetime):
+    """Return the query of the jobs due at ``now``, oldest first: pending ones and running ones past their lease."""
+    return SummaryJob.query.filter(or_(
+        and_(SummaryJob.status == "pending", SummaryJob.next_attempt_at <= now),
+        and_(SummaryJob.status == "running", SummaryJob.updated_at < now - timedelta(seconds=SUMMARY_JOB_LEASE)),
+    )).order_by(SummaryJob.next_attempt_at, SummaryJob.id)
+
+def claim_summary_jobs(limit: int) -> list:
+    """
+    Claim due summary jobs by marking them running, and commit the claim.
+
+    On PostgreSQL, rows locked by another worker are skipped, so several workers can
+    drain the queue at once. Running jobs past their lease are claimed again.
+
+    Args:
+        limit (int): Most jobs to claim.
+    Returns:
+        list[SummaryJob]: The claimed jobs.
+    """
+    now = datetime.now(timezone.utc)
+    jobs = due_summary_jobs(now).limit(limit).with_for_update(skip_locked=True).all()
+    for job in jobs:
+        job.status = "running"
+        job.attempts += 1
+        job.updated_at = now
+    db.session.commit()
+    return jobs
+
+def summary_retry_delay(attempts: int) -> float:
+    """Seconds to wait before retrying a job that failed its ``attempts``-th attempt."""
+    return min(SUMMARY_RETRY_BACKOFF * 2 ** (attempts - 1), SUMMARY_MAX_BACKOFF)
+
+def run_summary_jobs(client=None, workers: int = SUMMARY_WORKERS, limit: int = None,
+                     batch_size: int = SUMMARY_BATCH_SIZE) -> dict:
+    """
+    Drain the summary job queue.
+
+    Jobs are claimed in batches. Each bill is summarized from its full text, in chunks
+    of ``SUMMARY_CHUNK_TOKENS`` when it is long (see ``ChunkedSummarizer``). Texts and
+    chunks found in the summary cache are not sent to the model again; the others are
+    summarized by up to ``workers`` threads at once, which only talk to the model, and
+    the results are cached, written and committed together. Failed jobs are retried with exponential backoff
+    until ``SUMMARY_MAX_ATTEMPTS`` is reached. Jobs scheduled for a later retry are
+    left for a later run.
+
+    Args:
+        client (SummaryClient, optional): Produces the summaries; defaults to ``summary_client``.
+        workers (int): Number of summaries requested concurrently.
+        limit (int, optional): Most jobs to process; all due jobs when omitted.
+        batch_size (int): Jobs claimed per round.
+    Returns:
+        dict: ``summarized`` (ids of the bills that got a summary), ``cached`` (how many
+        of those summaries came from the cache), ``retrying`` and ``failed`` (numbers of jobs).
+    """
+    client = summary_client if client is None else client
+    summarizer = ChunkedSummarizer(client, SUMMARY_CHUNK_TOKENS, SUMMARY_CHUNK_WORKERS)
+    result = {"summarized": [], "cached": 0, "retrying": 0, "failed": 0}
+    processed = 0
+    while limit is None or processed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - processed)
+        jobs = claim_summary_jobs(size)
+        if not jobs:
+            break
+        processed += len(jobs)
+        texts = dict(db.session.query(Bill.id, SUMMARY_SOURCE_TEXT).filter(
+            Bill.id.in_([job.bill_id for job in jobs])
+        ))
+        keys = {bill_id: summary_cache_key(source_text, client.model)
+                for bill_id, source_text in texts.items() if source_text}
+        summaries = cached_summaries(keys.values())
+        # Each text missing from the cache goes to the model once, however many bills share it.
+        uncached = {key: texts[bill_id] for bill_id, key in keys.items() if key not in summaries}
+        # Chunk summaries of long bills are loaded up front, so the threads never query.
+        summarizer.cache.update(cached_summaries(
+            key for text in uncached.values() for key in summarizer.chunk_keys(text)
+        ))
+
+        def summarize(text):
+            try:
+                return summarizer.summarize(text), None
+            except Exception as e:
+                return None, e
+
+        outcomes = {}
+        if uncached:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(uncached)))) as executor:
+                outcomes = dict(zip(uncached, executor.map(summarize, uncached.values())))
+        generated = {key: summary for key, (summary, _) in outcomes.items() if summary}
+        cache_summaries(generated, client.model)
+        # Chunks of failed bills are kept too, so their retries only redo what failed.
+        cache_summaries(summarizer.take_generated(), client.model, CHUNK_PROMPT_VERSION)
+
+        now = datetime.now(timezone.utc)
+        for job in jobs:
+            job.updated_at = now
+            key = keys.get(job.bill_id)
+            if key is None:
+                # The bill was deleted or lost its text; there is nothing to summarize.
+                job.status, job.last_error = "done", "no text to summarize"
+                continue
+            summary = summaries.get(key) or generated.get(key)
+            if summary:
+                # A summary written meanwhile (e.g. by hand) is not overwritten; one
+                # generated from an older text is.
+                Bill.query.filter(
+                    Bill.id == job.bill_id,
+                    or_(Bill.ai_summary.is_(None), Bill.ai_summary == "",
+                        and_(Bill.summary_hash.isnot(None), Bill.summary_hash != key)),
+                ).update({"ai_summary": summary, "summary_hash": key}, synchronize_session=False)
+                job.status, job.last_error = "done", None
+                result["summarized"].append(job.bill_id)
+                if key in summaries:
+                    result["cached"] += 1
+                continue
+            error = outcomes[key][1]
+            job.last_error = str(error) if error else "empty summary"
+            app.logger.error(f"Error generating AI summary for bill {job.bill_id} "
+                             f"(attempt {job.attempts}): {job.last_error}")
+            if job.attempts >= SUMMARY_MAX_ATTEMPTS:
+                job.status = "failed"
+                result["failed"] += 1
+            else:
+                job.status = "pending"
+                job.next_attempt_at = now + timedelta(seconds=summary_retry_delay(job.attempts))
+                result["retrying"] += 1
+        db.session.commit()
+    app.logger.info(f"Summary jobs: {len(result['summarized'])} summarized "
+                    f"({result['cached']} from cache), "
+                    f"{result['retrying']} to retry, {result['failed']} failed")
+    return result
+
+def preview_summary_jobs(client, workers: int = SUMMARY_WORKERS, limit: int = None) -> dict:
+    """
+    Summarize the bills of the due summary jobs without writing anything.
+
+    A dry run of ``run_summary_jobs``, e.g. with ``StubSummaryClient``: no job is
+    claimed and no summary is cached or stored, so the output of a stand-in model never
+    reaches ``Bill.ai_summary``, where its hash would mark every bill as stale for the
+    real model.
+
+    Args:
+        client (SummaryClient): Produces the summaries.
+        workers (int): Number of summaries generated concurrently.
+        limit (int, optional): Most jobs to look at; all due jobs when omitted.
+    Returns:
+        dict: ``summarized`` (ids of the bills a summary was generated for) and
+        ``failed`` (the number of bills whose summary failed).
+    """
+    jobs = due_summary_jobs(datetime.now(timezone.utc))
+    if limit is not None:
+        jobs = jobs.limit(limit)
+    bill_ids = [job.bill_id for job in jobs]
+    texts = {bill_id: source_text for bill_id, source_text in db.session.query(Bill.id, SUMMARY_SOURCE_TEXT)
+             .filter(Bill.id.in_(bill_ids)) if source_text}
+    summarizer = ChunkedSummarizer(client, SUMMARY_CHUNK_TOKENS, SUMMARY_CHUNK_WORKERS)
+
+    def summarize(text):
+        try:
+            return bool(summarizer.summarize(text))
+        except Exception as e:
+            app.logger.error(f"Error generating AI summary in a dry run: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(texts)))) as executor:
+        outcomes = dict(zip(texts, executor.map(summarize, texts.values())))
+    db.session.rollback()
+    return {"summarized": [bill_id for bill_id, ok in outcomes.items() if ok],
+            "failed": sum(not ok for ok in outcomes.values())}
+
+# ------------------------------------------------------------------------------
+# Vote Counters
+# ------------------------------------------------------------------------------
+# Buckets of each demographic dimension; answers outside them are counted as "other".
+DEMOGRAPHIC_BUCKETS = {dimension: tuple(buckets) for dimension, buckets in default_demographics()["upvote"].items()}
+
+def vote_buckets(user: User) -> dict:
+    """
+    Place a voter in one bucket of each demographic dimension.
+
+    Args:
+        user (User): The voter; their age must be set.
+    Returns:
+        dict: Maps each dimension of ``DEMOGRAPHIC_BUCKETS`` to the voter's bucket.
+    """
+    if user.age < 18:
+        age = "under_18"
+    elif user.age < 30:
+        age = "18_to_30"
+    elif user.age < 60:
+        age = "30_to_60"
+    else:
+        age = "60_plus"
+    answers = {
+        "age_distribution": age,
+        "gender_distribution": user.gender,
+        "ethnicity_distribution": user.ethnicity,
+        "state_distribution": user.state,
+        "political_affiliation_distribution": user.political_affiliation,
+    }
+    buckets = {}
+    for dimension, valid in DEMOGRAPHIC_BUCKETS.items():
+        answer = (answers[dimension] or "other").lower()
+        buckets[dimension] = answer if answer in valid else "other"
+    return buckets
+
+# Times a vote is re-read and retried after a concurrent request changed it first.
+VOTE_ATTEMPTS = 3
+# Users whose legacy voted_bills are moved to user_votes per transaction.
+USER_VOTE_MIGRATION_BATCH = int(os.getenv("USER_VOTE_MIGRATION_BATCH", 500))
+
+def _incremented(column, delta: int):
+    """SQL expression adding ``delta`` to ``column`` in the database, never going below zero."""
+    return case((column + delta < 0, 0), else_=column + delta)
+
+def change_user_vote(user_id: int, bill_id: int, previous: str, status: str) -> bool:
+    """
+    Change a user's vote on a bill, only if it is still ``previous``.
+
+    Casting inserts the vote unless one exists, changing and removing it are guarded by
+    the previous status; each is one statement, so of two concurrent requests only one
+    can make a given change. The caller commits.
+
+    Args:
+        user_id (int): The voter.
+        bill_id (int): The bill voted on.
+        previous (str): The vote the caller read: "upvote", "downvote" or None.
+        status (str): The new vote: "upvote", "downvote" or None to remove it.
+    Returns:
+        bool: Whether the vote was changed; False if it no longer was ``previous``.
+    """
+    votes = UserVote.__table__
+    now = datetime.now(timezone.utc)
+    if previous is None:
+        statement = dialect_insert(votes).values(
+            user_id=user_id, bill_id=bill_id, status=status, created_at=now, updated_at=now
+        ).on_conflict_do_nothing(index_elements=[votes.c.user_id, votes.c.bill_id])
+    else:
+        current = and_(votes.c.user_id == user_id, votes.c.bill_id == bill_id, votes.c.status == previous)
+        if status is None:
+            statement = delete(votes).where(current)
+        else:
+            statement = update(votes).where(current).values(status=status, updated_at=now)
+    return db.session.execute(statement).rowcount == 1
+
+def change_bill_vote_counts(bill_id: int, previous: str, status: str) -> None:
+    """
+    Move a vote between the counters of a bill with one ``UPDATE ... SET count = count + 1``.
+
+    Args:
+        bill_id (int): The bill voted on.
+        previous (str): The vote before: "upvote", "downvote" or None.
+        status (str): The vote after: "upvote", "downvote" or None.
+    """
+    bills = Bill.__table__
+    columns = {"upvote": bills.c.upvote_count, "downvote": bills.c.downvote_count}
+    values = {}
+    if previous is not None:
+        values[columns[previous].name] = _incremented(columns[previous], -1)
+    if status is not None:
+        values[columns[status].name] = _incremented(columns[status], 1)
+    if (previous is None) != (status is None):
+        values["vote_count"] = _incremented(bills.c.vote_count, 1 if previous is None else -1)
+    db.session.execute(update(bills).where(bills.c.id == bill_id).values(values))
+
+def change_vote_counters(bill_id: int, vote_status: str, buckets: dict, delta: int) -> None:
+    """
+    Atomically add ``delta`` to the counters of a vote, with one statement.
+
+    Missing counters are created by an ``INSERT ... ON CONFLICT DO UPDATE SET count =
+    count + delta``, which the database applies to the current row, so concurrent votes
+    are all counted. Counts never drop below zero. The caller commits.
+
+    Args:
+        bill_id (int): The bill voted on.
+        vote_status (str): "upvote" or "downvote".
+        buckets (dict): The voter's bucket per dimension, from ``vote_buckets``.
+        delta (int): 1 to count a vote, -1 to remove it.
+    """
+    counters = VoteCounter.__table__
+    statement = dialect_insert(counters).values([
+        {"bill_id": bill_id, "vote_status": vote_status, "dimension": dimension, "bucket": bucket,
+         "count": max(delta, 0)}
+        for dimension, bucket in buckets.items()
+    ])
+    statement = statement.on_conflict_do_update(
+        index_elements=[counters.c.bill_id, counters.c.vote_status, counters.c.dimension, counters.c.bucket],
+        set_={"count": _incremented(counters.c.count, delta)},
+    )
+    db.session.execute(statement)
+
+def has_vote_counters(bill_id: int) -> bool:
+    """Whether any vote was ever counted on a bill."""
+    return db.session.query(VoteCounter.bill_id).filter_by(bill_id=bill_id).first() is not None
+
+def bill_demographics(bill_id: int) -> dict:
+    """
+    Read the vote counters of a bill into the shape of ``default_demographics()``.
 
-            congress_url = f"https://www.congress.gov/bill/{congress}th-congress/{bill_type.lower()}/{bill_number}"
-            try:
-                update_date = datetime.strptime(bill_data["updateDate"], "%Y-%m-%d")
-            except (KeyError, ValueError):
-                update_date = datetime.now(timezone.utc)
+    Args:
+        bill_id (int): The bill.
+    Returns:
+        dict: Counts by vote status, dimension and bucket; zero where no vote was counted.
+    """
+    demographics = default_demographics()
+    counters = db.session.query(
+        VoteCounter.vote_status, VoteCounter.dimension, VoteCounter.bucket, VoteCounter.count
+    ).filter_by(bill_id=bill_id)
+    for vote_status, dimension, bucket, count in counters:
+        demographics.setdefault(vote_status, {}).setdefault(dimension, {})[bucket] = count
+    return demographics
+
+def migrate_vote_counters() -> int:
+    """
+    Move the demographics of legacy ``Vote`` records into ``VoteCounter`` rows.
 
-            if existing_bill:
-                existing_bill.title = detailed_bill.get("title", bill_data.get("title", ""))
-                existing_bill.latest_action = detailed_bill.get("latestAction", bill_data.get("latestAction", {}))
-                existing_bill.update_date = update_date
-                existing_bill.text_preview = bill_text
-                if not existing_bill.ai_summary:
-                    existing_bill.ai_summary = ai_summary
-                existing_bill.updated_at = datetime.now(timezone.utc)
-                db.session.commit()
-                app.logger.info(f"Updated existing bill {bill_type}{bill_number}")
-                return False
-
-            new_bill = Bill(
-                congress=congress,
-                bill_type=bill_type,
-                bill_number=bill_number,
-                title=detailed_bill.get("title", bill_data.get("title", "")),
-                latest_action_date=latest_action_date,
-                origin_chamber=bill_data.get("originChamber", ""),
-                sponsor=detailed_bill.get("sponsor", {}).get("name", "Unknown"),
-                latest_action=detailed_bill.get("latestAction", bill_data.get("latestAction", {})),
-                update_date=update_date,
-                url=congress_url,
-                text_preview=bill_text,
-                full_text=full_text,
-                ai_summary=ai_summary,
-                vote_count=0,
-                created_at=datetime.now(timezone.utc)
+    Counts are added to any counters recorded since, and each migrated record is
+    deleted in the same transaction, so running this again migrates nothing twice.
+
+    Returns:
+        int: The number of bills whose demographics were migrated.
+    """
+    counters = VoteCounter.__table__
+    migrated = 0
+    for vote in Vote.query.all():
+        rows = [
+            {"bill_id": vote.bill_id, "vote_status": vote_status, "dimension": dimension, "bucket": bucket,
+             "count": count}
+            for vote_status, dimensions in vote.demographics.items()
+            for dimension, buckets in dimensions.items()
+            for bucket, count in buckets.items() if count
+        ]
+        if rows:
+            statement = dialect_insert(counters).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[counters.c.bill_id, counters.c.vote_status, counters.c.dimension, counters.c.bucket],
+                set_={"count": counters.c.count + statement.excluded.count},
             )
-            db.session.add(new_bill)
-            db.session.commit()
-            app.logger.info(f"Successfully inserted bill {bill_type}{bill_number}")
-            return True
+            db.session.execute(statement)
+        db.session.delete(vote)
+        migrated += 1
+    db.session.commit()
+    return migrated
 
-        except Exception as e:
-            app.logger.error(f"Error processing bill: {e}")
-            app.logger.error("Bill data: " + json.dumps(bill_data, indent=2))
-            return False
+def migrate_user_votes(batch_size: int = USER_VOTE_MIGRATION_BATCH) -> int:
+    """
+    Move the votes kept in the legacy ``voted_bills`` JSON column to ``UserVote`` rows.
 
+    Users are processed in batches of ``batch_size`` in id order, each batch in its own
+    transaction. A user's JSON column is emptied once their votes are recorded, so an
+    interrupted run continues where it stopped and later runs cannot bring back votes
+    removed since. Votes already recorded in ``UserVote`` win over the JSON, and votes
+    on bills that no longer exist are dropped.
 
-    def batch_scrape(self, congress: int, offset: int = 0, limit: int = 20) -> tuple:
-        """
-        Perform batch scraping of bills from the external API.
+    Args:
+        batch_size (int): Users per transaction.
+    Returns:
+        int: The number of votes recorded.
+    """
+    votes = UserVote.__table__
+    users = User.__table__
+    recorded = 0
+    last_id = 0
+    while True:
+        batch = db.session.query(User.id, User.legacy_voted_bills).filter(User.id > last_id) \
+            .order_by(User.id).limit(batch_size).all()
+        if not batch:
+            break
+        last_id = batch[-1][0]
+        batch = [(user_id, voted_bills) for user_id, voted_bills in batch if voted_bills]
+        if not batch:
+            continue
+        referenced = {int(bill_id) for _, voted_bills in batch for bill_id in voted_bills}
+        bill_ids = {bill_id for bill_id, in db.session.query(Bill.id).filter(Bill.id.in_(referenced))}
+        rows = [
+            {"user_id": user_id, "bill_id": int(bill_id), "status": status}
+            for user_id, voted_bills in batch
+            for bill_id, status in voted_bills.items()
+            if status in ("upvote", "downvote") and int(bill_id) in bill_ids
+        ]
+        if rows:
+            statement = dialect_insert(votes).values(rows).on_conflict_do_nothing(
+                index_elements=[votes.c.user_id, votes.c.bill_id]
+            )
+            recorded += db.session.execute(statement).rowcount
+        db.session.execute(
+            update(users).where(users.c.id.in_([user_id for user_id, _ in batch])).values(voted_bills={})
+        )
+        db.session.commit()
+    return recorded
 
-        Args:
-            congress (int): The Congress number to scrape.
-            offset (int, optional): Pagination offset; defaults to 0.
-            limit (int, optional): Number of bills to process in one batch; defaults to 20.
-        Returns:
-            tuple: A tuple containing:
-                - processed_count (int): Number of new bills processed.
-                - batch_count (int): Number of bills fetched in the current batch.
-                - total_count (int): Total available count of bills from the API.
-        """
-        url = f"{CONGRESS_API_BASE}/bill/{congress}"
-        params = {
-            "offset": offset,
-            "limit": limit,
-            "format": "json"
-        }
-        try:
-            self._rate_limit()
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                bills = data.get("bills", [])
-                processed_count = 0
-                for bill in bills:
-                    if self.process_bill(bill):
-                        processed_count += 1
-                total_count = data.get("pagination", {}).get("count", 0)
-                return processed_count, len(bills), total_count
-            else:
-                app.logger.error(f"Error in batch scrape: Status {response.status_code}")
-                return 0, 0, 0
-        except Exception as e:
-            app.logger.error(f"Exception in batch scrape: {e}")
-            return 0, 0, 0
+def merge_duplicate_bills() -> int:
+    """
+    Merge bills stored more than once under the same congress, type and number.
 
-    def daily_update(self) -> int:
-        """
-        Perform a daily update of new and modified bills from the external API.
+    Before that natural key was unique, racing scheduled scrapes could insert a bill
+    twice, and its unique index cannot be created until the copies are merged. The
+    copy with the lowest id is kept. It takes over the votes, vote counters and vote
+    totals of the others, and their text and summary if it has none. A user who voted
+    on several copies keeps only their vote on the kept bill. Run after
+    ``migrate_vote_counters`` and ``migrate_user_votes``, so that every vote is in
+    ``UserVote`` and ``VoteCounter``.
 
-        Returns:
-            int: The number of bills processed during the daily update.
-        """
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-        current_congress = 118  # Update this value as needed
-        url = f"{CONGRESS_API_BASE}/bill/{current_congress}"
-        params = {
-            "fromDateTime": f"{yesterday}T00:00:00Z",
-            "format": "json"
-        }
-        try:
-            self._rate_limit()
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                bills = data.get("bills", [])
-                processed_count = 0
-                for bill in bills:
-                    if self.process_bill(bill):
-                        processed_count += 1
-                return processed_count
-            else:
-                app.logger.error(f"Error in daily update: Status {response.status_code}")
-                return 0
-        except Exception as e:
-            app.logger.error(f"Exception in daily update: {e}")
-            return 0
+    Returns:
+        int: The number of duplicate bills removed.
+    """
+    counters = VoteCounter.__table__
+    groups = db.session.query(func.min(Bill.id), Bill.congress, Bill.bill_type, Bill.bill_number) \
+        .group_by(Bill.congress, Bill.bill_type, Bill.bill_number).having(func.count(Bill.id) > 1).all()
+    removed = 0
+    for keep_id, congress, bill_type, bill_number in groups:
+        keep = db.session.get(Bill, keep_id)
+        duplicates = Bill.query.filter(
+            Bill.congress == congress, Bill.bill_type == bill_type, Bill.bill_number == bill_number,
+            Bill.id != keep_id,
+        ).order_by(Bill.id).all()
+        for duplicate in duplicates:
+            # Votes of users who also voted on the kept bill are dropped from the duplicate first.
+            kept_voters = db.session.query(UserVote.user_id).filter(UserVote.bill_id == keep.id)
+            for vote in UserVote.query.filter(UserVote.bill_id == duplicate.id, UserVote.user_id.in_(kept_voters)):
+                count = vote.status + "_count"
+                setattr(duplicate, count, max(getattr(duplicate, count) - 1, 0))
+                duplicate.vote_count = max(duplicate.vote_count - 1, 0)
+                user = db.session.get(User, vote.user_id)
+                if user.age is not None:
+                    change_vote_counters(duplicate.id, vote.status, vote_buckets(user), -1)
+                db.session.delete(vote)
+            db.session.flush()
+            db.session.execute(update(UserVote.__table__).where(UserVote.bill_id == duplicate.id)
+                               .values(bill_id=keep.id))
+
+            rows = [
+                {"bill_id": keep.id, "vote_status": counter.vote_status, "dimension": counter.dimension,
+                 "bucket": counter.bucket, "count": counter.count}
+                for counter in VoteCounter.query.filter_by(bill_id=duplicate.id) if counter.count
+            ]
+            if rows:
+                statement = dialect_insert(counters).values(rows)
+                db.session.execute(statement.on_conflict_do_update(
+                    index_elements=[counters.c.bill_id, counters.c.vote_status, counters.c.dimension, counters.c.bucket],
+                    set_={"count": counters.c.count + statement.excluded.count},
+                ))
+            db.session.execute(delete(counters).where(counters.c.bill_id == duplicate.id))
+            keep.upvote_count += duplicate.upvote_count
+            keep.downvote_count += duplicate.downvote_count
+            keep.vote_count += duplicate.vote_count
+
+            if not keep.full_text and duplicate.full_text:
+                keep.full_text, keep.text_preview = duplicate.full_text, duplicate.text_preview
+            if not keep.ai_summary and duplicate.ai_summary:
+                keep.ai_summary, keep.summary_hash = duplicate.ai_summary, duplicate.summary_hash
+            SummaryJob.query.filter_by(bill_id=duplicate.id).delete()
+            db.session.delete(duplicate)
+            removed += 1
+        db.session.flush()
+        enqueue_summary_jobs([keep.id])
+    db.session.commit()
+    return removed
 
 # ------------------------------------------------------------------------------
 # Scheduled Tasks Helper Functions
@@ -549,15 +2285,15 @@ class CongressionalScraper:
 #credit to akash for developing this
 def scheduled_update():
     """
-    Scheduled task function to perform a daily update of bills.
+    Scheduled task function to perform an update of changed bills.
 
-    This function is designed to be run on a daily schedule. It initializes
-    the CongressionalScraper and calls the daily_update method, logging the number
-    of bills processed.
+    This function is designed to be run on a regular schedule. It initializes
+    the CongressionalScraper and calls the daily_update method, which syncs every
+    bill changed since the previous run, logging the number of bills processed.
     """
     with app.app_context():
         scraper = CongressionalScraper()
-        processed = scraper.daily_update()
+        processed = scraper.daily_update(workers=SCRAPE_WORKERS)
         app.logger.info(f"Scheduled update completed: processed {processed} bills")
 
 def scheduled_batch_scrape():
@@ -565,23 +2301,30 @@ def scheduled_batch_scrape():
     Scheduled task function to perform batch scraping of bills.
 
     This function is designed to be run on a minute-by-minute schedule to
-    incrementally scrape new bills. It uses the ScrapeTracking model to maintain
-    the current offset and updates the offset after each batch.
+    incrementally scrape new bills. It processes one page of the backfill of the
+    current Congress; the checkpoint in ScrapeTracking only advances once the page
+    is stored, and failed bills are recorded for retry.
     """
     with app.app_context():
         scraper = CongressionalScraper()
-        tracking = ScrapeTracking.query.filter_by(type="offset").first()
-        if tracking is None:
-            tracking = ScrapeTracking(type="offset", offset=0)
-            db.session.add(tracking)
-            db.session.commit()
-        current_offset = tracking.offset
+        try:
+            result = backfill_congress(scraper, congress=current_congress(), limit=3, max_pages=1)
+        except Exception as e:
+            app.logger.error(f"Scheduled batch failed: {e}")
+            return
+        app.logger.info(f"Scheduled batch completed: processed {result['inserted']} bills, "
+                        f"{result['failed']} failed")
 
-        processed, batch_count, available = scraper.batch_scrape(congress=118, offset=current_offset, limit=3)
-        new_offset = current_offset + 3
-        tracking.offset = new_offset
-        db.session.commit()
-        app.logger.info(f"Scheduled batch completed: processed {processed} bills. Next offset: {new_offset}")
+def scheduled_summaries():
+    """
+    Scheduled task function to drain the AI summary job queue.
+
+    Summaries of bills stored by the scraping tasks are generated here, and the
+    summarized bills are re-indexed for search.
+    """
+    with app.app_context():
+        result = run_summary_jobs()
+        build_bill_search_entries(result["summarized"])
 
 # ------------------------------------------------------------------------------
 # Security Headers (optional)
@@ -624,32 +2367,197 @@ def init_db() -> None:
     This command creates all required database tables and confirms the creation via a CLI message.
     """
     db.create_all()
+    # Added first, since the migrations below load whole bills.
+    if migrate_detail_validators():
+        click.echo("Added the detail validator columns to bills.")
+    hashed = migrate_summary_hashes()
+    if hashed:
+        click.echo(f"Recorded the source text hashes of {hashed} AI summaries.")
+    if migrate_scrape_tracking():
+        click.echo("Added the sync and backfill checkpoint columns to scrape_tracking.")
+    migrated = migrate_vote_counters()
+    if migrated:
+        click.echo(f"Moved the vote demographics of {migrated} bills to vote_counters.")
+    recorded = migrate_user_votes()
+    if recorded:
+        click.echo(f"Moved {recorded} votes from users.voted_bills to user_votes.")
+    # The unique index on the natural key can only be created without duplicates.
+    merged = merge_duplicate_bills()
+    if merged:
+        click.echo(f"Merged {merged} duplicate bills into the copies with the lowest ids.")
+    # create_all skips indexes of tables that already exist.
+    for index in Bill.__table__.indexes | UserVote.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    if migrate_fulltext_search():
+        click.echo("Full-text search column and indexes created.")
     click.echo("Database tables created.")
 
 @app.cli.command("scrape-bills")
 @click.option("--congress", default=118, help="Congress number to scrape")
 @click.option("--offset", default=0, help="Starting offset")
 @click.option("--limit", default=20, help="Number of bills to fetch")
+@click.option("--workers", default=SCRAPE_WORKERS, help="Number of bills processed concurrently")
+@click.option("--cache-dir", default=SCRAPER_CACHE_DIR, help="Record raw responses in this directory")
+@click.option("--replay", is_flag=True, default=SCRAPER_REPLAY, help="Serve all requests from --cache-dir")
 @with_appcontext
-def scrape_bills(congress: int, offset: int, limit: int) -> None:
+def scrape_bills(congress: int, offset: int, limit: int, workers: int, cache_dir: str, replay: bool) -> None:
     """
     Scrape bills from the specified Congress session.
 
     This command performs a batch scrape of legislative bills using the provided parameters,
-    and then updates the BillSearchEntry records used for TF–IDF search.
+    and then updates the search indexes for the bills that were inserted or updated.
     
     :param congress: Congress number to scrape (default is 118).
     :param offset: Starting offset for the scraping (default is 0).
     :param limit: Number of bills to fetch (default is 20).
+    :param workers: Number of bills processed concurrently (default is SCRAPE_WORKERS).
+    :param cache_dir: Directory of the on-disk response cache (default is SCRAPER_CACHE_DIR).
+    :param replay: Reprocess the range from the response cache without network access.
     """
-    scraper = CongressionalScraper()
-    processed, total, available = scraper.batch_scrape(congress=congress, offset=offset, limit=limit)
+    if replay and not cache_dir:
+        raise click.UsageError("--replay requires --cache-dir or SCRAPER_CACHE_DIR.")
+    scraper = CongressionalScraper(client=make_congress_api_client(cache_dir, replay))
+    processed, total, available = scraper.batch_scrape(congress=congress, offset=offset, limit=limit, workers=workers)
     click.echo(f"Scraping complete: Processed {processed} new bills out of {total} fetched bills.")
     click.echo(f"Total bills available: {available}")
 
-    click.echo("Updating BillSearchEntry records for search...")
+    click.echo("Updating search indexes...")
+    build_bill_search_entries(scraper.changed_bill_ids)
+    click.echo("Search indexes updated.")
+
+@app.cli.command("backfill")
+@click.option("--from-congress", default=current_congress, type=int, help="First Congress to scrape")
+@click.option("--to-congress", default=current_congress, type=int, help="Last Congress to scrape")
+@click.option("--limit", default=None, type=int, help="Bills per page (default: sized to API_RATE_LIMIT)")
+@click.option("--workers", default=SCRAPE_WORKERS, help="Number of bills processed concurrently")
+@click.option("--max-pages", default=None, type=int, help="Stop each Congress after this many pages")
+@click.option("--retry-failures", is_flag=True, help="Retry the recorded failed bills instead")
+@click.option("--restart", is_flag=True, help="Start the Congresses over from their first page")
+@with_appcontext
+def backfill(from_congress: int, to_congress: int, limit: int, workers: int, max_pages: int,
+             retry_failures: bool, restart: bool) -> None:
+    """
+    Scrape every bill of a range of Congresses, resuming from the last checkpoint.
+
+    Progress is checkpointed per Congress and page in ScrapeTracking, so running the
+    command again after a crash or restart continues where it stopped. Bills that fail
+    are recorded in scrape_failures and can be retried with --retry-failures.
+
+    :param from_congress: First Congress to scrape (default is the current one).
+    :param to_congress: Last Congress to scrape (default is the current one).
+    :param limit: Bills per page; by default a page takes about BACKFILL_PAGE_SECONDS.
+    :param workers: Number of bills processed concurrently (default is SCRAPE_WORKERS).
+    :param max_pages: Maximum pages per Congress in this run.
+    :param retry_failures: Retry the recorded failures instead of scraping listings.
+    :param restart: Reset the checkpoints of the Congresses to their first page.
+    """
+    limit = limit or backfill_page_size()
+    scraper = CongressionalScraper()
+    if retry_failures:
+        result = retry_scrape_failures(scraper, limit, workers)
+        click.echo(f"Retried {result['retried']} bills; {result['failed']} failed again.")
+        return
+    for congress in range(from_congress, to_congress + 1):
+        if restart:
+            backfill_checkpoint(congress).offset = 0
+            db.session.commit()
+        try:
+            result = backfill_congress(scraper, congress, limit, workers, max_pages)
+        except Exception as e:
+            raise click.ClickException(f"Backfill of Congress {congress} stopped: {e}. "
+                                       "Run the command again to resume.")
+        state = "complete" if result["complete"] else f"stopped at offset {backfill_checkpoint(congress).offset}"
+        click.echo(f"Congress {congress}: {result['bills']} bills in {result['pages']} pages, "
+                   f"{result['inserted']} new, {result['failed']} failed ({state}).")
+
+@app.cli.command("sync-bills")
+@click.option("--workers", default=SCRAPE_WORKERS, help="Number of bills processed concurrently")
+@with_appcontext
+def sync_bills(workers: int) -> None:
+    """
+    Process every bill changed since the last sync.
+
+    This command catches up from the high-water mark stored in ScrapeTracking, e.g.
+    after the scheduler was down, and advances the mark.
+
+    :param workers: Number of bills processed concurrently (default is SCRAPE_WORKERS).
+    """
+    try:
+        result = sync_changed_bills(CongressionalScraper(), workers=workers)
+    except Exception as e:
+        raise click.ClickException(f"Sync stopped: {e}. Run the command again to resume.")
+    click.echo(f"Synced {result['bills']} changed bills in {result['windows']} windows: "
+               f"{result['inserted']} new, {result['failed']} failed.")
+
+@app.cli.command("summarize-bills")
+@click.option("--workers", default=SUMMARY_WORKERS, help="Number of summaries generated concurrently")
+@click.option("--limit", default=None, type=int, help="Most jobs to process (default: all due jobs)")
+@click.option("--stub", is_flag=True, help="Dry run with the local stub model: summarize without writing anything")
+@with_appcontext
+def summarize_bills(workers: int, limit: int, stub: bool) -> None:
+    """
+    Generate the AI summaries queued by the scraper.
+
+    This command drains the summary job queue and then updates the search indexes for
+    the bills that were summarized.
+
+    :param workers: Number of summaries generated concurrently (default is SUMMARY_WORKERS).
+    :param limit: Maximum number of jobs to process.
+    :param stub: Summarize with StubSummaryClient as a dry run, e.g. for benchmarks or offline runs;
+        nothing is written, so stub summaries never replace real ones.
+    """
+    if stub:
+        result = preview_summary_jobs(StubSummaryClient(), workers=workers, limit=limit)
+        click.echo(f"Dry run: summarized {len(result['summarized'])} bills with the stub model, "
+                   f"{result['failed']} failed; nothing was written.")
+        return
+    result = run_summary_jobs(workers=workers, limit=limit)
+    click.echo(f"Summarized {len(result['summarized'])} bills ({result['cached']} from cache); "
+               f"{result['retrying']} jobs will be retried, {result['failed']} failed.")
+    build_bill_search_entries(result["summarized"])
+
+@app.cli.command("rebuild-search-index")
+@with_appcontext
+def rebuild_search_index_command() -> None:
+    """
+    Rebuild the search indexes from scratch.
+
+    Incremental updates reuse the IDF statistics of the last refresh; run this after
+    bulk imports or to compact the index on disk.
+    """
     build_bill_search_entries()
-    click.echo("BillSearchEntry records updated.")
+    click.echo("Search indexes rebuilt.")
+
+@app.cli.command("migrate-fulltext-search")
+@with_appcontext
+def migrate_fulltext_search_command() -> None:
+    """
+    Add the full-text search column and its GIN and trigram indexes to an existing database.
+
+    Only applies to PostgreSQL; other databases keep using ILIKE search.
+    """
+    if migrate_fulltext_search():
+        click.echo("Full-text search column and indexes are in place.")
+    else:
+        click.echo("Full-text search requires PostgreSQL; /api/search will use ILIKE matching.")
+
+@app.cli.command("migrate-user-votes")
+@click.option("--batch-size", default=USER_VOTE_MIGRATION_BATCH, help="Users migrated per transaction")
+@with_appcontext
+def migrate_user_votes_command(batch_size: int) -> None:
+    """
+    Move the votes of users.voted_bills to the user_votes table, creating it if needed.
+
+    Each batch of users is committed on its own, so the command can be interrupted and
+    run again.
+
+    :param batch_size: Users migrated per transaction.
+    """
+    UserVote.__table__.create(db.engine, checkfirst=True)
+    for index in UserVote.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    recorded = migrate_user_votes(batch_size)
+    click.echo(f"Moved {recorded} votes from users.voted_bills to user_votes.")
 
 @app.cli.command("schedule-updates")
 @with_appcontext
@@ -659,13 +2567,16 @@ def init_scheduler() -> None:
 
     This command initializes and starts a BackgroundScheduler that schedules:
     - A batch scraping task to run every minute.
-    - A daily update task to run every 24 hours.
+    - An update task syncing changed bills every SYNC_INTERVAL_MINUTES (default 60).
+    - A summary task draining the AI summary job queue every 5 minutes.
     """
     scheduler = BackgroundScheduler()
     scheduler.add_job(func=scheduled_batch_scrape, trigger="interval", minutes=1)
-    scheduler.add_job(func=scheduled_update, trigger="interval", hours=24)
+    scheduler.add_job(func=scheduled_update, trigger="interval", minutes=SYNC_INTERVAL_MINUTES, max_instances=1)
+    # A single instance, so slow summary runs never overlap.
+    scheduler.add_job(func=scheduled_summaries, trigger="interval", minutes=5, max_instances=1)
     scheduler.start()
-    click.echo("Scheduler started with daily and batch scraping tasks.")
+    click.echo("Scheduler started with update, batch scraping and summary tasks.")
 
 @app.cli.command("reset-db")
 @with_appcontext
@@ -684,6 +2595,7 @@ def reset_db() -> None:
     # Create all tables from the models.
     db.create_all()
     db.session.commit()
+    migrate_fulltext_search()
     
     click.echo("Database reset complete.")
 # ------------------------------------------------------------------------------
@@ -756,8 +2668,7 @@ def register():
 
     user = User(email=email, username=username, age=age, gender=gender.lower(), 
                 ethnicity=ethnicity.lower(), state=state.lower(), 
-                political_affiliation=political_affiliation.lower(),
-                voted_bills={})
+                political_affiliation=political_affiliation.lower())
 
     user.set_password(password)
     db.session.add(user)
@@ -824,39 +2735,262 @@ def login():
 # Helper Function for Serialization
 # ------------------------------------------------------------------------------
 #credit to akash for developing this
-def serialize_bill(bill):
+# Serialized bill fields, each backed by the Bill column of the same name.
+BILL_FIELDS = (
+    "congress", "bill_type", "bill_number", "title", "latest_action_date", "origin_chamber",
+    "sponsor", "latest_action", "update_date", "url", "text_preview", "full_text", "ai_summary",
+    "vote_count", "upvote_count", "downvote_count", "created_at", "updated_at",
+)
+_BILL_DATETIME_FIELDS = {"latest_action_date", "update_date", "created_at", "updated_at"}
+
+# Named field sets: "card" is what bill lists display, "full" is the bill page.
+BILL_PROJECTIONS = {
+    "card": tuple(field for field in BILL_FIELDS if field not in ("text_preview", "full_text")),
+    "full": BILL_FIELDS,
+}
+
+# Fields list endpoints may return; full text is only served by /api/bills/<id>/full.
+BILL_LIST_FIELDS = tuple(field for field in BILL_FIELDS if field != "full_text")
+
+def bill_fields_from_request(allowed=BILL_LIST_FIELDS, default: str = "card") -> tuple:
+    """
+    Resolve the ``fields`` query parameter into the bill fields to return.
+
+    ``fields`` is either a projection name from ``BILL_PROJECTIONS`` or a
+    comma-separated list of field names.
+
+    Args:
+        allowed (Iterable[str]): Fields the endpoint may return.
+        default (str): Projection used when ``fields`` is not given.
+    Returns:
+        tuple: The requested field names.
+    Raises:
+        ValueError: If a requested field is unknown or not allowed.
+    """
+    value = request.args.get("fields", default).strip()
+    if value in BILL_PROJECTIONS:
+        fields = tuple(field for field in BILL_PROJECTIONS[value] if field in allowed)
+    else:
+        fields = tuple(field.strip() for field in value.split(",") if field.strip() and field.strip() != "_id")
+    invalid = [field for field in fields if field not in allowed]
+    if invalid:
+        raise ValueError(f"Invalid fields: {', '.join(invalid)}. Must be a projection "
+                         f"({', '.join(BILL_PROJECTIONS)}) or any of: {', '.join(allowed)}.")
+    return fields
+
+def serialize_bill(bill, fields=BILL_PROJECTIONS["card"]):
     """
     Helper function to serialize a Bill object for JSON responses.
 
-    Converts datetime fields to ISO 8601 strings.
+    Converts datetime fields to ISO 8601 strings. Only the requested fields are
+    read, so bills loaded with ``bill_response_query`` for the same fields never
+    trigger additional queries.
 
     Args:
         bill (Bill): A Bill model instance.
+        fields (Iterable[str]): Fields to include besides ``_id``; defaults to the
+            "card" projection, which leaves out the bill text.
 
     Returns:
         dict: A dictionary representation of the bill.
     """
-    return {
-        "_id": str(bill.id),
-        "congress": bill.congress,
-        "bill_type": bill.bill_type,
-        "bill_number": bill.bill_number,
-        "title": bill.title,
-        "latest_action_date": bill.latest_action_date.isoformat() if bill.latest_action_date else None,
-        "origin_chamber": bill.origin_chamber,
-        "sponsor": bill.sponsor,
-        "latest_action": bill.latest_action,
-        "update_date": bill.update_date.isoformat() if bill.update_date else None,
-        "url": bill.url,
-        "text_preview": bill.text_preview,
-        "full_text": bill.full_text,
-        "ai_summary": bill.ai_summary,
-        "vote_count": bill.vote_count if hasattr(bill, 'vote_count') else 0,
-        "upvote_count": bill.upvote_count if hasattr(bill, 'upvote_count') else 0,
-        "downvote_count": bill.downvote_count if hasattr(bill, 'downvote_count') else 0,
-        "created_at": bill.created_at.isoformat() if bill.created_at else None,
-        "updated_at": bill.updated_at.isoformat() if bill.updated_at else None
-    }
+    data = {"_id": str(bill.id)}
+    for field in fields:
+        value = getattr(bill, field)
+        if field in _BILL_DATETIME_FIELDS:
+            value = value.isoformat() if value else None
+        data[field] = value
+    return data
+
+def bill_response_query(query=None, columns=BILL_PROJECTIONS["card"]):
+    """
+    Restrict a bill query to the columns a response needs.
+
+    Any other column is deferred and raises on access instead of silently issuing
+    one extra query per bill.
+
+    Args:
+        query (Query, optional): The query to restrict; ``Bill.query`` when omitted.
+        columns (Iterable[str]): Names of the Bill columns to load.
+    Returns:
+        Query: The restricted query.
+    """
+    query = Bill.query if query is None else query
+    return query.options(load_only(*[getattr(Bill, column) for column in columns], raiseload=True))
+
+def hydrate_bills(bill_ids, columns=BILL_PROJECTIONS["card"]) -> list:
+    """
+    Load bills by id with a single ``IN`` query, preserving the order of ``bill_ids``.
+
+    Used to turn ranked search results into bills; ids that no longer exist are skipped.
+
+    Args:
+        bill_ids (Iterable[int]): Bill ids in the order the bills should be returned.
+        columns (Iterable[str]): Names of the Bill columns to load.
+    Returns:
+        list[Bill]: The bills found, in the given order.
+    """
+    bill_ids = list(bill_ids)
+    if not bill_ids:
+        return []
+    bills = {bill.id: bill for bill in bill_response_query(columns=columns).filter(Bill.id.in_(bill_ids))}
+    return [bills[bill_id] for bill_id in bill_ids if bill_id in bills]
+
+# ------------------------------------------------------------------------------
+# Keyset Pagination
+# ------------------------------------------------------------------------------
+# Sort columns supported by cursor pagination; they must not contain NULLs.
+KEYSET_SORT_COLUMNS = (
+    "created_at", "latest_action_date", "update_date", "vote_count", "upvote_count",
+    "downvote_count", "congress", "title", "id",
+)
+
+def encode_cursor(sort_by: str, sort_dir: int, bill) -> str:
+    """
+    Encode the position after ``bill`` in a listing as an opaque cursor token.
+
+    Args:
+        sort_by (str): The sort column of the listing.
+        sort_dir (int): 1 for ascending, -1 for descending.
+        bill (Bill): The last bill of the current page.
+    Returns:
+        str: A URL-safe cursor token.
+    """
+    value = getattr(bill, sort_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort_by, "d": sort_dir, "v": value, "i": bill.id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(token: str, sort_by: str, sort_dir: int) -> tuple:
+    """
+    Decode a cursor token produced by ``encode_cursor``.
+
+    Args:
+        token (str): The cursor token.
+        sort_by (str): The sort column of the current request.
+        sort_dir (int): The sort direction of the current request.
+    Returns:
+        tuple: ``(sort value, bill id)`` of the last bill of the previous page.
+    Raises:
+        ValueError: If the token is malformed or was issued for a different sort order.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        value, bill_id = payload["v"], int(payload["i"])
+        if isinstance(getattr(Bill, sort_by).type, db.DateTime):
+            value = datetime.fromisoformat(value)
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor.") from e
+    if payload.get("s") != sort_by or payload.get("d") != sort_dir:
+        raise ValueError("Cursor does not match the requested sort order.")
+    return value, bill_id
+
+def approximate_bill_count(query) -> int:
+    """
+    Estimate the number of bills matched by ``query``.
+
+    On PostgreSQL the planner's row estimate for the bills table is used when the
+    listing is unfiltered, which avoids scanning the table; otherwise the rows are counted.
+
+    Args:
+        query (Query): The filtered bill query, without ordering or limits.
+    Returns:
+        int: The estimated number of bills.
+    """
+    if db.engine.dialect.name == "postgresql" and query.whereclause is None:
+        estimate = db.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'bills'")
+        ).scalar()
+        if estimate is not None and estimate >= 0:
+            return estimate
+    return query.order_by(None).count()
+
+def keyset_page(query, sort_by: str, sort_dir: int, per_page: int, cursor: str) -> tuple:
+    """
+    Fetch one page of bills after ``cursor``, ordered by ``sort_by`` and then id.
+
+    Each page is a range scan on the ``(sort column, id)`` index, so it costs the
+    same no matter how deep into the listing it is.
+
+    Args:
+        query (Query): The filtered bill query.
+        sort_by (str): One of ``KEYSET_SORT_COLUMNS``.
+        sort_dir (int): 1 for ascending, -1 for descending.
+        per_page (int): Number of bills per page.
+        cursor (str): Token from the previous page, or an empty string for the first page.
+    Returns:
+        tuple: ``(bills, next_cursor)``; ``next_cursor`` is None on the last page.
+    Raises:
+        ValueError: If the cursor is invalid for this sort order.
+    """
+    columns = [Bill.id] if sort_by == "id" else [getattr(Bill, sort_by), Bill.id]
+    if cursor:
+        value, bill_id = decode_cursor(cursor, sort_by, sort_dir)
+        key, bound = tuple_(*columns), tuple_(*([bill_id] if sort_by == "id" else [value, bill_id]))
+        query = query.filter(key < bound if sort_dir == -1 else key > bound)
+    order = [column.desc() if sort_dir == -1 else column.asc() for column in columns]
+    bills = query.order_by(*order).limit(per_page + 1).all()
+    next_cursor = encode_cursor(sort_by, sort_dir, bills[per_page - 1]) if len(bills) > per_page else None
+    return bills[:per_page], next_cursor
+
+# ------------------------------------------------------------------------------
+# Search Filters
+# ------------------------------------------------------------------------------
+# Result orderings of the search endpoints; "relevance" keeps the ranking order.
+SEARCH_SORTS = {
+    "relevance": None,
+    "newest": (Bill.latest_action_date.desc(), Bill.id.desc()),
+    "oldest": (Bill.latest_action_date.asc(), Bill.id.asc()),
+    "most-votes": (Bill.vote_count.desc(), Bill.id.desc()),
+}
+# A filtered TF-IDF search ranks this many matches per result it needs, and this many
+# times more each time too few of them pass the filters.
+SEARCH_FILTER_OVERFETCH = 4
+
+def search_filters_from_request() -> tuple:
+    """
+    Parse the chamber, date range and sort parameters shared by the search endpoints.
+
+    Query Parameters:
+        chamber (str): "House", "Senate" or "all" (default).
+        start_date (str): Earliest date to include, as YYYY-MM-DD.
+        end_date (str): Latest date to include, as YYYY-MM-DD. A bill is in the date range
+            if its latest action or the time it was scraped is, so newly scraped bills
+            with an older latest action are found too.
+        sort (str): One of ``SEARCH_SORTS`` (default: "relevance").
+
+    Returns:
+        tuple: ``(criteria, order)``: SQL criteria on ``Bill`` and the ORDER BY clauses,
+        or None to keep the relevance order.
+    Raises:
+        ValueError: If a parameter is invalid.
+    """
+    criteria = []
+    chamber = request.args.get("chamber", "all")
+    if chamber.lower() != "all":
+        criteria.append(Bill.origin_chamber == chamber)
+    date_columns = (Bill.latest_action_date, Bill.created_at)
+    in_range = [[] for _ in date_columns]
+    try:
+        start_date = request.args.get("start_date")
+        if start_date:
+            start = datetime.strptime(start_date, "%Y-%m-%d")
+            for column, bounds in zip(date_columns, in_range):
+                bounds.append(column >= start)
+        end_date = request.args.get("end_date")
+        if end_date:
+            end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+            for column, bounds in zip(date_columns, in_range):
+                bounds.append(column < end)
+    except ValueError as e:
+        raise ValueError("Invalid date. Dates must be formatted as YYYY-MM-DD.") from e
+    if start_date or end_date:
+        criteria.append(or_(*(and_(*bounds) for bounds in in_range)))
+    sort = request.args.get("sort", "relevance")
+    if sort not in SEARCH_SORTS:
+        raise ValueError(f"Invalid sort. Must be one of: {', '.join(SEARCH_SORTS)}.")
+    return criteria, SEARCH_SORTS[sort]
 
 # ------------------------------------------------------------------------------
 # Bill API Endpoints
@@ -872,10 +3006,19 @@ def get_bills():
         sort (str): The column to sort by (default: "created_at").
         sort_dir (int): Sort direction; 1 for ascending, -1 for descending (default: -1).
         chamber (str): The chamber to filter bills by (e.g., "House", "Senate", or "all").
+        fields (str): "card" (default) or a comma-separated list of bill fields to return.
+        cursor (str): Switches to keyset pagination; pass an empty value for the first
+            page and the returned ``next_cursor`` for the following ones. ``page`` is
+            ignored and ``sort`` must be one of ``KEYSET_SORT_COLUMNS``.
+        include_total (bool): In cursor mode, also return an approximate total (default: false).
 
     Returns:
         JSON response containing the serialized list of bills and pagination metadata.
     """
+    try:
+        fields = bill_fields_from_request()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     try:
         page = int(request.args.get("page", 1))
         per_page = int(request.args.get("per_page", 20))
@@ -883,10 +3026,26 @@ def get_bills():
         sort_dir = int(request.args.get("sort_dir", -1))
         chamber = request.args.get("chamber", None)
 
-        query = Bill.query
+        query = bill_response_query(columns=fields)
         if chamber and chamber.lower() != "all":
             query = query.filter(Bill.origin_chamber == chamber)
 
+        cursor = request.args.get("cursor")
+        if cursor is not None:
+            if sort_by not in KEYSET_SORT_COLUMNS:
+                return jsonify({"error": f"Invalid sort for cursor pagination. Must be one of: {', '.join(KEYSET_SORT_COLUMNS)}."}), 400
+            try:
+                bills, next_cursor = keyset_page(query, sort_by, sort_dir, per_page, cursor)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            pagination = {"per_page": per_page, "next_cursor": next_cursor}
+            if request.args.get("include_total", "false").lower() in ("1", "true"):
+                pagination["approximate_total"] = approximate_bill_count(query)
+            return jsonify({
+                "bills": [serialize_bill(bill, fields) for bill in bills],
+                "pagination": pagination
+            })
+
         sort_column = getattr(Bill, sort_by, Bill.created_at)
         sort_column = sort_column.desc() if sort_dir == -1 else sort_column.asc()
 
@@ -894,7 +3053,7 @@ def get_bills():
         bills = pagination.items
 
         return jsonify({
-            "bills": [serialize_bill(bill) for bill in bills],
+            "bills": [serialize_bill(bill, fields) for bill in bills],
             "pagination": {
                 "page": page,
                 "per_page": per_page,
@@ -912,12 +3071,19 @@ def get_trending_bills():
     """
     API endpoint to retrieve the top 10 trending bills sorted by vote count in descending order.
 
+    Query Parameters:
+        fields (str): "card" (default) or a comma-separated list of bill fields to return.
+
     Returns:
         JSON response containing a list of serialized trending bills.
     """
     try:
-        bills = Bill.query.order_by(Bill.vote_count.desc()).limit(10).all()
-        return jsonify([serialize_bill(bill) for bill in bills])
+        fields = bill_fields_from_request()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        bills = bill_response_query(columns=fields).order_by(Bill.vote_count.desc()).limit(10).all()
+        return jsonify([serialize_bill(bill, fields) for bill in bills])
     except Exception as e:
         app.logger.error(f"Error fetching trending bills: {e}")
         return jsonify({"error": str(e)}), 500
@@ -928,6 +3094,8 @@ def get_full_bill(bill_id):
     """
     API endpoint to retrieve full details for a specific bill by its id.
 
+    This is the only endpoint that returns the bill's full text.
+
     Args:
         bill_id (int): The unique id of the bill.
 
@@ -942,7 +3110,7 @@ def get_full_bill(bill_id):
         if bill.url:
             bill.url = bill.url.replace("api.congress.gov", "www.congress.gov")
 
-        return jsonify(serialize_bill(bill))
+        return jsonify(serialize_bill(bill, BILL_PROJECTIONS["full"]))
     except Exception as e:
         app.logger.error(f"Error fetching full bill: {e}")
         return jsonify({"error": str(e)}), 500
@@ -953,26 +3121,45 @@ def search_bills():
     """
     API endpoint to search bills based on a keyword.
 
+    On PostgreSQL with the full-text search migration applied, bills are matched
+    against the indexed search vector and ranked with ``ts_rank``; otherwise the
+    keyword is matched as a substring with ILIKE. Filters and the sort order are
+    applied in the same query, before the result limit.
+
     Query Parameters:
         keyword (str): The search keyword to look for in the bill's title, AI summary, or text preview.
+        chamber, start_date, end_date, sort: See ``search_filters_from_request``.
+        fields (str): "card" (default) or a comma-separated list of bill fields to return.
 
     Returns:
         JSON response containing a list of serialized bills matching the search criteria.
     """
+    try:
+        fields = bill_fields_from_request()
+        criteria, order = search_filters_from_request()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     try:
         keyword = request.args.get("keyword", "")
         if not keyword:
             return jsonify([])
 
-        bills = Bill.query.filter(
-            or_(
-                Bill.title.ilike(f"%{keyword}%"),
-                Bill.ai_summary.ilike(f"%{keyword}%"),
-                Bill.text_preview.ilike(f"%{keyword}%")
+        if fulltext_search_available():
+            query = bill_response_query(fulltext_search_query(keyword), fields)
+        else:
+            query = bill_response_query(columns=fields).filter(
+                or_(
+                    Bill.title.ilike(f"%{keyword}%"),
+                    Bill.ai_summary.ilike(f"%{keyword}%"),
+                    Bill.text_preview.ilike(f"%{keyword}%")
+                )
             )
-        ).limit(20).all()
+        query = query.filter(*criteria)
+        if order is not None:
+            query = query.order_by(None).order_by(*order)
+        bills = query.limit(20).all()
 
-        return jsonify([serialize_bill(bill) for bill in bills])
+        return jsonify([serialize_bill(bill, fields) for bill in bills])
     except Exception as e:
         app.logger.error(f"Error in search: {e}")
         return jsonify({"error": str(e)}), 500
@@ -981,53 +3168,87 @@ def search_bills():
 def search_bills_tfidf():
     """
     API endpoint to search bills using TF–IDF to rank documents based on relevance.
+
+    Queries are answered from the prebuilt search index (see ``get_search_index``),
+    so no vectorizer is fitted per request. Rankings are cached in ``search_cache``
+    under the index version, so repeated queries skip scoring until the index changes.
+    Other sorts order the ``SEARCH_SORT_CANDIDATES`` most relevant matches in SQL and
+    are not cached, since dates and votes change without the index.
     
     Query Parameters:
-        keyword (str): The search keyword to look for in the bill's title, AI summary, and text preview.
-        
+        keyword (str): The search keyword to look for in the bill's title, AI summary, and full
+            text, each weighted by ``SEARCH_FIELD_BOOSTS``.
+        mode (str): Ranking to use: "tfidf" for cosine similarity (default) or "bm25"
+            for BM25 over the inverted index.
+        chamber, start_date, end_date, sort: See ``search_filters_from_request``. The
+            filters are applied in SQL to the best matches, ranking more matches until
+            enough of them pass.
+        fields (str): "card" (default) or a comma-separated list of bill fields to return.
+
     Returns:
         JSON response containing a list of serialized bills matching the search criteria.
     """
     try:
         keyword = request.args.get("keyword", "").strip()
+        mode = request.args.get("mode", "tfidf").lower()
+        if mode not in SEARCH_INDEX_TYPES:
+            return jsonify({"error": f"Invalid search mode. Must be one of: {', '.join(SEARCH_INDEX_TYPES)}."}), 400
+        try:
+            fields = bill_fields_from_request()
+            criteria, order = search_filters_from_request()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         if not keyword:
             return jsonify([])
 
-        # Retrieve the prebuilt search entries.
-        entries = BillSearchEntry.query.all()
-        if not entries:
-            return jsonify([])
-
-        documents = [entry.combined_text for entry in entries]
-        bill_ids = [entry.bill_id for entry in entries]
-
-        # Initialize the vectorizer and compute the TF–IDF matrix.
-        vectorizer = TfidfVectorizer(stop_words="english")
-        tfidf_matrix = vectorizer.fit_transform(documents)
-        
-        # Transform the query into the TF–IDF vector space.
-        query_vec = vectorizer.transform([keyword])
-        
-        # Compute cosine similarities.
-        similarities = cosine_similarity(query_vec, tfidf_matrix).flatten()
-        
-        # Sort indices by similarity (highest first) and filter to include only positive matches.
-        sorted_indices = similarities.argsort()[::-1]
-        top_indices = [i for i in sorted_indices if similarities[i] > 0][:20]
-
-        # Build a list of serialized bills in order of relevance.
-        bills = []
-        for idx in top_indices:
-            bill = db.session.get(Bill, bill_ids[idx])
-            if bill:
-                bills.append(serialize_bill(bill))
-        
-        return jsonify(bills)
+        index = get_search_index(mode)
+
+        def rank(top_k):
+            if not criteria:
+                return index.search(keyword, top_k=top_k)
+            # Selecting every bill passing broad filters would cost more than ranking.
+            fetch = top_k * SEARCH_FILTER_OVERFETCH
+            while True:
+                results = index.search(keyword, top_k=fetch)
+                passing = {bill_id for bill_id, in db.session.query(Bill.id).filter(
+                    Bill.id.in_([bill_id for bill_id, _score in results]), *criteria
+                )}
+                filtered = [(bill_id, score) for bill_id, score in results if bill_id in passing]
+                if len(filtered) >= top_k or len(results) < fetch:
+                    return filtered[:top_k]
+                fetch *= SEARCH_FILTER_OVERFETCH
+
+        if order is not None:
+            results = rank(app.config["SEARCH_SORT_CANDIDATES"])
+            bills = bill_response_query(columns=fields).filter(
+                Bill.id.in_([bill_id for bill_id, _score in results])
+            ).order_by(*order).limit(20).all() if results else []
+            return jsonify([serialize_bill(bill, fields) for bill in bills])
+
+        chamber = request.args.get("chamber", "all")
+        results = search_cache.get_or_compute(SearchCache.key(
+            index.cache_token, keyword,
+            chamber=None if chamber.lower() == "all" else chamber,
+            start_date=request.args.get("start_date"), end_date=request.args.get("end_date"),
+        ), lambda: rank(20))
+        # Load all hits at once, keeping them in order of relevance.
+        bills = hydrate_bills((bill_id for bill_id, _score in results), fields)
+        return jsonify([serialize_bill(bill, fields) for bill in bills])
     
     except Exception as e:
         app.logger.error("Error in TF–IDF search: %s", e, exc_info=True)
         return jsonify({"error": "An error occurred during search."}), 500
 
+@app.route("/api/search_tfidf/cache", methods=["GET"])
+def get_search_cache_stats():
+    """
+    API endpoint reporting the search result cache counters of the serving worker.
+
+    Returns:
+        JSON response with the cache hits, misses, hit rate and number of entries.
+    """
+    return jsonify(search_cache.stats())
+
 @app.route("/api/bills/<int:bill_id>/vote", methods=["POST"])
 @jwt_required()
 def vote_on_bill(bill_id):
@@ -1039,7 +3260,9 @@ def vote_on_bill(bill_id):
     - "upvote" or "downvote": Casting or changing a vote.
     - "none": Removing an existing vote.
 
-    It updates the Vote entity's demographic counters and the User's `voted_bills` accordingly.
+    The user's vote is recorded in ``UserVote``, at most once per bill, and the bill's
+    counters and ``VoteCounter`` rows are incremented atomically in the database, so
+    concurrent votes are counted exactly.
     """
     try:
         data = request.get_json()
@@ -1060,141 +3283,37 @@ def vote_on_bill(bill_id):
         if user.age is None:
             return jsonify({"error": "User age not specified."}), 400
 
-        if user.age < 18:
-            age_category = "under_18"
-        elif 18 <= user.age < 30:
-            age_category = "18_to_30"
-        elif 30 <= user.age < 60:
-            age_category = "30_to_60"
-        else:
-            age_category = "60_plus"
-
-        # Normalize demographics.
-        gender = user.gender.lower() if user.gender else "other"
-        if gender not in ["male", "female", "non-binary", "transgender", "other"]:
-            gender = "other"
-
-        ethnicity = user.ethnicity.lower() if user.ethnicity else "other"
-        valid_ethnicities = [
-            "hispanic or latino", "white", "black or african american", "asian",
-            "native hawaiian or other pacific islander", "american indian or alaska native", "other"
-        ]
-        if ethnicity not in valid_ethnicities:
-            ethnicity = "other"
-
-        state = user.state.lower() if user.state else "other"
-        valid_states = [
-            "al", "ak", "az", "ar", "ca", "co", "ct", "de", "fl", "ga",
-            "hi", "id", "il", "in", "ia", "ks", "ky", "la", "me", "md",
-            "ma", "mi", "mn", "ms", "mo", "mt", "ne", "nv", "nh", "nj",
-            "nm", "ny", "nc", "nd", "oh", "ok", "or", "pa", "ri", "sc",
-            "sd", "tn", "tx", "ut", "vt", "va", "wa", "wv", "wi", "wy", "other"
-        ]
-        if state not in valid_states:
-            state = "other"
-
-        political_affiliation = user.political_affiliation.lower() if user.political_affiliation else "other"
-        valid_political = [
-            "democrat", "republican", "independent", "libertarian", "green",
-            "conservative", "progressive", "moderate", "socialist", "communist", "other"
-        ]
-        if political_affiliation not in valid_political:
-            political_affiliation = "other"
-
-        # Get or create the vote record for the bill.
-        vote_record = Vote.query.filter_by(bill_id=bill_id).first()
-        if not vote_record:
-            if vote_status != "none":
-                vote_record = Vote(bill_id=bill_id, demographics=default_demographics())
-                db.session.add(vote_record)
-            else:
-                return jsonify({"error": "No existing vote to remove for this bill."}), 400
-
-        previous_vote = user.voted_bills.get(str(bill_id))
-
-        # CASE 1: User has not voted yet.
-        if previous_vote is None:
-            if vote_status == "none":
+        buckets = vote_buckets(user)
+        new_vote = None if vote_status == "none" else vote_status
+        for attempt in range(VOTE_ATTEMPTS):
+            previous_vote = db.session.query(UserVote.status).filter_by(user_id=user.id, bill_id=bill_id).scalar()
+            if previous_vote is None and new_vote is None:
+                if not has_vote_counters(bill_id):
+                    return jsonify({"error": "No existing vote to remove for this bill."}), 400
                 return jsonify({"error": "You haven't voted on this bill yet."}), 400
-
-            # Increment demographics for the new vote.
-            demo = vote_record.demographics[vote_status]
-            demo["age_distribution"][age_category] = demo["age_distribution"].get(age_category, 0) + 1
-            demo["gender_distribution"][gender] = demo["gender_distribution"].get(gender, 0) + 1
-            demo["ethnicity_distribution"][ethnicity] = demo["ethnicity_distribution"].get(ethnicity, 0) + 1
-            demo["state_distribution"][state] = demo["state_distribution"].get(state, 0) + 1
-            demo["political_affiliation_distribution"][political_affiliation] = demo["political_affiliation_distribution"].get(political_affiliation, 0) + 1
-            vote_record.demographics[vote_status] = demo
-
-        
-            if vote_status == "upvote":
-                bill.upvote_count += 1
-                bill.vote_count +=1
-            if vote_status == "downvote":
-                bill.downvote_count += 1
-                bill.vote_count += 1
-            user.voted_bills[str(bill_id)] = vote_status
-
-        # CASE 2: User has already voted on this bill.
+            # If the vote is the same as before, nothing needs to change.
+            if previous_vote == new_vote:
+                return jsonify({"message": "Vote already recorded with the same status."}), 200
+            if change_user_vote(user.id, bill_id, previous_vote, new_vote):
+                break
+            # A concurrent request changed this vote first; start over from its result.
+            db.session.rollback()
         else:
-            if vote_status == "none":
-                # Remove the vote: decrement demographics.
-                old_demo = vote_record.demographics[previous_vote]
-                old_demo["age_distribution"][age_category] = max(old_demo["age_distribution"].get(age_category, 0) - 1, 0)
-                old_demo["gender_distribution"][gender] = max(old_demo["gender_distribution"].get(gender, 0) - 1, 0)
-                old_demo["ethnicity_distribution"][ethnicity] = max(old_demo["ethnicity_distribution"].get(ethnicity, 0) - 1, 0)
-                old_demo["state_distribution"][state] = max(old_demo["state_distribution"].get(state, 0) - 1, 0)
-                old_demo["political_affiliation_distribution"][political_affiliation] = max(old_demo["political_affiliation_distribution"].get(political_affiliation, 0) - 1, 0)
-                vote_record.demographics[previous_vote] = old_demo
-
-                bill.vote_count = max(bill.vote_count - 1, 0)
-                if previous_vote == "upvote":
-                    bill.upvote_count = max(bill.upvote_count - 1, 0)
-                elif previous_vote == "downvote":
-                    bill.downvote_count = max(bill.downvote_count - 1, 0)
-                if str(bill_id) in user.voted_bills:
-                    del user.voted_bills[str(bill_id)]
-
-            else:
-                # If the vote is the same as before, nothing needs to change.
-                if previous_vote == vote_status:
-                    return jsonify({"message": "Vote already recorded with the same status."}), 200
-
-                # Changing the vote: first remove the old vote's demographics.
-                old_demo = vote_record.demographics[previous_vote]
-                old_demo["age_distribution"][age_category] = max(old_demo["age_distribution"].get(age_category, 0) - 1, 0)
-                old_demo["gender_distribution"][gender] = max(old_demo["gender_distribution"].get(gender, 0) - 1, 0)
-                old_demo["ethnicity_distribution"][ethnicity] = max(old_demo["ethnicity_distribution"].get(ethnicity, 0) - 1, 0)
-                old_demo["state_distribution"][state] = max(old_demo["state_distribution"].get(state, 0) - 1, 0)
-                old_demo["political_affiliation_distribution"][political_affiliation] = max(old_demo["political_affiliation_distribution"].get(political_affiliation, 0) - 1, 0)
-                vote_record.demographics[previous_vote] = old_demo
-
-                # Then add the new vote's demographics.
-                new_demo = vote_record.demographics[vote_status]
-                new_demo["age_distribution"][age_category] = new_demo["age_distribution"].get(age_category, 0) + 1
-                new_demo["gender_distribution"][gender] = new_demo["gender_distribution"].get(gender, 0) + 1
-                new_demo["ethnicity_distribution"][ethnicity] = new_demo["ethnicity_distribution"].get(ethnicity, 0) + 1
-                new_demo["state_distribution"][state] = new_demo["state_distribution"].get(state, 0) + 1
-                new_demo["political_affiliation_distribution"][political_affiliation] = new_demo["political_affiliation_distribution"].get(political_affiliation, 0) + 1
-                vote_record.demographics[vote_status] = new_demo
-
-                if previous_vote == "upvote":
-                    bill.upvote_count = max(bill.upvote_count - 1, 0)
-                    bill.downvote_count += 1
-                elif previous_vote == "downvote":
-                    bill.downvote_count = max(bill.downvote_count - 1, 0)
-                    bill.upvote_count += 1
-
-                # Update the user's vote to the new status.
-                user.voted_bills[str(bill_id)] = vote_status
-
+            return jsonify({"error": "The vote was changed concurrently. Please try again."}), 409
+
+        # Counters are changed in the database, so concurrent votes are all counted.
+        if previous_vote is not None:
+            change_vote_counters(bill_id, previous_vote, buckets, -1)
+        if new_vote is not None:
+            change_vote_counters(bill_id, new_vote, buckets, 1)
+        change_bill_vote_counts(bill_id, previous_vote, new_vote)
         db.session.commit()
         return jsonify({
             "message": "Vote processed successfully",
             "vote": {
                 "bill_id": bill_id,
                 "vote_status": vote_status,
-                "demographics": vote_record.demographics
+                "demographics": bill_demographics(bill_id)
             },
             "bill": {
                 "id": bill.id,
@@ -1213,27 +3332,92 @@ def vote_on_bill(bill_id):
 def get_bill_demographics(bill_id):
     """
     Endpoint to retrieve demographic information for votes on a given bill.
-    Returns the demographics data from the Vote record associated with the bill,
-    or the default demographics if no votes have been recorded yet.
+    Returns the bill's vote counters shaped like ``default_demographics()``, with
+    zeros where no votes have been recorded yet.
     """
     try:
         bill = db.session.get(Bill, bill_id)
         if not bill:
             return jsonify({"error": "Bill not found."}), 404
 
-        vote_record = Vote.query.filter_by(bill_id=bill_id).first()
-        if vote_record is None:
-            demographics = default_demographics()
-        else:
-            demographics = vote_record.demographics
-
         return jsonify({
             "bill_id": bill_id,
-            "demographics": demographics
+            "demographics": bill_demographics(bill_id)
         }), 200
 
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
+@app.route("/api/users/me/votes", methods=["GET"])
+@jwt_required()
+def get_user_votes():
+    """
+    Endpoint to list the current user's votes, most recently cast or changed first.
+
+    Query Parameters:
+        page (int): The page number (default: 1).
+        per_page (int): The number of votes per page (default: 20, at most 100).
+        status (str): Only list "upvote" or "downvote" votes.
+        since (str): Only list votes cast or changed at or after this ISO 8601 time;
+            times without an offset are UTC.
+        fields (str): "card" (default) or a comma-separated list of bill fields to return.
+
+    Returns:
+        JSON response containing the votes, each with its bill, and pagination metadata.
+    """
+    try:
+        fields = bill_fields_from_request()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        page = int(request.args.get("page", 1))
+        per_page = int(request.args.get("per_page", 20))
+        status = request.args.get("status")
+        since = request.args.get("since")
+
+        user = db.session.get(User, get_jwt_identity())
+        if not user:
+            return jsonify({"error": "User not found."}), 404
+
+        query = UserVote.query.filter_by(user_id=user.id)
+        if status:
+            if status not in ("upvote", "downvote"):
+                return jsonify({"error": "Invalid status. Must be 'upvote' or 'downvote'."}), 400
+            query = query.filter(UserVote.status == status)
+        if since:
+            try:
+                since = datetime.fromisoformat(since)
+            except ValueError:
+                return jsonify({"error": "Invalid since. Must be an ISO 8601 time."}), 400
+            if since.tzinfo:
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            query = query.filter(UserVote.updated_at >= since)
+
+        # Served by the (user_id, updated_at, id) index.
+        pagination = query.order_by(UserVote.updated_at.desc(), UserVote.id.desc()) \
+            .paginate(page=page, per_page=per_page, max_per_page=100, error_out=False)
+        votes = pagination.items
+        bills = {bill.id: bill for bill in hydrate_bills([vote.bill_id for vote in votes], fields)}
+
+        return jsonify({
+            "votes": [{
+                "bill_id": vote.bill_id,
+                "vote_status": vote.status,
+                "created_at": vote.created_at.isoformat() if vote.created_at else None,
+                "updated_at": vote.updated_at.isoformat() if vote.updated_at else None,
+                "bill": serialize_bill(bills[vote.bill_id], fields) if vote.bill_id in bills else None
+            } for vote in votes],
+            "pagination": {
+                "page": page,
+                "per_page": pagination.per_page,
+                "total": pagination.total,
+                "pages": pagination.pages
+            }
+        }), 200
+
+    except Exception as e:
+        app.logger.error(f"Error fetching votes: {e}")
+        return jsonify({"error": str(e)}), 500
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8080)
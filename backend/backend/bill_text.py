@@ -0,0 +1,183 @@
+"""
+Bill Text Extraction
+
+Pulls the text of the ``<pre>`` element out of congress.gov's formatted bill text
+without building a document tree. ``PreTextExtractor`` is an incremental
+``HTMLParser`` that is fed the HTML piece by piece, keeps only the text strings of the
+first ``<pre>`` element and ignores everything after it, so memory stays bounded by
+the extracted text rather than by the HTML and its parse tree. ``parse_bill_html``
+does the same for an already downloaded body, e.g. in a worker process.
+
+The output matches ``BeautifulSoup(html, "html.parser").find("pre").get_text(
+separator=" ", strip=True)``: text is split into strings at every tag, comment and
+declaration, each string is stripped, and the non-empty ones are joined with single
+spaces. Character references are decoded with the HTML5 rules of
+``html.unescape``; the one known difference is an unknown named reference such as
+``&foo;``, which keeps its semicolon here and loses it in BeautifulSoup. As in
+``get_text``, the contents of ``<script>``, ``<style>`` and ``<template>`` are skipped.
+"""
+
+import codecs
+from html.parser import HTMLParser
+
+# Characters of decoded HTML fed to the parser at a time.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Elements whose strings are not text, as in BeautifulSoup's get_text.
+NON_TEXT_TAGS = {"script", "style", "template"}
+
+
+class PreTextExtractor(HTMLParser):
+    """
+    Incremental parser collecting the text of the first ``<pre>`` element.
+
+    Feed it with ``feed`` and finish with ``close``; ``done`` turns true once the
+    element was closed, after which further input can be skipped.
+
+    Attributes:
+        found (bool): Whether a ``<pre>`` element was opened.
+        done (bool): Whether the ``<pre>`` element was closed.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found = False
+        self.done = False
+        self._depth = 0
+        self._skip_depth = 0
+        self._pending = []
+        self._strings = []
+
+    @property
+    def text(self) -> str:
+        """The stripped text strings of the element collected so far, joined by spaces."""
+        return " ".join(self._strings)
+
+    def _end_string(self) -> None:
+        string = "".join(self._pending).strip()
+        self._pending = []
+        if string:
+            self._strings.append(string)
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self._depth:
+            self._end_string()
+        if tag == "pre":
+            self.found = True
+            self._depth += 1
+        elif self._depth and tag in NON_TEXT_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if self.done or not self._depth:
+            return
+        self._end_string()
+        if tag in NON_TEXT_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "pre":
+            self._depth -= 1
+            self.done = not self._depth
+
+    def handle_data(self, data):
+        if self._depth and not self.done and not self._skip_depth:
+            self._pending.append(data)
+
+    def handle_comment(self, data):
+        if self._depth and not self.done:
+            self._end_string()
+
+    def handle_decl(self, decl):
+        self.handle_comment(decl)
+
+    def handle_pi(self, data):
+        self.handle_comment(data)
+
+    def unknown_decl(self, data):
+        if self._depth and not self.done:
+            self._end_string()
+            # CDATA sections are text, as in BeautifulSoup; other declarations are not.
+            if data.upper().startswith("CDATA[") and not self._skip_depth:
+                self._pending.append(data[len("CDATA["):])
+                self._end_string()
+
+    def close(self):
+        super().close()
+        # An unclosed element runs to the end of the document.
+        if self._depth and not self.done:
+            self._end_string()
+
+
+def extract_pre_text(chunks) -> str:
+    """
+    Extract the text of the first ``<pre>`` element from HTML given in pieces.
+
+    Args:
+        chunks (Iterable[str]): The decoded HTML, in consecutive pieces of any size.
+    Returns:
+        str: The element's text, or None if the HTML has no ``<pre>`` element.
+    """
+    parser = PreTextExtractor()
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.done:
+            break
+    parser.close()
+    return parser.text if parser.found else None
+
+
+def iter_decoded(byte_chunks, encoding: str = None):
+    """
+    Decode a stream of bytes incrementally, so multi-byte characters may span chunks.
+
+    Args:
+        byte_chunks (Iterable[bytes]): The raw body.
+        encoding (str, optional): The body's charset; UTF-8 when unknown.
+    Yields:
+        str: The decoded pieces; undecodable bytes become U+FFFD.
+    """
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def extract_pre_text_from_response(response, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Extract the ``<pre>`` text of an HTTP response, reading its body as a stream.
+
+    Reading stops at the closing ``</pre>``; the response is closed afterwards.
+
+    Args:
+        response: A ``requests.Response`` (ideally requested with ``stream=True``) or
+            any object with ``iter_content`` and ``encoding``.
+        chunk_size (int): Bytes read at a time.
+    Returns:
+        str: The element's text, or None if the HTML has no ``<pre>`` element.
+    """
+    try:
+        return extract_pre_text(iter_decoded(response.iter_content(chunk_size), response.encoding))
+    finally:
+        response.close()
+
+
+def parse_bill_html(body: bytes, encoding: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Extract the ``<pre>`` text of a downloaded HTML body.
+
+    A module-level function of bytes and strings only, so it can run in a worker process
+    of a ``ProcessPoolExecutor``, keeping CPU-bound parsing off the scraping threads.
+
+    Args:
+        body (bytes): The raw HTML.
+        encoding (str, optional): The body's charset; UTF-8 when unknown.
+        chunk_size (int): Bytes decoded and parsed at a time.
+    Returns:
+        str: The element's text, or None if the HTML has no ``<pre>`` element.
+    """
+    chunks = (body[start:start + chunk_size] for start in range(0, len(body), chunk_size))
+    return extract_pre_text(iter_decoded(chunks, encoding))
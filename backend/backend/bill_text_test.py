@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock
+
+import pytest
+from bs4 import BeautifulSoup
+
+from backend.bill_text import PreTextExtractor, extract_pre_text, extract_pre_text_from_response, iter_decoded
+from backend.text_benchmark import make_bill_html
+
+
+def soup_text(html):
+    content = BeautifulSoup(html, "html.parser").find("pre")
+    return content.get_text(separator=" ", strip=True) if content else None
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_matches_beautifulsoup_on_generated_bills(seed, chunk_size):
+    """
+    Test that the streaming extraction of generated bills matches BeautifulSoup for any chunk size.
+    """
+    html = make_bill_html(20, seed)
+    assert extract_pre_text(chunked(html, chunk_size)) == soup_text(html)
+
+
+@pytest.mark.parametrize("html", [
+    "<pre>a<script>var x = '<b>';</script>b<style>p {}</style>c</pre>",
+    "<pre>a<template>t<b>u</b><script>s</script></template>b</pre>",
+    "<pre>a<!-- comment -->b<![CDATA[ c ]]>d</pre>",
+    "<pre>a<?php echo 1 ?>b<!DOCTYPE html>c</pre>",
+    "<pre>outer<pre>inner</pre>tail</pre>after",
+    "<pre>  unclosed <b>text",
+    "<p>before</p><pre/>inside</pre>",
+    "</b><pre>a</i>b</pre>",
+    "<pre>&nbsp; x &nbsp;</pre>",
+    "<pre>&amp; &lt;x&gt; &sect;&nbsp;1 &#8212; &#x2014; &amp</pre>",
+    "<pre>\n  line one\n\n  line two  \n</pre>",
+])
+def test_matches_beautifulsoup_on_edge_cases(html):
+    """
+    Test that tags, comments, declarations, nesting, unclosed elements and references split strings as BeautifulSoup does.
+    """
+    for size in (1, 3, len(html)):
+        assert extract_pre_text(chunked(html, size)) == soup_text(html)
+
+
+def test_returns_none_without_pre():
+    """
+    Test that a document without a <pre> element has no text, while an empty one has empty text.
+    """
+    assert extract_pre_text(["<html><body>No text</body></html>"]) is None
+    assert extract_pre_text(["<pre></pre>"]) == ""
+
+
+def test_stops_reading_after_pre():
+    """
+    Test that no chunks after the closing </pre> are consumed.
+    """
+    consumed = []
+
+    def chunks():
+        for chunk in ["<html><pre>Bill", " text</pre>", "<p>trailer</p>", "</html>"]:
+            consumed.append(chunk)
+            yield chunk
+
+    assert extract_pre_text(chunks()) == "Bill text"
+    assert consumed == ["<html><pre>Bill", " text</pre>"]
+
+
+def test_ignores_text_after_pre():
+    """
+    Test that later <pre> elements and text fed after the first one closed are ignored.
+    """
+    parser = PreTextExtractor()
+    parser.feed("<pre>first</pre>")
+    assert parser.done
+    parser.feed("<pre>second</pre>")
+    parser.close()
+    assert parser.text == "first"
+
+
+def test_decodes_characters_split_across_chunks():
+    """
+    Test that multi-byte characters split between byte chunks are decoded intact.
+    """
+    body = "<pre>naïve § 1 — “quoted”</pre>".encode("utf-8")
+    chunks = [body[i:i + 1] for i in range(len(body))]
+    assert "".join(iter_decoded(chunks, "utf-8")) == body.decode("utf-8")
+    assert extract_pre_text(iter_decoded(chunks, None)) == "naïve § 1 — “quoted”"
+    assert "".join(iter_decoded([b"a\xff"], "utf-8")) == "a�"
+
+
+def test_extracts_from_response_and_closes_it():
+    """
+    Test that a response body is read in chunks, decoded with its encoding, and the response closed.
+    """
+    body = "<html><pre>Caf\xe9 text</pre></html>".encode("latin-1")
+    response = MagicMock()
+    response.encoding = "ISO-8859-1"
+    response.iter_content.return_value = iter([body[:13], body[13:]])
+    assert extract_pre_text_from_response(response, chunk_size=13) == "Caf\xe9 text"
+    response.iter_content.assert_called_once_with(13)
+    response.close.assert_called_once()
+
+    response = MagicMock()
+    response.iter_content.side_effect = IOError("connection reset")
+    with pytest.raises(IOError):
+        extract_pre_text_from_response(response)
+    response.close.assert_called_once()
@@ -1,26 +1,49 @@
+import os
+import threading
+import multiprocessing
 import pytest
 import json
-from datetime import datetime, timezone
-from backend.app import app, db, Bill, Vote, serialize_bill, User, default_demographics, build_bill_search_entries
+from unittest.mock import patch, MagicMock
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.pool import StaticPool
+from flask_jwt_extended import create_access_token
+from backend.app import (
+    app, CongressionalScraper, db, Bill, Vote, serialize_bill, User, default_demographics, build_bill_search_entries,
+    fulltext_search_available, fulltext_search_query, migrate_fulltext_search, hydrate_bills,
+    BILL_PROJECTIONS, SummaryJob, SummaryCacheEntry, run_summary_jobs, preview_summary_jobs, cache_summaries,
+    BillText, ScrapeFailure, ScrapeTracking, backfill_congress, backfill_page_size, retry_scrape_failures,
+    sync_changed_bills, congress_for, migrate_scrape_tracking, VoteCounter, migrate_vote_counters, UserVote,
+    migrate_user_votes, migrate_summary_hashes, merge_duplicate_bills, migrate_detail_validators, SEARCH_INDEX_TYPES,
+    get_search_index, TfidfSearchIndex
+)
+from backend.search_index import MANIFEST_NAME, IndexFormatError
+from backend.bill_text import parse_bill_html
+from backend.congress_client import CongressApiClient
+from backend.summarizer import StubSummaryClient, CHUNK_PROMPT_VERSION, summary_cache_key
 
 @pytest.fixture(autouse=True, scope="module")
 def patch_user_init():
     original_init = User.__init__
     def new_init(self, *args, **kwargs):
         if "voted_bill" in kwargs:
-            kwargs["voted_bills"] = kwargs.pop("voted_bill")
+            kwargs["legacy_voted_bills"] = kwargs.pop("voted_bill")
         original_init(self, *args, **kwargs)
     User.__init__ = new_init
     yield
     User.__init__ = original_init
 
 @pytest.fixture(scope="module")
-def client():
+def client(tmp_path_factory):
     """
     Configure the Flask application for testing.
     """
     app.config["TESTING"] = True
     app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///test_bills.db"
+    app.config["SEARCH_INDEX_PATH"] = str(tmp_path_factory.mktemp("search") / "search_index")
     with app.app_context():
         db.drop_all()
         db.create_all()
@@ -132,22 +155,43 @@ def populate_db(client):
             db.session.add_all([bill1, bill2])
             db.session.commit()
 
+@contextmanager
+def count_queries():
+    """
+    Record the SQL statements executed while the block runs.
+    """
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+_vote_bill_numbers = iter(range(789, 10**6))
+
 def create_test_bill_for_vote():
     """
     Helper to create a fresh Bill for vote tests.
+
+    Each bill gets its own number, since (congress, bill_type, bill_number) is unique.
     """
     with app.app_context():
+        number = str(next(_vote_bill_numbers))
         bill = Bill(
             congress=118,
             bill_type="H.R.",
-            bill_number="789",
+            bill_number=number,
             title="Vote Test Bill",
             latest_action_date=datetime.now(timezone.utc),
             origin_chamber="House",
             sponsor="Vote Tester",
             latest_action={"action": "Test action"},
             update_date=datetime.now(timezone.utc),
-            url="http://api.congress.gov/bill/118/H.R./789",
+            url=f"http://api.congress.gov/bill/118/H.R./{number}",
             text_preview="Preview text vote",
             full_text="Full text vote",
             ai_summary="Summary vote",
@@ -160,7 +204,8 @@ def create_test_bill_for_vote():
 
 def test_serialize_bill():
     """
-    Verify that serialize_bill returns all expected keys from a Bill instance.
+    Verify that serialize_bill returns the card fields by default and the bill text
+    only for the full projection.
     """
     with app.app_context():
         bill = Bill.query.first()
@@ -168,10 +213,35 @@ def test_serialize_bill():
         expected_keys = [
             "_id", "congress", "bill_type", "bill_number", "title", "latest_action_date",
             "origin_chamber", "sponsor", "latest_action", "update_date", "url",
-            "text_preview", "full_text", "ai_summary", "vote_count", "created_at", "updated_at"
+            "ai_summary", "vote_count", "created_at", "updated_at"
         ]
         for key in expected_keys:
             assert key in serialized
+        assert "full_text" not in serialized and "text_preview" not in serialized
+
+        full = serialize_bill(bill, BILL_PROJECTIONS["full"])
+        assert set(full) == set(expected_keys) | {"text_preview", "full_text", "upvote_count", "downvote_count"}
+
+def test_list_endpoints_field_selection(client):
+    """
+    Test that list endpoints omit the bill text, honor ?fields= and never return full text.
+    """
+    for url in ("/api/bills/trending", "/api/search?keyword=Test", "/api/search_tfidf?keyword=Test"):
+        data = client.get(url).get_json()
+        assert data and all("full_text" not in bill and "text_preview" not in bill for bill in data)
+
+    response = client.get("/api/bills", query_string={"fields": "title,vote_count"})
+    assert response.status_code == 200
+    for bill in response.get_json()["bills"]:
+        assert set(bill) == {"_id", "title", "vote_count"}
+
+    response = client.get("/api/bills/trending", query_string={"fields": "full"})
+    assert all("text_preview" in bill and "full_text" not in bill for bill in response.get_json())
+
+    for url in ("/api/bills", "/api/bills/trending", "/api/search", "/api/search_tfidf"):
+        response = client.get(url, query_string={"keyword": "Test", "fields": "title,full_text"})
+        assert response.status_code == 400
+        assert "full_text" in response.get_json()["error"]
 
 def test_get_bills_pagination(client):
     """
@@ -191,6 +261,47 @@ def test_get_bills_pagination(client):
         if bill.get("origin_chamber"):
             assert bill["origin_chamber"].lower() == "house"
 
+def test_get_bills_cursor_pagination(client):
+    """
+    Test that walking /api/bills with cursors visits every bill once in sort order,
+    including ties on the sort column.
+    """
+    create_test_bill_for_vote()
+    create_test_bill_for_vote()
+    with app.app_context():
+        expected = [str(bill.id) for bill in Bill.query.order_by(Bill.vote_count.desc(), Bill.id.desc())]
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        response = client.get("/api/bills", query_string={
+            "cursor": cursor, "sort": "vote_count", "per_page": 2, "include_total": "true"
+        })
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["pagination"]["approximate_total"] == len(expected)
+        seen.extend(bill["_id"] for bill in data["bills"])
+        cursor = data["pagination"]["next_cursor"]
+    assert seen == expected
+
+    response = client.get("/api/bills", query_string={"cursor": "", "sort": "created_at", "sort_dir": 1, "per_page": 1})
+    cursor = response.get_json()["pagination"]["next_cursor"]
+    response = client.get("/api/bills", query_string={"cursor": cursor, "sort": "created_at", "sort_dir": 1, "per_page": 1})
+    assert response.status_code == 200
+    assert "approximate_total" not in response.get_json()["pagination"]
+
+def test_get_bills_invalid_cursor(client):
+    """
+    Test that malformed cursors, cursors from another sort order and unsupported sort
+    columns are rejected.
+    """
+    response = client.get("/api/bills", query_string={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    cursor = client.get("/api/bills", query_string={"cursor": "", "per_page": 1}).get_json()["pagination"]["next_cursor"]
+    response = client.get("/api/bills", query_string={"cursor": cursor, "sort": "vote_count"})
+    assert response.status_code == 400
+    response = client.get("/api/bills", query_string={"cursor": "", "sort": "sponsor"})
+    assert response.status_code == 400
+
 def test_get_trending_bills(client):
     """
     Test that the /api/bills/trending endpoint returns bills sorted by vote_count
@@ -233,6 +344,67 @@ def test_search_bills(client):
     assert isinstance(data, list)
     assert any("Test Bill One" in bill["title"] for bill in data)
 
+def test_search_falls_back_to_ilike(client):
+    """
+    Test that full-text search is disabled on SQLite and the migration is a no-op.
+    """
+    assert not migrate_fulltext_search()
+    assert not fulltext_search_available()
+    response = client.get("/api/search", query_string={"keyword": "Bill Tw"})
+    assert response.status_code == 200
+    assert any(bill["title"] == "Test Bill Two" for bill in response.get_json())
+
+def test_fulltext_search_query(client):
+    """
+    Test that the PostgreSQL query matches the search vector and ranks with ts_rank.
+    """
+    sql = str(fulltext_search_query("clean water").statement.compile(dialect=postgresql.dialect()))
+    assert "bills.search_vector @@ websearch_to_tsquery" in sql
+    assert "ORDER BY ts_rank(bills.search_vector, websearch_to_tsquery" in sql
+
+@pytest.mark.parametrize("url", ["/api/search", "/api/search_tfidf"])
+def test_search_filters_and_sort(client, url):
+    """
+    Test that chamber, date range and sort parameters are applied by the search endpoints.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+    response = client.get(url, query_string={"keyword": "Test Bill", "chamber": "Senate"})
+    assert [bill["title"] for bill in response.get_json()] == ["Test Bill Two"]
+
+    response = client.get(url, query_string={
+        "keyword": "Test Bill", "start_date": "2023-01-01", "end_date": "2023-01-01"
+    })
+    assert [bill["title"] for bill in response.get_json()] == ["Test Bill One"]
+
+    response = client.get(url, query_string={
+        "keyword": "Test Bill", "end_date": "2023-12-31", "sort": "oldest"
+    })
+    assert [bill["title"] for bill in response.get_json()] == ["Test Bill One", "Test Bill Two"]
+    response = client.get(url, query_string={"keyword": "Test Bill", "end_date": "2023-12-31", "sort": "most-votes"})
+    assert [bill["title"] for bill in response.get_json()] == ["Test Bill Two", "Test Bill One"]
+
+    # A bill scraped today is in today's range as well as in that of its older latest action.
+    bill_id = create_test_bill_for_vote()
+    with app.app_context():
+        bill = db.session.get(Bill, bill_id)
+        bill.title, bill.latest_action_date = "Rescraped Bill", datetime(2020, 6, 1)
+        db.session.commit()
+        build_bill_search_entries([bill_id])
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    for start_date in [today, "2020-06-01"]:
+        response = client.get(url, query_string={"keyword": "Rescraped", "start_date": start_date, "end_date": start_date})
+        assert [bill["title"] for bill in response.get_json()] == ["Rescraped Bill"]
+    response = client.get(url, query_string={"keyword": "Rescraped", "end_date": "2019-12-31"})
+    assert response.get_json() == []
+    with app.app_context():
+        db.session.delete(db.session.get(Bill, bill_id))
+        db.session.commit()
+        build_bill_search_entries()
+
+    assert client.get(url, query_string={"keyword": "Test", "sort": "title"}).status_code == 400
+    assert client.get(url, query_string={"keyword": "Test", "start_date": "01/01/2023"}).status_code == 400
+
 def test_search_tfidf(client):
     """
     Test that the /api/search_tfidf endpoint returns bills matching the provided keyword
@@ -246,6 +418,812 @@ def test_search_tfidf(client):
     assert isinstance(data, list)
     assert any("Test Bill One" in bill["title"] for bill in data)
 
+def test_search_tfidf_uses_persisted_index(client):
+    """
+    Test that building the search entries writes the TF–IDF index to disk and that
+    searches are answered from it without refitting.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+    assert os.path.exists(os.path.join(app.config["SEARCH_INDEX_PATH"], "tfidf", MANIFEST_NAME))
+
+    with patch("backend.app.rebuild_search_index") as rebuild:
+        response = client.get("/api/search_tfidf", query_string={"keyword": "Test Bill One"})
+        assert response.status_code == 200
+        assert rebuild.call_count == 0
+    data = response.get_json()
+    assert any("Test Bill One" in bill["title"] for bill in data)
+
+def test_search_index_updates_keep_other_processes_updates(client):
+    """
+    Test that an incremental update starts from the latest saved indexes, so an
+    update saved meanwhile by another process is kept rather than overwritten.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+        for mode, index_type in SEARCH_INDEX_TYPES.items():
+            path = os.path.join(app.config["SEARCH_INDEX_PATH"], mode)
+            index_type.load(path).copy().upsert([999999], [{"title": "Zebra crossing safety"}]).save(path)
+        bill = Bill.query.filter_by(title="Test Bill One").first()
+        build_bill_search_entries([bill.id])
+        for mode, index_type in SEARCH_INDEX_TYPES.items():
+            index = index_type.load(os.path.join(app.config["SEARCH_INDEX_PATH"], mode))
+            assert [bill_id for bill_id, _ in index.search("zebra")] == [999999]
+            assert bill.id in [bill_id for bill_id, _ in index.search("test bill one")]
+        build_bill_search_entries()
+
+def test_search_index_replaced_while_loading_is_read_again(client):
+    """
+    Test that an index whose files change while a worker loads it is read again
+    instead of being rebuilt inside the request.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+        path = os.path.join(app.config["SEARCH_INDEX_PATH"], "tfidf")
+        load = TfidfSearchIndex.load
+        TfidfSearchIndex.load(path).copy().upsert([999998], [{"title": "Saved by another worker"}]).save(path)
+        attempts = []
+        def replaced_while_loading(path, previous=None):
+            attempts.append(path)
+            if len(attempts) == 1:
+                load(path).copy().refresh().save(path)
+                raise IndexFormatError("segment merged away")
+            return load(path, previous=previous)
+
+        with patch.object(TfidfSearchIndex, "load", side_effect=replaced_while_loading), \
+                patch("backend.app.rebuild_search_index") as rebuild:
+            index = get_search_index("tfidf")
+        assert len(attempts) == 2
+        assert rebuild.call_count == 0
+        assert [bill_id for bill_id, _ in index.search("another worker")] == [999998]
+        build_bill_search_entries()
+
+def test_search_bm25_mode(client):
+    """
+    Test that the BM25 search mode ranks bills from the inverted index and that
+    unknown modes are rejected.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+    response = client.get("/api/search_tfidf", query_string={"keyword": "Test Bill One", "mode": "bm25"})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert any("Test Bill One" in bill["title"] for bill in data)
+
+    response = client.get("/api/search_tfidf", query_string={"keyword": "Test", "mode": "fuzzy"})
+    assert response.status_code == 400
+    assert "Invalid search mode" in response.get_json()["error"]
+
+def test_search_tfidf_cache(client):
+    """
+    Test that repeated searches are answered from the cache until the index changes.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+    before = client.get("/api/search_tfidf/cache").get_json()
+    client.get("/api/search_tfidf", query_string={"keyword": "Test Bill One"})
+    with patch("backend.app.TfidfSearchIndex.search") as search:
+        response = client.get("/api/search_tfidf", query_string={"keyword": "one bill TEST"})
+        assert search.call_count == 0
+    assert any(bill["title"] == "Test Bill One" for bill in response.get_json())
+    after = client.get("/api/search_tfidf/cache").get_json()
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"] + 1
+
+    with app.app_context():
+        bill = Bill.query.filter_by(title="Test Bill One").first()
+        build_bill_search_entries([bill.id])
+    client.get("/api/search_tfidf", query_string={"keyword": "Test Bill One"})
+    assert client.get("/api/search_tfidf/cache").get_json()["misses"] == after["misses"] + 1
+
+def test_search_tfidf_sorted_results_are_not_cached(client):
+    """
+    Test that searches sorted by date or votes order only the most relevant matches
+    and are not cached, since their order changes without the index.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+    before = client.get("/api/search_tfidf/cache").get_json()
+    query = {"keyword": "Test Bill", "sort": "oldest"}
+    with patch.dict(app.config, {"SEARCH_SORT_CANDIDATES": 1}):
+        with patch.object(TfidfSearchIndex, "search", autospec=True, side_effect=TfidfSearchIndex.search) as search:
+            data = client.get("/api/search_tfidf", query_string=query).get_json()
+            data = client.get("/api/search_tfidf", query_string=query).get_json()
+        assert search.call_count == 2
+        assert all(call.kwargs["top_k"] == 1 for call in search.call_args_list)
+    assert len(data) == 1
+    after = client.get("/api/search_tfidf/cache").get_json()
+    assert (after["hits"], after["misses"], after["entries"]) == (before["hits"], before["misses"], before["entries"])
+
+def test_search_tfidf_filters_best_matches(client):
+    """
+    Test that filtered searches rank without the filters and apply them to the best
+    matches, ranking more matches until enough of them pass.
+    """
+    for _ in range(3):
+        create_test_bill_for_vote()
+    with app.app_context():
+        build_bill_search_entries()
+    # The House bills created for votes match better than the only Senate bill.
+    query = {"keyword": "Test Bill vote", "chamber": "Senate", "sort": "oldest"}
+    with patch.dict(app.config, {"SEARCH_SORT_CANDIDATES": 1}), \
+            patch("backend.app.SEARCH_FILTER_OVERFETCH", 2), \
+            patch.object(TfidfSearchIndex, "search", autospec=True, side_effect=TfidfSearchIndex.search) as search:
+        data = client.get("/api/search_tfidf", query_string=query).get_json()
+    assert [bill["title"] for bill in data] == ["Test Bill Two"]
+    assert all(call.kwargs.get("bill_ids") is None for call in search.call_args_list)
+    top_ks = [call.kwargs["top_k"] for call in search.call_args_list]
+    assert len(top_ks) > 1 and top_ks == [2 ** n for n in range(1, len(top_ks) + 1)]
+
+def test_search_tfidf_incremental_update(client):
+    """
+    Test that refreshing the search entries of specific bills makes their new
+    content searchable without rebuilding the whole index.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+        bill = Bill.query.filter_by(title="Test Bill Two").first()
+        bill.ai_summary = "Wildfire mitigation grants"
+        db.session.commit()
+        with patch("backend.app.rebuild_search_index") as rebuild:
+            build_bill_search_entries([bill.id])
+            assert rebuild.call_count == 0
+
+    for mode in ("tfidf", "bm25"):
+        response = client.get("/api/search_tfidf", query_string={"keyword": "wildfire", "mode": mode})
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [bill["title"] for bill in data] == ["Test Bill Two"]
+
+    with app.app_context():
+        bill = Bill.query.filter_by(title="Test Bill Two").first()
+        bill.ai_summary = "Summary two"
+        db.session.commit()
+        build_bill_search_entries([bill.id])
+
+def test_hydrate_bills_preserves_order(client):
+    """
+    Test that bills are loaded in the requested order with one query, skipping unknown ids.
+    """
+    with app.app_context():
+        ids = [bill.id for bill in Bill.query.order_by(Bill.id).all()]
+        with count_queries() as statements:
+            bills = hydrate_bills(list(reversed(ids)) + [999999])
+        assert [bill.id for bill in bills] == list(reversed(ids))
+        assert len(statements) == 1
+
+def test_search_endpoints_load_bills_in_one_query(client):
+    """
+    Guard against N+1 loading: each search request reads the bills table once.
+    """
+    with app.app_context():
+        build_bill_search_entries()
+    for mode in ("tfidf", "bm25"):
+        with count_queries() as statements:
+            response = client.get("/api/search_tfidf", query_string={"keyword": "Test Bill", "mode": mode})
+        assert len(response.get_json()) >= 2
+        assert len([s for s in statements if "FROM bills" in s]) == 1
+    with count_queries() as statements:
+        response = client.get("/api/search", query_string={"keyword": "Test Bill"})
+    assert len(response.get_json()) >= 2
+    assert len([s for s in statements if "FROM bills" in s]) == 1
+
+def test_process_bills_concurrently(client):
+    """
+    Test that concurrent processing prepares bills on worker threads and stores the
+    prepared ones together in a single batch.
+    """
+    calls = []
+    barrier = threading.Barrier(3)
+    def prepare_bill(self, bill_data, existing):
+        barrier.wait(timeout=5)
+        calls.append(threading.get_ident())
+        return bill_data if bill_data["number"] % 2 == 0 else None
+    batches = []
+    def store_bills(self, rows, existing):
+        batches.append((threading.get_ident(), rows))
+        return len(rows)
+
+    with app.app_context(), \
+            patch.object(CongressionalScraper, "prepare_bill", prepare_bill), \
+            patch.object(CongressionalScraper, "store_bills", store_bills):
+        inserted = CongressionalScraper().process_bills([{"number": n} for n in range(3)], workers=3)
+    assert inserted == 2
+    assert len(set(calls)) == 3
+    assert batches == [(threading.get_ident(), [{"number": 0}, {"number": 2}])]
+
+def scraped_row(number, **values):
+    """Build the column values ``prepare_bill`` would produce for a scraped bill."""
+    now = datetime.now(timezone.utc)
+    row = {
+        "congress": 118, "bill_type": "HR", "bill_number": number, "title": f"Upserted {number}",
+        "latest_action_date": now, "origin_chamber": "House", "sponsor": "Rep. Batch",
+        "latest_action": {"text": "Introduced"}, "update_date": now,
+        "url": f"https://www.congress.gov/bill/118th-congress/hr/{number}",
+        "text_preview": "Preview", "full_text": "Full text", "ai_summary": None,
+        "vote_count": 0, "created_at": now,
+    }
+    row.update(values)
+    return row
+
+def test_store_bills_upserts_batch(client):
+    """
+    Test that a batch of bills is written with one INSERT ... ON CONFLICT statement
+    that keeps existing summaries and full texts, and that a bad row is isolated
+    from the rest of its batch.
+    """
+    with app.app_context():
+        scraper = CongressionalScraper()
+        assert scraper.store_bills([scraped_row("8001", ai_summary="Kept summary"), scraped_row("8002")], {}) == 2
+
+        existing = scraper._existing_bills([{"congress": 118, "type": "HR", "number": n} for n in ("8001", "8002", "8003")])
+        assert existing == {(118, "HR", "8001"): True, (118, "HR", "8002"): False}
+        rows = [
+            scraped_row("8001", title="Renamed", ai_summary="New summary", full_text=""),
+            scraped_row("8002", ai_summary="First summary"),
+            scraped_row("8003"),
+        ]
+        with count_queries() as statements:
+            assert scraper.store_bills(rows, existing) == 1
+        assert len([s for s in statements if s.lstrip().upper().startswith("INSERT INTO BILLS")]) == 1
+
+        bills = {bill.bill_number: bill for bill in Bill.query.filter(Bill.bill_number.in_(["8001", "8002", "8003"]))}
+        assert bills["8001"].title == "Renamed"
+        assert bills["8001"].ai_summary == "Kept summary"
+        assert bills["8001"].full_text == "Full text"
+        assert bills["8002"].ai_summary == "First summary"
+        assert len(bills) == 3
+
+        # A row violating a constraint fails alone; the rest of the batch is stored.
+        assert scraper.store_bills([scraped_row("8004", title=None), scraped_row("8005")], {}) == 1
+        assert Bill.query.filter_by(bill_number="8004").count() == 0
+        assert Bill.query.filter_by(bill_number="8005").count() == 1
+
+        SummaryJob.query.delete()
+        Bill.query.filter(Bill.bill_number.like("800%")).delete(synchronize_session=False)
+        db.session.commit()
+
+SCRAPED_BILL = {
+    "congress": 118, "type": "HR", "number": "9001", "title": "Scraped Bill",
+    "originChamber": "House", "updateDate": "2024-03-01",
+    "latestAction": {"actionDate": "2024-02-28", "text": "Introduced"},
+    "url": "https://api.congress.gov/v3/bill/118/hr/9001",
+}
+
+def fake_congress_api(url, params=None, headers=None, **kwargs):
+    """
+    Answer Congress API requests made by the scraper with canned responses.
+
+    Bill details carry an ETag and are answered with 304 when it is sent back.
+    """
+    response = MagicMock(status_code=200, headers={})
+    if url.endswith("/text"):
+        response.json.return_value = {"textVersions": [{
+            "type": "Introduced in House", "date": "2024-02-28T00:00:00Z",
+            "formats": [{"type": "Formatted Text", "url": "https://www.congress.gov/118/bills/hr9001.htm"}],
+        }]}
+    elif url.endswith(".htm"):
+        html = ("<html><body><pre>" + "Be it enacted " * 100 + "</pre></body></html>").encode("utf-8")
+        response.encoding = "utf-8"
+        response.iter_content.side_effect = lambda size: (html[i:i + size] for i in range(0, len(html), size))
+    elif (headers or {}).get("If-None-Match") == '"v1"':
+        response.status_code = 304
+    else:
+        response.headers = {"ETag": '"v1"'}
+        response.json.return_value = {"bill": {**SCRAPED_BILL, "sponsor": {"name": "Rep. Scraper"}}}
+    return response
+
+def test_process_bill_fetches_text_once(client):
+    """
+    Test that processing a bill downloads its text index and HTML once, stores both
+    the full text and the preview derived from it and queues its summary, and that
+    reprocessing an unchanged bill stops at the 304 response.
+    """
+    api = CongressApiClient()
+    with app.app_context(), \
+            patch.object(api.session, "get", side_effect=fake_congress_api) as get, \
+            patch("backend.summarizer.openai.ChatCompletion.create") as create:
+        scraper = CongressionalScraper(client=api)
+        assert scraper.process_bill(SCRAPED_BILL)
+        urls = [call.args[0] for call in get.call_args_list]
+        assert len([url for url in urls if url.endswith("/text")]) == 1
+        assert len([url for url in urls if url.endswith(".htm")]) == 1
+
+        bill = Bill.query.filter_by(bill_number="9001").one()
+        assert bill.full_text == ("Be it enacted " * 100).strip()
+        assert bill.text_preview == bill.full_text[:1000] + "..."
+        assert bill.ai_summary is None
+        assert scraper.changed_bill_ids == {bill.id}
+        assert SummaryJob.query.filter_by(bill_id=bill.id).one().status == "pending"
+        create.assert_not_called()
+
+        get.reset_mock()
+        rescraper = CongressionalScraper(client=api)
+        assert not rescraper.process_bill(SCRAPED_BILL)
+        assert [call.args[0] for call in get.call_args_list] == [SCRAPED_BILL["url"]]
+        assert rescraper.changed_bill_ids == set()
+
+        SummaryJob.query.filter_by(bill_id=bill.id).delete()
+        db.session.delete(bill)
+        db.session.commit()
+
+def test_detail_validators_are_stored_with_the_bill(client):
+    """
+    Test that the ETag of a bill's details is stored with the bill, so a fresh client,
+    as in the next CLI run, revalidates the details and skips the unchanged bill.
+    """
+    with app.app_context():
+        api = CongressApiClient()
+        with patch.object(api.session, "get", side_effect=fake_congress_api):
+            assert CongressionalScraper(client=api).process_bill(SCRAPED_BILL)
+        bill = Bill.query.filter_by(bill_number="9001").one()
+        assert bill.detail_etag == '"v1"'
+
+        fresh = CongressApiClient()
+        with patch.object(fresh.session, "get", side_effect=fake_congress_api) as get:
+            scraper = CongressionalScraper(client=fresh)
+            assert not scraper.process_bill(SCRAPED_BILL)
+        assert get.call_count == 1
+        assert get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert scraper.changed_bill_ids == set()
+        assert not migrate_detail_validators()
+
+        SummaryJob.query.filter_by(bill_id=bill.id).delete()
+        db.session.delete(bill)
+        db.session.commit()
+
+def test_bill_without_text_is_fetched_again(client):
+    """
+    Test that when a bill's text cannot be retrieved or the bill cannot be stored, the
+    ETag of its details is dropped, so the next scrape fetches it in full instead of
+    skipping it on a 304.
+    """
+    api = CongressApiClient()
+    text_available = False
+    def flaky_text(url, params=None, headers=None, **kwargs):
+        if url.endswith(".htm") and not text_available:
+            return MagicMock(status_code=404, headers={})
+        return fake_congress_api(url, params, headers, **kwargs)
+
+    with app.app_context(), patch.object(api.session, "get", side_effect=flaky_text) as get:
+        assert CongressionalScraper(client=api).process_bill(SCRAPED_BILL)
+        bill = Bill.query.filter_by(bill_number="9001").one()
+        assert not bill.full_text and bill.detail_etag is None
+        assert api.validators.get(SCRAPED_BILL["url"]) is None
+
+        # The stored ETag survives a successful fetch, but not a failed write.
+        text_available = True
+        with patch.object(CongressionalScraper, "_upsert_bills", side_effect=RuntimeError("database down")):
+            scraper = CongressionalScraper(client=api)
+            scraper.process_bill(SCRAPED_BILL)
+        assert list(scraper.take_failures()) == [(118, "HR", "9001")]
+        assert api.validators.get(SCRAPED_BILL["url"]) is None
+
+        get.reset_mock()
+        CongressionalScraper(client=api).process_bill(SCRAPED_BILL)
+        assert "If-None-Match" not in (get.call_args_list[0].kwargs.get("headers") or {})
+        db.session.refresh(bill)
+        assert bill.full_text == ("Be it enacted " * 100).strip()
+        assert api.validators.get(SCRAPED_BILL["url"])["etag"] == '"v1"'
+
+        SummaryJob.query.filter_by(bill_id=bill.id).delete()
+        db.session.delete(bill)
+        db.session.commit()
+
+def test_process_bills_parses_in_process_pool(client):
+    """
+    Test that with a parse pool, bill texts are downloaded on the fetching threads,
+    parsed in worker processes and written in batches, and that a bill whose text
+    fails to parse is recorded as a failure without holding back the others.
+    """
+    api = CongressApiClient()
+    bills = [{**SCRAPED_BILL, "number": str(n), "url": f"https://api.congress.gov/v3/bill/118/hr/{n}"}
+             for n in range(9101, 9106)]
+    batches = []
+    original_store = CongressionalScraper.store_bills
+    def store_bills(self, rows, existing):
+        batches.append([row["bill_number"] for row in rows])
+        return original_store(self, rows, existing)
+
+    with app.app_context(), \
+            ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as pool, \
+            patch.object(api.session, "get", side_effect=fake_congress_api) as get, \
+            patch.object(CongressionalScraper, "store_bills", store_bills):
+        submitted = []
+        def submit(fn, *args):
+            submitted.append(fn)
+            if len(submitted) == 3:
+                future = Future()
+                future.set_exception(RuntimeError("worker died"))
+                return future
+            return ProcessPoolExecutor.submit(pool, fn, *args)
+        pool.submit = submit
+
+        scraper = CongressionalScraper(client=api, parse_pool=pool)
+        assert scraper.process_bills(bills, workers=3, batch_size=2) == 4
+        assert submitted == [parse_bill_html] * 5
+        assert len([call for call in get.call_args_list if call.args[0].endswith(".htm")]) == 5
+        assert batches == [["9101", "9102"], ["9104", "9105"]]
+        failures = scraper.take_failures()
+        assert list(failures) == [(118, "HR", "9103")]
+        assert failures[(118, "HR", "9103")]["bill_data"] == bills[2]
+
+        stored = Bill.query.filter(Bill.bill_number.in_([bill["number"] for bill in bills])).all()
+        assert sorted(bill.bill_number for bill in stored) == ["9101", "9102", "9104", "9105"]
+        assert all(bill.full_text == ("Be it enacted " * 100).strip() for bill in stored)
+        assert all(bill.text_preview == bill.full_text[:1000] + "..." for bill in stored)
+
+        SummaryJob.query.filter(SummaryJob.bill_id.in_([bill.id for bill in stored])).delete(synchronize_session=False)
+        for bill in stored:
+            db.session.delete(bill)
+        db.session.commit()
+
+class FlakySummaryClient(StubSummaryClient):
+    """Stub model that fails the first ``failures`` calls for each text."""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self.seen = {}
+
+    def summarize(self, text, prompt=None):
+        self.seen[text] = self.seen.get(text, 0) + 1
+        if self.seen[text] <= self.failures:
+            raise RuntimeError("model unavailable")
+        return super().summarize(text)
+
+def test_run_summary_jobs(client):
+    """
+    Test that the summary queue fills in queued summaries concurrently, retries
+    failed jobs with backoff, gives up after the maximum attempts and leaves
+    existing summaries alone.
+    """
+    with app.app_context():
+        scraper = CongressionalScraper()
+        rows = [scraped_row(f"710{n}", text_preview=f"Bill {n} does things. It costs money. It ends.", full_text="")
+                for n in range(4)]
+        rows.append(scraped_row("7104", ai_summary="Written earlier"))
+        scraper.store_bills(rows, {})
+        bill_ids = {bill.bill_number: bill.id for bill in Bill.query.filter(Bill.bill_number.like("710%"))}
+        jobs = SummaryJob.query.filter(SummaryJob.bill_id.in_(bill_ids.values())).all()
+        assert {job.bill_id for job in jobs} == {bill_ids[f"710{n}"] for n in range(4)}
+
+        threads = set()
+        stub = StubSummaryClient(sentences=2)
+        original = stub.summarize
+        barrier = threading.Barrier(2)
+        def summarize(text):
+            barrier.wait(timeout=5)
+            threads.add(threading.get_ident())
+            return original(text)
+        stub.summarize = summarize
+        result = run_summary_jobs(client=stub, workers=2, limit=2, batch_size=2)
+        assert len(result["summarized"]) == 2
+        assert len(threads) == 2
+        summarized = db.session.get(Bill, result["summarized"][0])
+        db.session.refresh(summarized)
+        assert summarized.ai_summary.endswith("does things. It costs money.")
+
+        with patch("backend.app.SUMMARY_MAX_ATTEMPTS", 2):
+            result = run_summary_jobs(client=FlakySummaryClient(failures=5))
+            assert result == {"summarized": [], "cached": 0, "retrying": 2, "failed": 0}
+            retrying = SummaryJob.query.filter_by(status="pending").all()
+            assert all(job.attempts == 1 and job.last_error == "model unavailable" for job in retrying)
+            # Not due yet, so a second run leaves them alone.
+            assert run_summary_jobs(client=StubSummaryClient())["summarized"] == []
+
+            for job in retrying:
+                job.next_attempt_at = datetime(2000, 1, 1)
+            db.session.commit()
+            assert run_summary_jobs(client=FlakySummaryClient(failures=5)) == {
+                "summarized": [], "cached": 0, "retrying": 0, "failed": 2
+            }
+
+        assert db.session.get(Bill, bill_ids["7104"]).ai_summary == "Written earlier"
+        SummaryJob.query.delete()
+        SummaryCacheEntry.query.delete()
+        Bill.query.filter(Bill.bill_number.like("710%")).delete(synchronize_session=False)
+        db.session.commit()
+
+def test_stub_summaries_are_a_dry_run(client):
+    """
+    Test that summarizing with the stub model writes nothing: the jobs stay queued and
+    neither the bills nor the summary cache receive the stub's summaries.
+    """
+    with app.app_context():
+        CongressionalScraper().store_bills(
+            [scraped_row("7500", text_preview="Bill does things. It costs money. It ends.", full_text="")], {}
+        )
+        bill = Bill.query.filter_by(bill_number="7500").one()
+
+        result = preview_summary_jobs(StubSummaryClient())
+        assert bill.id in result["summarized"] and result["failed"] == 0
+        output = app.test_cli_runner().invoke(args=["summarize-bills", "--stub"]).output
+        assert "nothing was written" in output
+
+        db.session.refresh(bill)
+        assert bill.ai_summary is None and bill.summary_hash is None
+        job = SummaryJob.query.filter_by(bill_id=bill.id).one()
+        assert (job.status, job.attempts) == ("pending", 0)
+        assert SummaryCacheEntry.query.count() == 0
+
+        SummaryJob.query.delete()
+        db.session.delete(bill)
+        db.session.commit()
+
+def test_changed_text_is_summarized_again(client):
+    """
+    Test that storing a bill whose text changed queues a new summary, which replaces
+    the summary of the old text, while summaries written by hand are kept.
+    """
+    stub = StubSummaryClient(sentences=1)
+    with app.app_context(), patch("backend.app.summary_client", stub):
+        scraper = CongressionalScraper()
+        scraper.store_bills([scraped_row("7401", text_preview="The original text. It is short.", full_text=""),
+                             scraped_row("7402", ai_summary="Written by hand")], {})
+        run_summary_jobs(client=stub)
+        bill = Bill.query.filter_by(bill_number="7401").one()
+        assert bill.ai_summary == "The original text."
+        assert bill.summary_hash == summary_cache_key("The original text. It is short.", "stub")
+
+        # Storing the same text again queues nothing.
+        scraper.store_bills([scraped_row("7401", text_preview="The original text. It is short.", full_text="")], {})
+        assert SummaryJob.query.filter_by(bill_id=bill.id, status="pending").count() == 0
+
+        scraper.store_bills([scraped_row("7401", text_preview="The amended text. It is short.", full_text=""),
+                             scraped_row("7402", text_preview="A new text.", full_text="")], {})
+        db.session.refresh(bill)
+        assert bill.ai_summary == "The original text."
+        assert SummaryJob.query.filter_by(bill_id=bill.id, status="pending").count() == 1
+        assert run_summary_jobs(client=stub)["summarized"] == [bill.id]
+        db.session.refresh(bill)
+        assert bill.ai_summary == "The amended text."
+        assert Bill.query.filter_by(bill_number="7402").one().ai_summary == "Written by hand"
+        assert migrate_summary_hashes() == 0
+
+        SummaryJob.query.delete()
+        SummaryCacheEntry.query.delete()
+        Bill.query.filter(Bill.bill_number.like("740%")).delete(synchronize_session=False)
+        db.session.commit()
+
+def test_summary_cache_deduplicates_texts(client):
+    """
+    Test that bills sharing a text (up to whitespace) are summarized with one model
+    call, and that bills stored later with a text summarized before get the cached
+    summary without a job.
+    """
+    stub = StubSummaryClient()
+    text = "Identical companion text. Filed in both chambers."
+    with app.app_context(), patch("backend.app.summary_client", stub):
+        scraper = CongressionalScraper()
+        scraper.store_bills([
+            scraped_row("7201", text_preview=text, full_text=""),
+            scraped_row("7202", text_preview=text.replace(" ", "  "), full_text=""),
+        ], {})
+        result = run_summary_jobs(client=stub)
+        assert len(result["summarized"]) == 2
+        assert stub.calls == 1
+        assert SummaryCacheEntry.query.count() == 1
+        assert len({bill.ai_summary for bill in Bill.query.filter(Bill.bill_number.in_(["7201", "7202"]))}) == 1
+
+        scraper.store_bills([scraped_row("7203", text_preview=text, full_text="")], {})
+        bill = Bill.query.filter_by(bill_number="7203").one()
+        assert bill.ai_summary == Bill.query.filter_by(bill_number="7201").one().ai_summary
+        assert SummaryJob.query.filter_by(bill_id=bill.id).count() == 0
+        assert stub.calls == 1
+
+        # A job that finds its text in the cache finishes without calling the model.
+        scraper.store_bills([scraped_row("7204", text_preview="A fresh text.", full_text="")], {})
+        cache_summaries({summary_cache_key("A fresh text.", "stub"): "Cached meanwhile."}, "stub")
+        db.session.commit()
+        result = run_summary_jobs(client=stub)
+        assert result["cached"] == 1
+        assert stub.calls == 1
+        assert Bill.query.filter_by(bill_number="7204").one().ai_summary == "Cached meanwhile."
+
+        SummaryJob.query.delete()
+        SummaryCacheEntry.query.delete()
+        Bill.query.filter(Bill.bill_number.like("720%")).delete(synchronize_session=False)
+        db.session.commit()
+
+def test_long_bills_are_summarized_in_chunks(client):
+    """
+    Test that bills longer than one request are summarized from their full text in
+    chunks, and that summarizing an amended version only re-runs the changed chunks.
+    """
+    full_text = " ".join(f"SEC. {n}. Provision {n} of the act applies to program {n}." for n in range(200))
+    stub = StubSummaryClient(sentences=1)
+    with app.app_context(), patch("backend.app.summary_client", stub), \
+            patch("backend.app.SUMMARY_CHUNK_TOKENS", 200):
+        scraper = CongressionalScraper()
+        scraper.store_bills([scraped_row("7301", text_preview=full_text[:1000], full_text=full_text)], {})
+        assert len(run_summary_jobs(client=stub)["summarized"]) == 1
+        chunks = stub.calls - 1
+        assert chunks > 5
+        assert SummaryCacheEntry.query.filter_by(prompt_version=CHUNK_PROMPT_VERSION).count() == chunks
+
+        amended = full_text.replace("program 100.", "program 100 and its successors.")
+        bill = Bill.query.filter_by(bill_number="7301").one()
+        stub.calls = 0
+        # Storing the amended text queues the bill again, although it has a summary.
+        scraper.store_bills([scraped_row("7301", text_preview=amended[:1000], full_text=amended)], {})
+        assert run_summary_jobs(client=stub)["summarized"] == [bill.id]
+        # One changed chunk and the reduce step.
+        assert stub.calls == 2
+        db.session.refresh(bill)
+        assert bill.summary_hash == summary_cache_key(amended, "stub")
+
+        SummaryJob.query.delete()
+        SummaryCacheEntry.query.delete()
+        Bill.query.filter_by(bill_number="7301").delete()
+        db.session.commit()
+
+def listing_bill(number):
+    """Build the bill listing entry of a bill in the 117th Congress."""
+    return {"congress": 117, "type": "S", "number": str(number), "title": f"Backfilled {number}",
+            "originChamber": "Senate", "updateDate": "2022-05-01",
+            "url": f"https://api.congress.gov/v3/bill/117/s/{number}"}
+
+def test_backfill_checkpoints_and_failures(client):
+    """
+    Test that the backfill checkpoints each page, resumes from the checkpoint, stops
+    without advancing when a page cannot be fetched, records failed bills and
+    clears them once a retry succeeds.
+    """
+    listing = [listing_bill(n) for n in range(1, 6)]
+    pages = []
+    broken = {"3"}
+    def fetch_bill_page(self, congress, offset, limit, changed_from=None, changed_to=None):
+        pages.append(offset)
+        if offset == 4 and len(pages) == 3:
+            raise RuntimeError("listing unavailable")
+        return listing[offset:offset + limit], len(listing)
+    def get_bill_text(self, congress, bill_type, bill_number, parse=True):
+        if bill_number in broken:
+            raise ValueError("malformed text")
+        return BillText(f"Text of {bill_number}.")
+
+    with app.app_context(), \
+            patch.object(CongressionalScraper, "fetch_bill_page", fetch_bill_page), \
+            patch.object(CongressionalScraper, "get_bill_details", return_value={}), \
+            patch.object(CongressionalScraper, "get_bill_text", get_bill_text):
+        scraper = CongressionalScraper()
+        result = backfill_congress(scraper, 117, limit=2, max_pages=1)
+        assert result == {"pages": 1, "bills": 2, "inserted": 2, "failed": 0, "complete": False}
+        assert ScrapeTracking.query.filter_by(type="backfill:117").one().offset == 2
+
+        # The next run resumes at offset 2, and the page at offset 4 fails to load.
+        with pytest.raises(RuntimeError):
+            backfill_congress(scraper, 117, limit=2)
+        assert pages == [0, 2, 4]
+        assert ScrapeTracking.query.filter_by(type="backfill:117").one().offset == 4
+        failure = ScrapeFailure.query.one()
+        assert (failure.congress, failure.bill_type, failure.bill_number) == (117, "S", "3")
+        assert failure.error == "malformed text"
+        assert failure.bill_data == listing[2]
+
+        result = backfill_congress(scraper, 117, limit=2)
+        assert result == {"pages": 1, "bills": 1, "inserted": 1, "failed": 0, "complete": True}
+        assert backfill_congress(scraper, 117, limit=2)["pages"] == 0
+        assert pages[-1] == 5
+
+        assert retry_scrape_failures(scraper, limit=10) == {"retried": 1, "failed": 1}
+        assert ScrapeFailure.query.one().attempts == 2
+        broken.clear()
+        assert retry_scrape_failures(scraper, limit=10) == {"retried": 1, "failed": 0}
+        assert ScrapeFailure.query.count() == 0
+        assert Bill.query.filter_by(congress=117).count() == 5
+
+        SummaryJob.query.delete()
+        Bill.query.filter_by(congress=117).delete()
+        ScrapeTracking.query.filter_by(type="backfill:117").delete()
+        db.session.commit()
+
+def test_backfill_pages_a_snapshot_of_the_listing(client):
+    """
+    Test that the backfill pages through the listing as it was when it started, oldest
+    update first, and that a bill updated between two pages neither adds itself to the
+    listing nor makes the backfill skip the bill after it.
+    """
+    updated = {str(number): datetime(2022, 5, 1, tzinfo=timezone.utc) + timedelta(hours=number)
+               for number in range(11, 18)}
+    requests = []
+    def fetch_bill_page(self, congress, offset, limit, changed_from=None, changed_to=None):
+        requests.append((offset, changed_to))
+        listing = [listing_bill(number) for number, time in sorted(updated.items(), key=lambda item: item[1])
+                   if time <= changed_to]
+        return listing[offset:offset + limit], len(listing)
+
+    with app.app_context(), \
+            patch.object(CongressionalScraper, "fetch_bill_page", fetch_bill_page), \
+            patch.object(CongressionalScraper, "get_bill_details", return_value={}), \
+            patch.object(CongressionalScraper, "get_bill_text", return_value=BillText("Backfilled text.")):
+        scraper = CongressionalScraper()
+        assert backfill_congress(scraper, 117, limit=3, max_pages=1)["bills"] == 3
+        # A backfilled bill is updated and a new one is introduced before the backfill resumes.
+        updated["12"] = updated["18"] = datetime.now(timezone.utc) + timedelta(hours=1)
+        result = backfill_congress(scraper, 117, limit=3)
+        assert result["complete"]
+        assert [offset for offset, _ in requests] == [0, 3, 2, 5]
+        assert len({changed_to for _, changed_to in requests}) == 1
+        stored = Bill.query.filter_by(congress=117).all()
+        assert sorted(bill.bill_number for bill in stored) == [str(number) for number in range(11, 18)]
+
+        SummaryJob.query.delete()
+        Bill.query.filter_by(congress=117).delete()
+        ScrapeTracking.query.filter_by(type="backfill:117").delete()
+        db.session.commit()
+
+def test_backfill_page_size():
+    """
+    Test that backfill pages are sized to the rate budget and the API's page limit.
+    """
+    assert backfill_page_size(rate=2, seconds=60) == 40
+    assert backfill_page_size(rate=0.01, seconds=60) == 1
+    assert backfill_page_size(rate=100, seconds=60) == 250
+
+def test_congress_for():
+    """
+    Test that dates map to the Congress in session.
+    """
+    assert congress_for(datetime(2023, 6, 1)) == 118
+    assert congress_for(datetime(2024, 12, 31)) == 118
+    assert congress_for(datetime(2025, 1, 2, 23, 59)) == 118
+    assert congress_for(datetime(2025, 1, 3)) == 119
+    assert congress_for(datetime(2025, 2, 1)) == 119
+    assert congress_for(datetime(1789, 3, 4)) == 1
+
+def test_sync_changed_bills(client):
+    """
+    Test that the incremental sync pages through every changed bill, splits a long
+    catch-up into windows that each advance the high-water mark, spans Congress
+    boundaries, and resumes from the mark after a failed page.
+    """
+    changed = {119: [listing_bill(n) | {"congress": 119} for n in range(1, 6)]}
+    requests = []
+    def fetch_bill_page(self, congress, offset, limit, changed_from=None, changed_to=None):
+        requests.append((congress, offset, changed_from, changed_to))
+        if fail_at and changed_from == fail_at:
+            raise RuntimeError("listing unavailable")
+        return changed.get(congress, [])[offset:offset + limit], len(changed.get(congress, []))
+
+    now = datetime(2025, 1, 4, 12, tzinfo=timezone.utc)
+    fail_at = now - timedelta(hours=24)
+    with app.app_context(), \
+            patch.object(CongressionalScraper, "fetch_bill_page", fetch_bill_page), \
+            patch.object(CongressionalScraper, "get_bill_details", return_value={}), \
+            patch.object(CongressionalScraper, "get_bill_text", return_value=BillText("Changed text.")):
+        tracking = ScrapeTracking(type="sync", offset=0, high_water_mark=datetime(2024, 12, 31, 12))
+        db.session.add(tracking)
+        db.session.commit()
+
+        scraper = CongressionalScraper()
+        with pytest.raises(RuntimeError):
+            sync_changed_bills(scraper, workers=2, page_size=2, now=now)
+        # The first three windows completed; the failed fourth is retried next time.
+        assert ScrapeTracking.query.filter_by(type="sync").one().high_water_mark == datetime(2025, 1, 3, 12)
+        # Only the window reaching January 3 lists both Congresses; all pages of 119 are read.
+        assert {congress for congress, _, start, _ in requests
+                if start == datetime(2025, 1, 1, 12, tzinfo=timezone.utc)} == {118}
+        assert (118, 0, datetime(2025, 1, 2, 12, tzinfo=timezone.utc),
+                datetime(2025, 1, 3, 12, tzinfo=timezone.utc)) in requests
+        assert [offset for congress, offset, start, _ in requests
+                if congress == 119 and start == datetime(2025, 1, 2, 12, tzinfo=timezone.utc)] == [0, 2, 4]
+        assert Bill.query.filter_by(congress=119).count() == 5
+
+        fail_at = None
+        requests.clear()
+        result = sync_changed_bills(scraper, workers=2, page_size=2, now=now)
+        assert result["windows"] == 1 and result["inserted"] == 0 and result["bills"] == 5
+        assert {start for _, _, start, _ in requests} == {now - timedelta(hours=24)}
+        assert ScrapeTracking.query.filter_by(type="sync").one().high_water_mark == datetime(2025, 1, 4, 12)
+        assert not migrate_scrape_tracking()
+
+        SummaryJob.query.delete()
+        Bill.query.filter_by(congress=119).delete()
+        ScrapeTracking.query.filter_by(type="sync").delete()
+        db.session.commit()
+
 def test_vote_bill_upvote(client, registered_users):
     """
     Test adding an upvote to a bill with no prior vote from the user.
@@ -348,6 +1326,237 @@ def test_vote_bill_remove_existing(client, registered_users):
         user = db.session.get(User, registered_users["user1"]["id"])
         assert str(bill_id) not in user.voted_bills
 
+def test_vote_counters(client, registered_users):
+    """
+    Test that votes update only the voter's counters with atomic upserts instead of
+    rewriting a demographics document, and that the demographics keep their shape.
+    """
+    bill_id = create_test_bill_for_vote()
+    token = registered_users["user3"]["token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with count_queries() as statements:
+        response = client.post(f"/api/bills/{bill_id}/vote", json={"vote_status": "upvote"}, headers=headers)
+    assert response.status_code == 200
+    upserts = [s for s in statements if s.lstrip().upper().startswith("INSERT INTO VOTE_COUNTERS")]
+    assert len(upserts) == 1 and "ON CONFLICT" in upserts[0].upper()
+    assert not [s for s in statements if s.lstrip().upper().startswith(("INSERT INTO VOTES", "UPDATE VOTES"))]
+    demographics = response.get_json()["vote"]["demographics"]
+    expected = default_demographics()
+    for dimension, bucket in [("age_distribution", "30_to_60"), ("gender_distribution", "non-binary"),
+                              ("ethnicity_distribution", "black or african american"),
+                              ("state_distribution", "tx"), ("political_affiliation_distribution", "progressive")]:
+        expected["upvote"][dimension][bucket] = 1
+    assert demographics == expected
+
+    with app.app_context():
+        rows = VoteCounter.query.filter_by(bill_id=bill_id).all()
+        assert len(rows) == 5
+        assert {row.dimension for row in rows} == set(demographics["upvote"])
+
+    response = client.post(f"/api/bills/{bill_id}/vote", json={"vote_status": "downvote"}, headers=headers)
+    demographics = response.get_json()["vote"]["demographics"]
+    assert all(sum(counts.values()) == 0 for counts in demographics["upvote"].values())
+    assert all(sum(counts.values()) == 1 for counts in demographics["downvote"].values())
+
+    response = client.post(f"/api/bills/{bill_id}/vote", json={"vote_status": "none"}, headers=headers)
+    assert response.status_code == 200
+    response = client.get(f"/api/bills/{bill_id}/demographics")
+    assert response.get_json()["demographics"] == default_demographics()
+
+    response = client.post(f"/api/bills/{bill_id}/vote", json={"vote_status": "none"}, headers=headers)
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "You haven't voted on this bill yet."
+
+def test_concurrent_votes_are_counted_exactly(client):
+    """
+    Stress test: many simultaneous votes on one bill, including the same vote sent
+    several times at once and votes changed or removed concurrently, leave exactly one
+    vote per user and exact bill and demographic counts.
+    """
+    with app.app_context():
+        if isinstance(db.engine.pool, StaticPool):
+            pytest.skip("concurrent transactions need a connection per thread")
+    bill_id = create_test_bill_for_vote()
+    with app.app_context():
+        users = [
+            User(email=f"stress{n}@example.com", username=f"stress{n}", password_hash="-", age=40,
+                 gender="female", ethnicity="asian", state="wa", political_affiliation="moderate")
+            for n in range(24)
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        user_ids = [user.id for user in users]
+        tokens = [create_access_token(identity=str(user_id)) for user_id in user_ids]
+
+    def vote_at_once(votes):
+        responses = [None] * len(votes)
+        barrier = threading.Barrier(len(votes))
+        def send(i):
+            token, vote_status = votes[i]
+            barrier.wait(timeout=10)
+            responses[i] = app.test_client().post(
+                f"/api/bills/{bill_id}/vote", json={"vote_status": vote_status},
+                headers={"Authorization": f"Bearer {token}"}
+            )
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(len(votes))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [response.status_code for response in responses] == [200] * len(votes), \
+            [response.get_json() for response in responses if response.status_code != 200]
+        return responses
+
+    def assert_counts(upvotes, downvotes):
+        with app.app_context():
+            bill = db.session.get(Bill, bill_id)
+            assert (bill.vote_count, bill.upvote_count, bill.downvote_count) == (upvotes + downvotes, upvotes, downvotes)
+            assert UserVote.query.filter_by(bill_id=bill_id).count() == upvotes + downvotes
+        demographics = client.get(f"/api/bills/{bill_id}/demographics").get_json()["demographics"]
+        for dimension, bucket in [("age_distribution", "30_to_60"), ("gender_distribution", "female"),
+                                  ("state_distribution", "wa")]:
+            assert demographics["upvote"][dimension][bucket] == upvotes
+            assert demographics["downvote"][dimension][bucket] == downvotes
+
+    # Every user upvotes; four of them send their upvote four times at once.
+    responses = vote_at_once([(token, "upvote") for token in tokens] + [(token, "upvote") for token in tokens[:4]] * 3)
+    assert sum(response.get_json()["message"] == "Vote processed successfully" for response in responses) == 24
+    assert_counts(upvotes=24, downvotes=0)
+
+    # Eight switch to a downvote, each sent twice, while four others remove their vote.
+    vote_at_once([(token, "downvote") for token in tokens[:8]] * 2 + [(token, "none") for token in tokens[8:12]])
+    assert_counts(upvotes=12, downvotes=8)
+
+    with app.app_context():
+        UserVote.query.filter(UserVote.user_id.in_(user_ids)).delete(synchronize_session=False)
+        User.query.filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+def test_migrate_user_votes(client):
+    """
+    Test that votes kept in the legacy voted_bills column are moved to UserVote rows,
+    skipping votes on bills that no longer exist, and cannot come back once removed.
+    """
+    bill_id = create_test_bill_for_vote()
+    other_bill_id = create_test_bill_for_vote()
+    with app.app_context():
+        users = [
+            User(email=f"legacy{n}@example.com", username=f"legacy{n}", password_hash="-", age=40,
+                 legacy_voted_bills={str(bill_id): "downvote", str(other_bill_id): "upvote", "999999": "upvote"})
+            for n in range(3)
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        user_ids = [user.id for user in users]
+        assert migrate_user_votes(batch_size=2) >= 6
+        for user_id in user_ids:
+            user = db.session.get(User, user_id)
+            assert user.voted_bills == {str(bill_id): "downvote", str(other_bill_id): "upvote"}
+            assert user.legacy_voted_bills == {}
+
+        UserVote.query.filter_by(user_id=user_ids[0], bill_id=bill_id).delete()
+        db.session.commit()
+        assert migrate_user_votes() == 0
+        assert db.session.get(User, user_ids[0]).voted_bills == {str(other_bill_id): "upvote"}
+
+        UserVote.query.filter(UserVote.user_id.in_(user_ids)).delete(synchronize_session=False)
+        User.query.filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+def test_list_user_votes(client):
+    """
+    Test that a user's votes are listed newest first with their bills, paginated and
+    filtered by status and time.
+    """
+    bill_ids = [create_test_bill_for_vote() for _ in range(3)]
+    with app.app_context():
+        user = User(email="lister@example.com", username="lister", password_hash="-", age=30,
+                    gender="male", ethnicity="white", state="ca", political_affiliation="moderate")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+        headers = {"Authorization": f"Bearer {create_access_token(identity=str(user_id))}"}
+
+    for bill_id, status in zip(bill_ids, ["upvote", "downvote", "upvote"]):
+        response = client.post(f"/api/bills/{bill_id}/vote", json={"vote_status": status}, headers=headers)
+        assert response.status_code == 200
+    with app.app_context():
+        start = datetime(2024, 1, 1)
+        for offset, bill_id in enumerate(bill_ids):
+            UserVote.query.filter_by(user_id=user_id, bill_id=bill_id).update({"updated_at": start + timedelta(days=offset)})
+        db.session.commit()
+
+    response = client.get("/api/users/me/votes?per_page=2", headers=headers)
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [(vote["bill_id"], vote["vote_status"]) for vote in data["votes"]] == [(bill_ids[2], "upvote"), (bill_ids[1], "downvote")]
+    assert data["votes"][0]["bill"]["title"] == "Vote Test Bill"
+    assert "full_text" not in data["votes"][0]["bill"]
+    assert data["pagination"] == {"page": 1, "per_page": 2, "total": 3, "pages": 2}
+
+    data = client.get("/api/users/me/votes?per_page=2&page=2", headers=headers).get_json()
+    assert [vote["bill_id"] for vote in data["votes"]] == [bill_ids[0]]
+    data = client.get("/api/users/me/votes?status=upvote", headers=headers).get_json()
+    assert [vote["bill_id"] for vote in data["votes"]] == [bill_ids[2], bill_ids[0]]
+    data = client.get("/api/users/me/votes?since=2024-01-02T00:00:00%2B00:00", headers=headers).get_json()
+    assert [vote["bill_id"] for vote in data["votes"]] == [bill_ids[2], bill_ids[1]]
+
+    assert client.get("/api/users/me/votes?status=maybe", headers=headers).status_code == 400
+    assert client.get("/api/users/me/votes?since=yesterday", headers=headers).status_code == 400
+    assert client.get("/api/users/me/votes").status_code == 401
+
+def test_merge_duplicate_bills(client):
+    """
+    Test that bills stored twice before the natural key was unique are merged into the
+    copy with the lowest id, keeping every user's vote once and exact counts, so that the
+    unique index can be created.
+    """
+    unique_index = next(index for index in Bill.__table__.indexes if index.name == "uq_bills_congress_type_number")
+    with app.app_context():
+        unique_index.drop(db.engine)
+        copies = [
+            Bill(title="Duplicated Bill", congress=118, bill_type="hr", bill_number="7310",
+                 full_text=text, text_preview=text, latest_action_date=datetime(2024, 3, 1),
+                 update_date=datetime(2024, 3, 1), url="http://api.congress.gov/bill/118/hr/7310")
+            for text in (None, "The text of the duplicated bill.")
+        ]
+        db.session.add_all(copies)
+        users = [
+            User(email=f"duplicate{n}@example.com", username=f"duplicate{n}", password_hash="-", age=40,
+                 gender="female", ethnicity="asian", state="wa", political_affiliation="moderate")
+            for n in range(3)
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        keep_id, duplicate_id = (bill.id for bill in copies)
+        tokens = [create_access_token(identity=str(user.id)) for user in users]
+
+    # The first user voted on the kept copy, the third on the duplicate, the second on both.
+    for token, bill_id, status in [(tokens[0], keep_id, "upvote"), (tokens[1], keep_id, "upvote"),
+                                   (tokens[1], duplicate_id, "downvote"), (tokens[2], duplicate_id, "downvote")]:
+        response = client.post(f"/api/bills/{bill_id}/vote", json={"vote_status": status},
+                               headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+
+    with app.app_context():
+        assert merge_duplicate_bills() == 1
+        unique_index.create(db.engine)
+        assert db.session.get(Bill, duplicate_id) is None
+        bill = db.session.get(Bill, keep_id)
+        assert (bill.vote_count, bill.upvote_count, bill.downvote_count) == (3, 2, 1)
+        assert bill.full_text == "The text of the duplicated bill."
+        assert SummaryJob.query.filter_by(bill_id=keep_id).count() == 1
+        votes = {vote.user_id: vote.status for vote in UserVote.query.filter_by(bill_id=keep_id)}
+        assert votes == {users[0].id: "upvote", users[1].id: "upvote", users[2].id: "downvote"}
+        assert not VoteCounter.query.filter_by(bill_id=duplicate_id).count()
+        assert merge_duplicate_bills() == 0
+    demographics = client.get(f"/api/bills/{keep_id}/demographics").get_json()["demographics"]
+    for dimension, bucket in [("age_distribution", "30_to_60"), ("gender_distribution", "female"),
+                              ("state_distribution", "wa")]:
+        assert demographics["upvote"][dimension][bucket] == 2
+        assert demographics["downvote"][dimension][bucket] == 1
+
 def test_vote_bill_remove_nonexistent(client, registered_users):
     """
     Test that attempting to remove a non-existent vote returns an appropriate error.
@@ -388,7 +1597,8 @@ def test_vote_bill_not_found(client, registered_users):
 def test_bill_demographics(client, registered_users):
     """
     Test the /api/bills/<bill_id>/demographics endpoint.
-    This test creates a Vote record with custom demographics and checks that the endpoint returns the expected values.
+    This test creates a legacy Vote record with custom demographics, migrates it to vote counters and checks that
+    the endpoint returns the expected values.
     """
     with app.app_context():
         bill = Bill(
@@ -441,6 +1651,9 @@ def test_bill_demographics(client, registered_users):
         db.session.add(vote)
         bill.vote_count = 4
         db.session.commit()
+        assert migrate_vote_counters() >= 1
+        assert Vote.query.filter_by(bill_id=bill_id).count() == 0
+        assert migrate_vote_counters() == 0
 
     response = client.get(f"/api/bills/{bill_id}/demographics")
     assert response.status_code == 200
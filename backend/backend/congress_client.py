@@ -0,0 +1,281 @@
+"""
+Congress API Client
+
+HTTP layer used by the scraper for the Congress API and the congress.gov text
+downloads. It keeps one pooled ``requests.Session`` per client so connections are
+reused across requests and threads, draws every attempt from a shared rate limiter,
+retries throttled (429) and failed (5xx) requests with exponential backoff and
+jitter, and can issue conditional GETs: the ``ETag``/``Last-Modified`` validators of
+earlier responses are sent back, and a ``304 Not Modified`` answer is reported as
+``NOT_MODIFIED`` so callers can skip unchanged resources entirely.
+
+Responses can also be recorded to a ``ResponseCache`` on disk and replayed from it
+without any network access, which makes reprocessing a scraped range run at disk
+speed and gives benchmarks a deterministic set of fixtures.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: throttling and transient server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+DEFAULT_TIMEOUT = 30
+# Longest wait between attempts, including a server-sent Retry-After.
+MAX_BACKOFF = 60.0
+
+# Returned by ``CongressApiClient.get`` when a conditional request was answered with 304.
+NOT_MODIFIED = object()
+
+
+class ValidatorStore:
+    """
+    Thread-safe in-memory map from URL to the validators of its last response.
+
+    Subclasses can persist validators elsewhere by overriding ``get`` and ``set``.
+    """
+
+    def __init__(self):
+        self._validators = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> dict:
+        """Return ``{"etag": ..., "last_modified": ...}`` for ``url``, or None."""
+        with self._lock:
+            return self._validators.get(url)
+
+    def set(self, url: str, validators: dict) -> None:
+        """Remember the validators of the latest response for ``url``."""
+        with self._lock:
+            self._validators[url] = validators
+
+    def discard(self, url: str) -> None:
+        """Forget the validators of ``url``, forcing the next request to be unconditional."""
+        with self._lock:
+            self._validators.pop(url, None)
+
+
+class CachedResponse:
+    """
+    A response read back from a ``ResponseCache``, mimicking ``requests.Response``.
+
+    Attributes:
+        url (str): The URL that was requested.
+        status_code (int): The recorded HTTP status.
+        headers (dict): The recorded response headers.
+        text (str): The decoded response body.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict, text: str):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    encoding = "utf-8"
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def iter_content(self, chunk_size: int = 1):
+        """Yield the body in pieces of ``chunk_size`` bytes, like a streamed response."""
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
+    def json(self):
+        return json.loads(self.text)
+
+    def close(self) -> None:
+        pass
+
+
+class ResponseCache:
+    """
+    Content-addressed, gzip-compressed store of raw responses on disk.
+
+    Each response is a file named after the SHA-256 of its URL and query parameters,
+    fanned out into subdirectories by the first two hex digits.
+
+    Attributes:
+        directory (str): Root directory of the cache.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @staticmethod
+    def key(url: str, params: dict = None) -> str:
+        """Return the hash identifying a request; headers such as the API key are not part of it."""
+        return hashlib.sha256(_request_id(url, params).encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json.gz")
+
+    def get(self, url: str, params: dict = None):
+        """Return the recorded ``CachedResponse`` for a request, or None if it was never recorded."""
+        try:
+            with gzip.open(self.path(self.key(url, params)), "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        return CachedResponse(entry["url"], entry["status_code"], entry["headers"], entry["text"])
+
+    def put(self, url: str, params: dict, response) -> None:
+        """Record ``response`` for a request, replacing any earlier recording atomically."""
+        path = self.path(self.key(url, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "url": _request_id(url, params),
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "text": response.text,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class CongressApiClient:
+    """
+    Pooled, rate limited and retrying HTTP client.
+
+    Attributes:
+        session (requests.Session): Session whose connection pool is shared by all requests.
+        rate_limiter (TokenBucket): Limiter every attempt draws a token from; None to disable.
+        validators (ValidatorStore): Validators of earlier responses, for conditional GETs.
+        max_retries (int): Retries after the first attempt for retryable failures.
+        backoff (float): Base delay in seconds; retry ``n`` waits between half and all of
+            ``backoff * 2**n``.
+        timeout (float): Connect and read timeout of each attempt, in seconds.
+        cache (ResponseCache): Where successful responses are recorded; None to not record.
+        replay (bool): Answer every request from ``cache`` without touching the network.
+            Requests that were never recorded get a 404 response.
+    """
+
+    def __init__(self, rate_limiter=None, validators: ValidatorStore = None, pool_size: int = 10,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 timeout: float = DEFAULT_TIMEOUT, sleep=time.sleep, cache: ResponseCache = None,
+                 replay: bool = False):
+        if replay and cache is None:
+            raise ValueError("replay mode needs a response cache")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = rate_limiter
+        self.validators = ValidatorStore() if validators is None else validators
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.replay = replay
+        self._sleep = sleep
+
+    def get(self, url: str, params: dict = None, headers: dict = None, conditional: bool = False,
+            stream: bool = False):
+        """
+        Send a GET request, retrying throttled and failed attempts.
+
+        Args:
+            url (str): The URL to fetch.
+            params (dict, optional): Query string parameters.
+            headers (dict, optional): Extra request headers, e.g. the API key.
+            conditional (bool): Send the validators stored for this URL and return
+                ``NOT_MODIFIED`` if the server answers 304. Ignored in replay mode, where
+                every recorded response is processed again.
+            stream (bool): Do not download the body up front, so it can be read piece by
+                piece with ``iter_content``; the caller must then close the response.
+                Recording to the cache still reads the whole body.
+        Returns:
+            requests.Response | CachedResponse | object: The final response (which may
+            still be an error status once retries are exhausted), or ``NOT_MODIFIED``.
+        Raises:
+            requests.RequestException: If the last attempt failed without a response.
+        """
+        if self.replay:
+            cached = self.cache.get(url, params)
+            if cached is None:
+                logger.warning(f"GET {url} is not in the response cache")
+                return CachedResponse(_request_id(url, params), 404, {}, "")
+            return cached
+
+        key = _request_id(url, params)
+        headers = dict(headers or {})
+        stored = self.validators.get(key) if conditional else None
+        if stored:
+            if stored.get("etag"):
+                headers["If-None-Match"] = stored["etag"]
+            if stored.get("last_modified"):
+                headers["If-Modified-Since"] = stored["last_modified"]
+
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout,
+                                            stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._delay(attempt)
+                logger.warning(f"GET {url} failed ({e}); retrying in {delay:.1f}s")
+                self._sleep(delay)
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self._delay(attempt, response.headers.get("Retry-After"))
+                response.close()
+                logger.warning(f"GET {url} returned {response.status_code}; retrying in {delay:.1f}s")
+                self._sleep(delay)
+                continue
+            break
+
+        if response.status_code == 304 and stored:
+            return NOT_MODIFIED
+        if response.status_code == 200:
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.validators.set(key, {"etag": etag, "last_modified": last_modified})
+            if self.cache is not None:
+                self.cache.put(url, params, response)
+        return response
+
+    def _delay(self, attempt: int, retry_after: str = None) -> float:
+        """Seconds to wait before retry ``attempt + 1``: Retry-After if given, else jittered backoff."""
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF)
+            except ValueError:
+                pass
+        # Half of the exponential delay is fixed, half random, so concurrent workers spread out.
+        cap = min(self.backoff * 2 ** attempt, MAX_BACKOFF)
+        return cap / 2 + random.uniform(0, cap / 2)
+
+
+def _request_id(url: str, params: dict = None) -> str:
+    """Identify a request by its URL and query parameters, since both select the resource."""
+    if not params:
+        return url
+    return url + "?" + "&".join(f"{name}={value}" for name, value in sorted(params.items()))
@@ -0,0 +1,111 @@
+import gzip
+from unittest.mock import MagicMock, patch
+import pytest
+import requests
+from backend.congress_client import CongressApiClient, ResponseCache, NOT_MODIFIED
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock(status_code=status_code)
+    response.headers = headers or {}
+    return response
+
+@pytest.fixture
+def sleeps():
+    return []
+
+@pytest.fixture
+def client(sleeps):
+    return CongressApiClient(backoff=1.0, sleep=sleeps.append)
+
+def test_retries_server_errors_with_backoff(client, sleeps):
+    """
+    Test that 5xx responses are retried with growing, jittered delays.
+    """
+    responses = [make_response(503), make_response(502), make_response(200)]
+    with patch.object(client.session, "get", side_effect=responses) as get:
+        assert client.get("https://api.example/bill").status_code == 200
+    assert get.call_count == 3
+    assert 0.5 <= sleeps[0] <= 1.0 and 1.0 <= sleeps[1] <= 2.0
+
+def test_honors_retry_after(client, sleeps):
+    """
+    Test that a 429 waits for the server's Retry-After before retrying.
+    """
+    responses = [make_response(429, {"Retry-After": "7"}), make_response(200)]
+    with patch.object(client.session, "get", side_effect=responses):
+        client.get("https://api.example/bill")
+    assert sleeps == [7.0]
+
+def test_gives_up_after_max_retries(client, sleeps):
+    """
+    Test that the last error response is returned once retries are exhausted and
+    that connection errors are raised.
+    """
+    with patch.object(client.session, "get", return_value=make_response(500)) as get:
+        assert client.get("https://api.example/bill").status_code == 500
+    assert get.call_count == client.max_retries + 1
+
+    with patch.object(client.session, "get", side_effect=requests.ConnectionError("down")):
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://api.example/bill")
+
+def test_does_not_retry_client_errors(client, sleeps):
+    with patch.object(client.session, "get", return_value=make_response(404)) as get:
+        assert client.get("https://api.example/bill").status_code == 404
+    assert get.call_count == 1 and sleeps == []
+
+def test_conditional_get(client):
+    """
+    Test that validators of a 200 response are sent back on conditional requests
+    and that a 304 is reported as NOT_MODIFIED.
+    """
+    first = make_response(200, {"ETag": '"abc"', "Last-Modified": "Wed, 01 May 2024 00:00:00 GMT"})
+    with patch.object(client.session, "get", side_effect=[first, make_response(304)]) as get:
+        assert client.get("https://api.example/bill", conditional=True) is first
+        assert client.get("https://api.example/bill", conditional=True) is NOT_MODIFIED
+    headers = get.call_args_list[1].kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Wed, 01 May 2024 00:00:00 GMT"
+
+    with patch.object(client.session, "get", return_value=make_response(200)) as get:
+        client.get("https://api.example/bill")
+        client.get("https://api.example/bill", params={"offset": 0}, conditional=True)
+    assert all("If-None-Match" not in call.kwargs["headers"] for call in get.call_args_list)
+
+def test_each_attempt_draws_a_rate_limit_token(sleeps):
+    limiter = MagicMock()
+    client = CongressApiClient(rate_limiter=limiter, sleep=sleeps.append)
+    with patch.object(client.session, "get", side_effect=[make_response(503), make_response(200)]):
+        client.get("https://api.example/bill")
+    assert limiter.acquire.call_count == 2
+
+def test_records_and_replays_responses(tmp_path):
+    """
+    Test that successful responses are recorded compressed on disk and that a
+    replaying client serves them without network access.
+    """
+    cache = ResponseCache(str(tmp_path))
+    recorder = CongressApiClient(cache=cache, max_retries=0)
+    response = make_response(200, {"ETag": '"abc"'})
+    response.text = '{"bill": {"number": "1"}}'
+    with patch.object(recorder.session, "get", side_effect=[response, make_response(500)]):
+        recorder.get("https://api.example/bill", params={"format": "json"}, headers={"X-API-Key": "secret"})
+        recorder.get("https://api.example/missing")
+
+    files = list(tmp_path.rglob("*.json.gz"))
+    assert len(files) == 1
+    assert files[0].name == ResponseCache.key("https://api.example/bill", {"format": "json"}) + ".json.gz"
+    assert b"secret" not in gzip.decompress(files[0].read_bytes())
+
+    replayer = CongressApiClient(cache=cache, replay=True)
+    with patch.object(replayer.session, "get", side_effect=AssertionError("network access")):
+        replayed = replayer.get("https://api.example/bill", params={"format": "json"}, conditional=True)
+        assert replayed.status_code == 200
+        assert replayed.json() == {"bill": {"number": "1"}}
+        assert replayed.headers["ETag"] == '"abc"'
+        assert replayer.get("https://api.example/missing").status_code == 404
+
+def test_replay_requires_cache():
+    with pytest.raises(ValueError):
+        CongressApiClient(replay=True)
@@ -0,0 +1,78 @@
+"""
+Bounded Pipelines
+
+Helpers for chaining executor stages into a pipeline with back-pressure. A stage built
+with ``bounded_map`` keeps at most ``max_pending`` items submitted ahead of its
+consumer and only pulls the next input once the consumer took the oldest result, so a
+slow stage stalls the stages before it instead of letting their output pile up in
+memory. Stages are lazy generators: chaining them runs every stage concurrently.
+
+The scraper uses this to fetch bills on threads, parse their HTML in a process pool
+and write them in batches on the calling thread.
+"""
+
+from collections import deque
+from concurrent.futures import Future
+
+
+def completed(fn, *args) -> Future:
+    """
+    Run ``fn(*args)`` on the calling thread and return its outcome as a finished future.
+
+    Used as the ``submit`` of stages that need no executor, so they fit ``bounded_map``.
+
+    Args:
+        fn (Callable): The function to call.
+        *args: Its arguments.
+    Returns:
+        Future: Holding the result, or the exception raised.
+    """
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def bounded_map(submit, items, max_pending: int):
+    """
+    Submit work for each item, keeping at most ``max_pending`` items in flight.
+
+    Args:
+        submit (Callable[[object], Future]): Starts the work for an item, e.g. by
+            submitting it to an executor, or ``completed`` to run it inline.
+        items (Iterable): The inputs; consumed lazily, only as results are taken.
+        max_pending (int): Largest number of submitted items not yet yielded.
+    Yields:
+        tuple: ``(item, future)`` in input order; the future may still be running, and
+        its ``result()`` raises the exception of failed work.
+    """
+    max_pending = max(max_pending, 1)
+    pending = deque()
+    for item in items:
+        pending.append((item, submit(item)))
+        if len(pending) >= max_pending:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+
+def batched(items, size: int):
+    """
+    Group items into lists of ``size``; the last list may be shorter.
+
+    Args:
+        items (Iterable): The items, consumed lazily.
+        size (int): Items per batch.
+    Yields:
+        list: The batches.
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
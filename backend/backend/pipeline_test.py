@@ -0,0 +1,67 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.pipeline import bounded_map, batched, completed
+
+
+def test_bounded_map_pulls_inputs_only_as_results_are_taken():
+    """
+    Test that at most ``max_pending`` items are submitted ahead of the consumer.
+    """
+    pulled = []
+    def items():
+        for n in range(10):
+            pulled.append(n)
+            yield n
+
+    results = bounded_map(lambda n: completed(lambda: n * n), items(), max_pending=3)
+    item, future = next(results)
+    assert (item, future.result()) == (0, 0)
+    assert pulled == [0, 1, 2]
+    next(results)
+    assert pulled == [0, 1, 2, 3]
+    assert [future.result() for _, future in results] == [n * n for n in range(2, 10)]
+
+
+def test_bounded_map_keeps_input_order():
+    """
+    Test that results come back in input order while later items finish first.
+    """
+    def work(n):
+        time.sleep(0.01 * (5 - n))
+        return n
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = bounded_map(lambda n: executor.submit(work, n), range(5), max_pending=5)
+        assert [(item, future.result()) for item, future in results] == [(n, n) for n in range(5)]
+
+
+def test_chained_stages():
+    """
+    Test that a stage can consume another stage lazily, as the scraper chains fetching and parsing.
+    """
+    with ThreadPoolExecutor(max_workers=2) as first, ThreadPoolExecutor(max_workers=2) as second:
+        doubled = (future.result() for _, future in bounded_map(lambda n: first.submit(lambda: n * 2), range(6), 2))
+        added = bounded_map(lambda n: second.submit(lambda: n + 1), doubled, 2)
+        assert [future.result() for _, future in added] == [1, 3, 5, 7, 9, 11]
+
+
+def test_completed_captures_exceptions():
+    """
+    Test that inline work reports its exception through the future instead of raising it.
+    """
+    future = completed(lambda: 1 / 0)
+    assert future.done()
+    with pytest.raises(ZeroDivisionError):
+        future.result()
+    assert completed(max, 1, 2).result() == 2
+
+
+def test_batched():
+    """
+    Test that items are grouped into full batches followed by the remainder.
+    """
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 2)) == []
@@ -0,0 +1,52 @@
+"""
+API Rate Limiting
+
+A thread-safe token bucket shared by every scraper thread in the process, so that
+concurrent requests to the Congress API together stay within the configured budget.
+Callers reserve a slot under a lock and sleep outside it, so waiting threads queue up
+in order while requests that already hold a token proceed in parallel.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second, holding at most ``capacity``.
+
+    Attributes:
+        rate (float): Tokens added per second, i.e. the sustained request rate.
+        capacity (float): Largest burst of requests allowed after an idle period.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take ``tokens`` from the bucket, blocking until they are available.
+
+        Args:
+            tokens (float): Number of tokens to take; one per request.
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves the tokens; later callers wait for the debt too.
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
@@ -0,0 +1,58 @@
+import threading
+import time
+import pytest
+from backend.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Clock advanced only by the fake sleep, so waits are exact and instant."""
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def test_token_bucket_spaces_requests():
+    """
+    Test that requests beyond the burst capacity wait 1 / rate seconds each.
+    """
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=1, clock=clock, sleep=lambda seconds: None)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(1.0)
+
+def test_token_bucket_allows_burst_after_idle():
+    """
+    Test that tokens accumulate up to the capacity while the bucket is idle.
+    """
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=3, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        bucket.acquire()
+    clock.now += 10
+    assert [bucket.acquire() for _ in range(4)] == [0, 0, 0, pytest.approx(1.0)]
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+def test_token_bucket_limits_concurrent_threads():
+    """
+    Test that threads sharing a bucket together stay within its rate.
+    """
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 20 requests at 50/s: the first is free, the other 19 take at least 0.38s.
+    assert time.monotonic() - start >= 0.37
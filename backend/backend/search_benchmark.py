@@ -0,0 +1,113 @@
+"""
+Search Benchmark
+
+Compares query latency of the search implementations on a synthetic corpus:
+
+- ``refit``: the original per-request path, fitting ``TfidfVectorizer`` over the whole
+  corpus and computing cosine similarities for every query.
+- ``tfidf``: the prebuilt :class:`~backend.search_index.TfidfSearchIndex`.
+- ``bm25``: the inverted :class:`~backend.search_index.BM25SearchIndex`.
+
+Run from the ``backend`` directory::
+
+    python -m backend.search_benchmark --docs 100000 --queries 200
+
+The refit path scans the entire corpus per query, so it is timed on a small number
+of queries only (``--refit-queries``, 0 to skip it).
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from .search_index import TfidfSearchIndex, BM25SearchIndex
+
+
+def make_corpus(n_docs: int, vocabulary_size: int, words_per_doc: int, seed: int) -> tuple:
+    """
+    Generate documents whose word frequencies follow a Zipf-like distribution.
+
+    Returns:
+        tuple: ``(documents, vocabulary)``.
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"w{i:05d}x" for i in range(vocabulary_size)]
+    weights = [1 / (rank + 1) for rank in range(vocabulary_size)]
+    documents = [
+        " ".join(rng.choices(vocabulary, weights=weights, k=rng.randint(words_per_doc // 2, words_per_doc * 2)))
+        for _ in range(n_docs)
+    ]
+    return documents, vocabulary
+
+
+def make_queries(vocabulary: list, n_queries: int, seed: int) -> list:
+    """Generate one- and two-word queries drawn from the vocabulary."""
+    rng = random.Random(seed + 1)
+    head = vocabulary[: len(vocabulary) // 10]
+    return [" ".join(rng.sample(head if rng.random() < 0.5 else vocabulary, rng.choice([1, 2])))
+            for _ in range(n_queries)]
+
+
+def refit_search(documents: list, query: str, top_k: int = 20) -> list:
+    """The original endpoint logic: fit the vectorizer on every request."""
+    vectorizer = TfidfVectorizer(stop_words="english")
+    matrix = vectorizer.fit_transform(documents)
+    similarities = cosine_similarity(vectorizer.transform([query]), matrix).flatten()
+    return [i for i in similarities.argsort()[::-1] if similarities[i] > 0][:top_k]
+
+
+def time_queries(search, queries: list) -> dict:
+    """Run ``search`` over ``queries`` and return latency statistics in milliseconds."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies = np.array(latencies)
+    return {
+        "mean": latencies.mean(),
+        "p50": np.percentile(latencies, 50),
+        "p95": np.percentile(latencies, 95),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=20000, help="Number of synthetic documents")
+    parser.add_argument("--vocabulary", type=int, default=50000, help="Vocabulary size")
+    parser.add_argument("--words", type=int, default=200, help="Typical words per document")
+    parser.add_argument("--queries", type=int, default=200, help="Queries timed per indexed mode")
+    parser.add_argument("--refit-queries", type=int, default=3, help="Queries timed on the refit path")
+    parser.add_argument("--top-k", type=int, default=20, help="Results per query")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    documents, vocabulary = make_corpus(args.docs, args.vocabulary, args.words, args.seed)
+    queries = make_queries(vocabulary, args.queries, args.seed)
+    bill_ids = list(range(len(documents)))
+    fielded = [{"full_text": document} for document in documents]
+    print(f"Corpus: {len(documents)} documents, {len(vocabulary)} terms, {len(queries)} queries")
+
+    rows = []
+    for name, index_type in (("tfidf", TfidfSearchIndex), ("bm25", BM25SearchIndex)):
+        start = time.perf_counter()
+        index = index_type(boosts={"full_text": 1.0}).build(bill_ids, fielded)
+        build_seconds = time.perf_counter() - start
+        stats = time_queries(lambda query: index.search(query, top_k=args.top_k), queries)
+        rows.append((name, build_seconds, stats))
+
+    if args.refit_queries:
+        stats = time_queries(lambda query: refit_search(documents, query, args.top_k), queries[: args.refit_queries])
+        rows.append(("refit", 0.0, stats))
+
+    print(f"{'mode':<8}{'build s':>10}{'mean ms':>12}{'p50 ms':>12}{'p95 ms':>12}")
+    for name, build_seconds, stats in rows:
+        print(f"{name:<8}{build_seconds:>10.2f}{stats['mean']:>12.2f}{stats['p50']:>12.2f}{stats['p95']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
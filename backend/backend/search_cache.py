@@ -0,0 +1,157 @@
+"""
+Search Result Cache
+
+Caches the ranked bill ids of search queries so that popular keywords are answered
+without scoring the corpus again. Entries are keyed on the normalized query, its
+filters and the version of the search index that produced them, so any change to the
+index (a rebuild or an incremental update from the scraper) makes older entries
+unreachable; they then age out through the size and TTL bounds.
+
+Storage is pluggable: ``SearchCache`` talks to a ``CacheBackend``. The default
+``LocalCacheBackend`` is an in-process LRU; a backend shared between workers (e.g.
+Redis) only needs to implement ``get``, ``set`` and ``clear``.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Default bounds of the local cache.
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 300
+
+
+class CacheBackend:
+    """Interface of the key-value stores used by ``SearchCache``."""
+
+    def get(self, key: str):
+        """Return the value stored under ``key``, or None if it is absent or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value) -> None:
+        """Store ``value`` under ``key``."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return 0
+
+
+class LocalCacheBackend(CacheBackend):
+    """
+    Thread-safe in-process LRU cache whose entries expire after a fixed time.
+
+    Attributes:
+        max_entries (int): Entries kept before the least recently used one is evicted.
+        ttl (float): Seconds an entry stays valid after it is stored.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS,
+                 clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SearchCache:
+    """
+    Query-result cache in front of the search indexes, with hit and miss counters.
+
+    Attributes:
+        backend (CacheBackend): Where entries are stored.
+        hits (int): Lookups answered from the cache by this worker.
+        misses (int): Lookups that had to run the search.
+    """
+
+    def __init__(self, backend: CacheBackend = None):
+        self.backend = LocalCacheBackend() if backend is None else backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(index_version: str, keyword: str, **filters) -> str:
+        """
+        Build the cache key of a query.
+
+        Keywords are case-folded and their words sorted, since the indexes score bags
+        of words; filters with empty values are left out.
+
+        Args:
+            index_version (str): Identifies the index contents, e.g. its ``cache_token``.
+            keyword (str): The raw search keywords.
+            **filters: Any other parameters the result depends on.
+        Returns:
+            str: The cache key.
+        """
+        normalized = " ".join(sorted(keyword.lower().split()))
+        parts = [f"{name}={value}" for name, value in sorted(filters.items()) if value not in (None, "")]
+        return "|".join([index_version, normalized, *parts])
+
+    def get_or_compute(self, key: str, compute):
+        """
+        Return the cached value of ``key``, calling ``compute()`` and storing its result on a miss.
+
+        Args:
+            key (str): A key from ``SearchCache.key``.
+            compute (Callable[[], Any]): Produces the value on a miss.
+        Returns:
+            The cached or computed value.
+        """
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is None:
+            value = compute()
+            self.backend.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after the index was replaced."""
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        """Return the hit and miss counters, hit rate and number of entries."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.backend),
+        }
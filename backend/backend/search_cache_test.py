@@ -0,0 +1,73 @@
+from backend.search_cache import SearchCache, LocalCacheBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_local_backend_evicts_least_recently_used():
+    """
+    Test that the oldest untouched entry is evicted once the cache is full.
+    """
+    backend = LocalCacheBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1
+    backend.set("c", 3)
+    assert backend.get("b") is None
+    assert backend.get("a") == 1 and backend.get("c") == 3
+    assert len(backend) == 2
+
+def test_local_backend_expires_entries():
+    """
+    Test that entries are no longer returned once their TTL has passed.
+    """
+    clock = FakeClock()
+    backend = LocalCacheBackend(ttl=10, clock=clock)
+    backend.set("a", 1)
+    clock.now = 9.9
+    assert backend.get("a") == 1
+    clock.now = 10
+    assert backend.get("a") is None
+    assert len(backend) == 0
+
+def test_local_backend_size_zero_disables_caching():
+    """
+    Test that a cache without room stores nothing.
+    """
+    backend = LocalCacheBackend(max_entries=0)
+    backend.set("a", 1)
+    assert backend.get("a") is None
+
+def test_key_normalizes_query():
+    """
+    Test that case, word order and empty filters do not change the key, while the
+    index version and filter values do.
+    """
+    key = SearchCache.key("v1", "Clean  Water", chamber=None, start_date="")
+    assert key == SearchCache.key("v1", "water clean")
+    assert key != SearchCache.key("v2", "water clean")
+    assert key != SearchCache.key("v1", "water clean", chamber="House")
+
+def test_get_or_compute_counts_hits_and_misses():
+    """
+    Test that results are computed once per key and that the counters are reported.
+    """
+    cache = SearchCache()
+    calls = []
+    def compute():
+        calls.append(1)
+        return [(1, 0.5)]
+
+    assert cache.get_or_compute("k", compute) == [(1, 0.5)]
+    assert cache.get_or_compute("k", compute) == [(1, 0.5)]
+    assert len(calls) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+    cache.clear()
+    cache.get_or_compute("k", compute)
+    assert len(calls) == 2
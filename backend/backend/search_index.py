@@ -0,0 +1,779 @@
+"""
+Prebuilt Search Indexes
+
+This module holds the search indexes used by the search endpoints. An index is built
+once over the bill corpus, persisted to disk in a versioned format and loaded by each
+worker, so answering a query only costs vectorizing the query plus a sparse dot
+product (TF–IDF) or a walk over a few postings lists (BM25) instead of refitting a
+vectorizer over every document.
+
+Documents are indexed per field (title, AI summary, full text). Each field has its own
+term statistics and a configurable boost, and the score of a bill is the boosted sum
+of its per-field scores, so a match in the title is not drowned out by a 300-page full
+text. Fields with a boost of zero are not indexed at all.
+
+Terms are mapped to columns with a hashed vocabulary, so documents can be added or
+replaced incrementally without refitting. Updates of either index kind are written as
+small immutable segments next to the existing ones, and a small manifest lists the
+current segments, so saving an update and reloading it in another worker only touch
+the new segment; IDF statistics are refreshed (and segments merged) periodically
+rather than on every update.
+
+The module is intentionally free of Flask and database imports; the application
+feeds it ``(bill_id, {field: text})`` pairs and hydrates the returned bill ids itself.
+"""
+
+import os
+import copy
+import pickle
+import tempfile
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the locking within one process applies.
+    fcntl = None
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+# Bump whenever the on-disk layout changes so stale indexes are rebuilt instead of loaded.
+INDEX_FORMAT_VERSION = 4
+
+MANIFEST_NAME = "manifest.pkl"
+
+# File locked by processes updating the indexes in a directory.
+LOCK_NAME = ".lock"
+
+# Bill fields that can be indexed, with their default boosts (title > summary > full text).
+DEFAULT_FIELD_BOOSTS = {"title": 3.0, "ai_summary": 1.5, "full_text": 0.5}
+
+# Number of hashed term columns. 2**20 keeps collisions negligible for bill-sized vocabularies.
+N_FEATURES = 2 ** 20
+
+# Refresh IDF statistics once this fraction of the corpus has been added or replaced.
+IDF_REFRESH_RATIO = 0.1
+
+# Standard Okapi BM25 parameters.
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+
+class IndexFormatError(Exception):
+    """Raised when an index on disk is missing, corrupt or from an older format."""
+
+
+@contextmanager
+def index_lock(path: str):
+    """
+    Hold an exclusive lock on the index directory ``path``, across processes.
+
+    Writers hold it from loading the current index until the updated one is saved, so
+    concurrent updates are applied one after the other instead of the last save
+    dropping the others' changes. Readers do not need it. The lock is not reentrant:
+    acquiring it again, even from the same process, blocks.
+
+    Args:
+        path (str): The index directory; created if missing.
+    """
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, LOCK_NAME), "a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def parse_field_boosts(value: str) -> dict:
+    """
+    Parse a boost specification such as ``"title=3,ai_summary=1.5,full_text=0"``.
+
+    Fields that are not mentioned keep their default boost.
+
+    Raises:
+        ValueError: If a field is unknown or a boost is not a non-negative number.
+    """
+    boosts = dict(DEFAULT_FIELD_BOOSTS)
+    for item in filter(None, (part.strip() for part in (value or "").split(","))):
+        field, _, boost = item.partition("=")
+        field = field.strip()
+        if field not in DEFAULT_FIELD_BOOSTS:
+            raise ValueError(f"Unknown search field: {field}")
+        boosts[field] = float(boost)
+        if boosts[field] < 0:
+            raise ValueError(f"Boost for {field} must not be negative")
+    return boosts
+
+
+class _Segment:
+    """
+    An immutable block of consecutive rows of a TF–IDF index.
+
+    Attributes:
+        name (str): File name of the segment inside the index directory.
+        start (int): Global row number of the segment's first row.
+        counts (dict): Raw term counts per field, kept for IDF refreshes.
+        weights (dict): L2-normalized TF–IDF rows per field used for scoring.
+    """
+    def __init__(self, start: int, counts: dict, weights: dict, name: str = None):
+        self.name = name or f"segment-{uuid.uuid4().hex}.pkl"
+        self.start = start
+        self.counts = counts
+        self.weights = weights
+
+
+class _PostingsSegment:
+    """
+    An immutable block of consecutive rows of a BM25 index.
+
+    Attributes:
+        name (str): File name of the segment inside the index directory.
+        start (int): Global row number of the segment's first row.
+        postings (dict): Per field, maps each term to ``(rows, term frequencies, max
+            term frequency, min field length)``; rows are global and ascending.
+        lengths (dict): Number of indexed tokens of each field in each of the rows.
+    """
+    def __init__(self, start: int, postings: dict, lengths: dict, name: str = None):
+        self.name = name or f"segment-{uuid.uuid4().hex}.pkl"
+        self.start = start
+        self.postings = postings
+        self.lengths = lengths
+
+
+class _FieldedIndex:
+    """
+    Row bookkeeping shared by the index implementations.
+
+    Every field of a bill lives in the same global row, so per-field scores can be
+    added up row by row. Replacing a bill appends a new row and masks the old one.
+
+    Attributes:
+        boosts (dict): Boost per indexed field; only fields with a positive boost are indexed.
+        bill_ids (list[int]): Bill id for each row; replaced rows keep their slot.
+        alive (numpy.ndarray): Boolean mask of rows holding a bill's current document.
+        updates_since_refresh (int): Rows added or replaced since the last refresh.
+        built_at (datetime): When the index was last built or refreshed.
+        version (int): Number of upserts applied to the index; together with
+            ``built_at`` it identifies the indexed corpus (see ``cache_token``).
+    """
+    kind = None
+
+    def __init__(self, boosts: dict = None, refresh_ratio: float = IDF_REFRESH_RATIO):
+        boosts = DEFAULT_FIELD_BOOSTS if boosts is None else boosts
+        self.boosts = {field: float(boost) for field, boost in boosts.items() if boost > 0}
+        self.refresh_ratio = refresh_ratio
+        self.bill_ids = []
+        self.alive = np.zeros(0, dtype=bool)
+        self.updates_since_refresh = 0
+        self.built_at = None
+        self.version = 0
+        self._row_of = {}
+        self._segments = []
+        # Names of segments merged away since the last save, to delete when saving.
+        self._obsolete = set()
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    @property
+    def cache_token(self) -> str:
+        """A string that changes whenever the indexed documents change, for keying caches."""
+        return f"{self.kind}:{self.built_at.isoformat() if self.built_at else '-'}:{self.version}"
+
+    @property
+    def fields(self) -> list:
+        """The indexed fields, in a stable order."""
+        return list(self.boosts)
+
+    def copy(self):
+        """
+        Return a copy that can be updated while this index keeps serving searches.
+
+        Compacted data is never modified in place and is shared between the copies.
+        """
+        clone = copy.copy(self)
+        clone.bill_ids = list(self.bill_ids)
+        clone.alive = self.alive.copy()
+        clone._row_of = dict(self._row_of)
+        clone._segments = list(self._segments)
+        clone._obsolete = set(self._obsolete)
+        return clone
+
+    def upsert(self, bill_ids: list, documents: list):
+        """
+        Add new documents or replace the documents of already indexed bills.
+
+        Only the given documents are processed. Statistics used for scoring are
+        refreshed once enough of the corpus has changed.
+
+        Args:
+            bill_ids (list[int]): Bill ids whose documents changed.
+            documents (list[dict]): Field name to text for each bill, aligned with ``bill_ids``.
+        Returns:
+            The index itself, for chaining.
+        """
+        bill_ids, documents = _dedupe(bill_ids, documents)
+        if not bill_ids:
+            return self
+        self._append(bill_ids, documents)
+        self.version += 1
+        self.updates_since_refresh += len(bill_ids)
+        if self.updates_since_refresh > self.refresh_ratio * max(len(self), 1):
+            self.refresh()
+        return self
+
+    def _add_rows(self, bill_ids: list) -> int:
+        """Allocate rows for ``bill_ids``, masking the rows they replace; return the first row."""
+        start = len(self.bill_ids)
+        for offset, bill_id in enumerate(bill_ids):
+            previous = self._row_of.get(bill_id)
+            if previous is not None:
+                self.alive[previous] = False
+            self._row_of[bill_id] = start + offset
+        self.bill_ids.extend(bill_ids)
+        self.alive = np.concatenate([self.alive, np.ones(len(bill_ids), dtype=bool)])
+        return start
+
+    def _compact_rows(self) -> None:
+        """Drop replaced rows from the row bookkeeping."""
+        self.bill_ids = [bill_id for bill_id, alive in zip(self.bill_ids, self.alive) if alive]
+        self.alive = np.ones(len(self.bill_ids), dtype=bool)
+        self._row_of = {bill_id: row for row, bill_id in enumerate(self.bill_ids)}
+        self.updates_since_refresh = 0
+        self.built_at = datetime.now(timezone.utc)
+
+    def _field_texts(self, documents: list, field: str) -> list:
+        """Return the text of ``field`` for every document, with missing fields empty."""
+        return [document.get(field) or "" for document in documents]
+
+    def _candidate_mask(self, bill_ids):
+        """Return a boolean row mask selecting ``bill_ids``, or None to allow every row."""
+        if bill_ids is None:
+            return None
+        mask = np.zeros(len(self.bill_ids), dtype=bool)
+        rows = [self._row_of[bill_id] for bill_id in bill_ids if bill_id in self._row_of]
+        mask[rows] = True
+        return mask
+
+    def _top_k(self, scores, top_k: int) -> list:
+        """Return ``(bill_id, score)`` for the best ``top_k`` positive scores."""
+        matches = np.flatnonzero(scores > 0)
+        if len(matches) > top_k:
+            matches = matches[np.argpartition(-scores[matches], top_k - 1)[:top_k]]
+        matches = matches[np.argsort(-scores[matches], kind="stable")]
+        return [(self.bill_ids[i], float(scores[i])) for i in matches]
+
+    def save(self, path: str, replace: bool = False) -> None:
+        """
+        Persist the index to the directory ``path``.
+
+        Segment files are immutable, so only segments that are not on disk yet are
+        written. The manifest is replaced atomically afterwards, which means workers
+        reading concurrently never see a partially written index. Only segments this
+        index merged away itself are deleted, never ones another writer's manifest
+        may still list.
+
+        Args:
+            path (str): The index directory.
+            replace (bool): The index replaces whatever is stored in ``path``, e.g.
+                after a rebuild, so every other segment file there is deleted too,
+                including ones left behind by interrupted saves. Only safe while
+                holding :func:`index_lock`.
+        """
+        os.makedirs(path, exist_ok=True)
+        if replace:
+            self._obsolete.update(
+                name for name in os.listdir(path) if name.startswith("segment-") and name.endswith(".pkl")
+            )
+        for segment in self._segments:
+            segment_path = os.path.join(path, segment.name)
+            if not os.path.exists(segment_path):
+                _atomic_dump(segment_path, self._segment_payload(segment))
+        _atomic_dump(os.path.join(path, MANIFEST_NAME), self._manifest())
+
+        current = {segment.name for segment in self._segments}
+        for name in self._obsolete - current:
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass
+        self._obsolete = set()
+
+    @classmethod
+    def load(cls, path: str, previous=None):
+        """
+        Load an index previously written by :meth:`save`.
+
+        Args:
+            path (str): The index directory.
+            previous (optional): An index of the same kind loaded earlier from the same
+                directory; its segments are reused instead of being read again.
+        Raises:
+            IndexFormatError: If the index is missing, unreadable or was written by a
+                different index kind or format version.
+        """
+        manifest, index = cls._read_manifest(path)
+        loaded = {segment.name: segment for segment in (previous._segments if previous else [])}
+        for name, start in manifest["segments"]:
+            segment = loaded.get(name)
+            if segment is None:
+                segment = index._read_segment(_read(os.path.join(path, name)), name, start)
+            index._segments.append(segment)
+        index._loaded(manifest)
+        return index
+
+    def _set_segments(self, segments: list) -> None:
+        """Replace the segments, remembering the replaced ones for deletion on save."""
+        self._obsolete.update(segment.name for segment in self._segments)
+        self._segments = segments
+
+    def _segment_payload(self, segment) -> dict:
+        """Return the data of ``segment`` to pickle into its file."""
+        raise NotImplementedError
+
+    def _read_segment(self, data: dict, name: str, start: int):
+        """Rebuild a segment from the data of its file."""
+        raise NotImplementedError
+
+    def _loaded(self, manifest: dict) -> None:
+        """Restore the kind-specific state of a loaded index from its manifest and segments."""
+
+    def _manifest(self) -> dict:
+        """Return the manifest entries common to all index kinds."""
+        return {
+            "format_version": INDEX_FORMAT_VERSION,
+            "kind": self.kind,
+            "built_at": self.built_at,
+            "version": self.version,
+            "boosts": self.boosts,
+            "bill_ids": self.bill_ids,
+            "alive": self.alive,
+            "updates_since_refresh": self.updates_since_refresh,
+            "segments": [(segment.name, segment.start) for segment in self._segments],
+        }
+
+    @classmethod
+    def _read_manifest(cls, path: str):
+        """Read and validate the manifest in ``path``; return it with a bare index."""
+        manifest = _read(os.path.join(path, MANIFEST_NAME))
+        if not isinstance(manifest, dict) or manifest.get("format_version") != INDEX_FORMAT_VERSION:
+            raise IndexFormatError(f"Search index at {path} has an unsupported format version.")
+        if manifest.get("kind") != cls.kind:
+            raise IndexFormatError(f"Search index at {path} is not a {cls.kind} index.")
+
+        index = cls(boosts=manifest["boosts"])
+        index.bill_ids = manifest["bill_ids"]
+        index.alive = manifest["alive"]
+        index.updates_since_refresh = manifest["updates_since_refresh"]
+        index.built_at = manifest["built_at"]
+        index.version = manifest.get("version", 0)
+        index._row_of = {
+            bill_id: row for row, bill_id in enumerate(index.bill_ids) if index.alive[row]
+        }
+        return manifest, index
+
+
+class TfidfSearchIndex(_FieldedIndex):
+    """
+    Incrementally updatable, field-weighted TF–IDF index over bill documents.
+
+    Each field is scored by the cosine similarity between the query and the field's
+    text, using that field's IDF statistics; a bill's score is the boosted sum.
+
+    Attributes:
+        idf (dict): IDF weight per hashed term for each field, as of the last refresh.
+    """
+    kind = "tfidf"
+
+    def __init__(self, boosts: dict = None, refresh_ratio: float = IDF_REFRESH_RATIO):
+        """Create an empty index; call :meth:`build` or :meth:`load` to populate it."""
+        super().__init__(boosts, refresh_ratio)
+        self.idf = {field: np.ones(N_FEATURES) for field in self.fields}
+        self._doc_freq = {field: (_EMPTY, _EMPTY) for field in self.fields}
+        self._n_docs = 0
+        self._hasher = HashingVectorizer(
+            n_features=N_FEATURES, stop_words="english", alternate_sign=False, norm=None
+        )
+
+    def build(self, bill_ids: list, documents: list) -> "TfidfSearchIndex":
+        """
+        Index the given documents from scratch, replacing any existing contents.
+
+        Args:
+            bill_ids (list[int]): Bill id for each document.
+            documents (list[dict]): Field name to text for each bill, aligned with ``bill_ids``.
+        Returns:
+            TfidfSearchIndex: The index itself, for chaining.
+        """
+        self.bill_ids = []
+        self.alive = np.zeros(0, dtype=bool)
+        self._row_of = {}
+        self._set_segments([])
+        bill_ids, documents = _dedupe(bill_ids, documents)
+        if bill_ids:
+            self._add_rows(bill_ids)
+            self._segments = [_Segment(0, self._count(documents), None)]
+        return self.refresh()
+
+    def refresh(self) -> "TfidfSearchIndex":
+        """
+        Recompute IDF statistics from the live rows and merge all segments into one.
+
+        This reuses the stored term counts, so no document text is re-processed.
+        """
+        counts = {}
+        for field in self.fields:
+            if self._segments:
+                merged = sp.vstack([segment.counts[field] for segment in self._segments]).tocsr()
+                counts[field] = merged[self.alive]
+            else:
+                counts[field] = sp.csr_matrix((0, N_FEATURES))
+        self._compact_rows()
+
+        # Smoothed IDF, matching sklearn's TfidfTransformer defaults.
+        self._n_docs = len(self.bill_ids)
+        for field in self.fields:
+            doc_freq = np.bincount(counts[field].indices, minlength=N_FEATURES)
+            terms = np.flatnonzero(doc_freq)
+            self._doc_freq[field] = (terms, doc_freq[terms])
+        self._compute_idf()
+
+        self._set_segments([_Segment(0, counts, self._weigh(counts))] if self._n_docs else [])
+        return self
+
+    def search(self, query: str, top_k: int = 20, bill_ids=None) -> list:
+        """
+        Rank indexed bills against a query.
+
+        Rows and the query vector are both L2-normalized per field, so each sparse dot
+        product is the cosine similarity between the query and that field.
+
+        Args:
+            query (str): Free-text search query.
+            top_k (int): Maximum number of results to return.
+            bill_ids (Iterable[int], optional): Only rank these bills, e.g. the bills
+                passing a filter; all bills when omitted.
+        Returns:
+            list[tuple[int, float]]: ``(bill_id, score)`` pairs with positive scores,
+            best match first.
+        """
+        if not self._segments or not query:
+            return []
+
+        query_counts = self._hasher.transform([query])
+        if query_counts.nnz == 0:
+            return []
+        query_vecs = self._weigh({field: query_counts for field in self.fields})
+        scores = np.zeros(len(self.bill_ids))
+        for field, boost in self.boosts.items():
+            scores += boost * np.concatenate([
+                (segment.weights[field] @ query_vecs[field].T).toarray().ravel()
+                for segment in self._segments
+            ])
+        scores[~self.alive] = 0
+        mask = self._candidate_mask(bill_ids)
+        if mask is not None:
+            scores[~mask] = 0
+        return self._top_k(scores, top_k)
+
+    def _manifest(self) -> dict:
+        manifest = super()._manifest()
+        manifest["n_docs"] = self._n_docs
+        manifest["doc_freq"] = self._doc_freq
+        return manifest
+
+    def _segment_payload(self, segment: _Segment) -> dict:
+        return {"counts": segment.counts, "weights": segment.weights}
+
+    def _read_segment(self, data: dict, name: str, start: int) -> _Segment:
+        return _Segment(start, data["counts"], data["weights"], name=name)
+
+    def _loaded(self, manifest: dict) -> None:
+        self._n_docs = manifest["n_docs"]
+        self._doc_freq = manifest["doc_freq"]
+        self._compute_idf()
+
+    def _append(self, bill_ids: list, documents: list) -> None:
+        """Vectorize ``documents`` into a new segment weighted with the current IDF."""
+        start = self._add_rows(bill_ids)
+        counts = self._count(documents)
+        self._segments.append(_Segment(start, counts, self._weigh(counts)))
+
+    def _count(self, documents: list) -> dict:
+        """Hash the terms of every indexed field into raw count matrices."""
+        return {
+            field: self._hasher.transform(self._field_texts(documents, field)).tocsr()
+            for field in self.fields
+        }
+
+    def _compute_idf(self) -> None:
+        """Expand the stored document frequencies into dense IDF vectors."""
+        for field in self.fields:
+            idf = np.full(N_FEATURES, np.log(1 + self._n_docs) + 1)
+            terms, doc_freq = self._doc_freq[field]
+            idf[terms] = np.log((1 + self._n_docs) / (1 + doc_freq)) + 1
+            self.idf[field] = idf
+
+    def _weigh(self, counts: dict) -> dict:
+        """Apply each field's IDF weights to raw term counts and L2-normalize each row."""
+        return {
+            field: normalize(sp.csr_matrix(counts[field].multiply(self.idf[field])))
+            for field in self.fields
+        }
+
+
+class BM25SearchIndex(_FieldedIndex):
+    """
+    Field-weighted inverted index over bill documents ranked with Okapi BM25.
+
+    Each field maps terms to a postings list of the rows containing them and the
+    term's frequency in each row, so a query only touches the postings of its own
+    terms instead of scoring every document. A bill's score is the boosted sum of its
+    per-field BM25 scores. ``(field, term)`` pairs are processed from the highest to
+    the lowest score upper bound; once the remaining pairs can no longer change which
+    documents make the top ``k``, their postings are only probed for those documents.
+
+    Postings live in immutable segments: new or replaced documents are appended as a
+    new segment and masked rows, and a term's postings list is the concatenation of
+    its postings in every segment. Document frequencies and average field lengths
+    include replaced rows until the next :meth:`refresh` compacts the index into a
+    single segment.
+
+    Attributes:
+        doc_lengths (dict): Number of indexed tokens of each field in each row.
+    """
+    kind = "bm25"
+
+    def __init__(self, boosts: dict = None, refresh_ratio: float = IDF_REFRESH_RATIO,
+                 k1: float = BM25_K1, b: float = BM25_B):
+        """Create an empty index; call :meth:`build` or :meth:`load` to populate it."""
+        super().__init__(boosts, refresh_ratio)
+        self.k1 = k1
+        self.b = b
+        self.doc_lengths = {field: np.zeros(0, dtype=np.int32) for field in self.fields}
+        self._analyzer = _build_analyzer()
+
+    def copy(self) -> "BM25SearchIndex":
+        clone = super().copy()
+        clone.doc_lengths = dict(self.doc_lengths)
+        return clone
+
+    def build(self, bill_ids: list, documents: list) -> "BM25SearchIndex":
+        """
+        Index the given documents from scratch, replacing any existing contents.
+
+        Args:
+            bill_ids (list[int]): Bill id for each document.
+            documents (list[dict]): Field name to text for each bill, aligned with ``bill_ids``.
+        Returns:
+            BM25SearchIndex: The index itself, for chaining.
+        """
+        self.bill_ids = []
+        self.alive = np.zeros(0, dtype=bool)
+        self._row_of = {}
+        self.doc_lengths = {field: np.zeros(0, dtype=np.int32) for field in self.fields}
+        self._set_segments([])
+        self._append(*_dedupe(bill_ids, documents))
+        return self.refresh()
+
+    def refresh(self) -> "BM25SearchIndex":
+        """
+        Drop replaced rows, merge all segments into one and recompute the per-term
+        score bounds.
+        """
+        new_row = np.cumsum(self.alive) - 1
+        alive = self.alive
+        merged, lengths = {}, {}
+        for field in self.fields:
+            lengths[field] = self.doc_lengths[field][alive]
+            postings = {}
+            for term in set().union(*(segment.postings[field] for segment in self._segments)):
+                rows, tfs = self._term_postings(field, term)
+                keep = alive[rows]
+                if not keep.any():
+                    continue
+                rows, tfs = new_row[rows[keep]].astype(np.int32), tfs[keep]
+                postings[term] = (rows, tfs, int(tfs.max()), int(lengths[field][rows].min()))
+            merged[field] = postings
+        self._compact_rows()
+        self.doc_lengths = dict(lengths)
+        self._set_segments([_PostingsSegment(0, merged, lengths)] if self.bill_ids else [])
+        return self
+
+    def search(self, query: str, top_k: int = 20, bill_ids=None) -> list:
+        """
+        Rank indexed bills against a query with field-weighted BM25.
+
+        Restricting the search to ``bill_ids`` drops other rows from the postings
+        before scoring, so the top k is taken among the allowed bills only.
+
+        Args:
+            query (str): Free-text search query.
+            top_k (int): Maximum number of results to return.
+            bill_ids (Iterable[int], optional): Only rank these bills, e.g. the bills
+                passing a filter; all bills when omitted.
+        Returns:
+            list[tuple[int, float]]: ``(bill_id, score)`` pairs with positive scores,
+            best match first.
+        """
+        n_rows = len(self.bill_ids)
+        if not n_rows or not query or top_k <= 0:
+            return []
+        terms = set(self._analyzer(query))
+        mask = self._candidate_mask(bill_ids)
+
+        plans = []
+        for field, boost in self.boosts.items():
+            avg_length = max(self.doc_lengths[field].mean(), 1.0)
+            for term in terms:
+                rows, tfs = self._term_postings(field, term)
+                doc_freq = len(rows)
+                if mask is not None:
+                    keep = mask[rows]
+                    rows, tfs = rows[keep], tfs[keep]
+                if not len(rows):
+                    continue
+                weight = boost * np.log(1 + (n_rows - doc_freq + 0.5) / (doc_freq + 0.5))
+                max_tf, min_length = self._term_bounds(field, term, tfs, rows)
+                bound = weight * self._saturation(max_tf, min_length, avg_length)
+                plans.append((bound, field, rows, tfs, weight, avg_length))
+        if not plans:
+            return []
+        plans.sort(key=lambda plan: -plan[0])
+
+        scores = np.zeros(n_rows)
+        remaining = sum(plan[0] for plan in plans)
+        finished = len(plans)
+        for position, (bound, field, rows, tfs, weight, avg_length) in enumerate(plans):
+            if position and np.count_nonzero(scores) > top_k:
+                kth, next_best = -np.partition(-scores, [top_k - 1, top_k])[[top_k - 1, top_k]]
+                if next_best + remaining <= kth:
+                    # No document outside the current top k can catch up any more.
+                    finished = position
+                    break
+            scores[rows] += self._contributions(field, rows, tfs, weight, avg_length)
+            remaining -= bound
+
+        matches = np.flatnonzero(scores > 0)
+        if len(matches) > top_k:
+            matches = matches[np.argpartition(-scores[matches], top_k - 1)[:top_k]]
+        for _, field, rows, tfs, weight, avg_length in plans[finished:]:
+            positions = np.minimum(np.searchsorted(rows, matches), len(rows) - 1)
+            hits = rows[positions] == matches
+            scores[matches[hits]] += self._contributions(
+                field, rows[positions[hits]], tfs[positions[hits]], weight, avg_length
+            )
+        top = np.zeros(n_rows)
+        top[matches] = scores[matches]
+        return self._top_k(top, top_k)
+
+    def _manifest(self) -> dict:
+        manifest = super()._manifest()
+        manifest["k1"] = self.k1
+        manifest["b"] = self.b
+        return manifest
+
+    def _segment_payload(self, segment: _PostingsSegment) -> dict:
+        return {"postings": segment.postings, "lengths": segment.lengths}
+
+    def _read_segment(self, data: dict, name: str, start: int) -> _PostingsSegment:
+        return _PostingsSegment(start, data["postings"], data["lengths"], name=name)
+
+    def _loaded(self, manifest: dict) -> None:
+        self.k1 = manifest["k1"]
+        self.b = manifest["b"]
+        if self._segments:
+            self.doc_lengths = {
+                field: np.concatenate([segment.lengths[field] for segment in self._segments])
+                for field in self.fields
+            }
+
+    def _append(self, bill_ids: list, documents: list) -> None:
+        """Tokenize ``documents`` into a new segment of postings for new rows."""
+        if not bill_ids:
+            return
+        start = self._add_rows(bill_ids)
+        postings, lengths = {}, {}
+        for field in self.fields:
+            field_lengths = []
+            entries = {}
+            for offset, text in enumerate(self._field_texts(documents, field)):
+                tokens = self._analyzer(text)
+                field_lengths.append(len(tokens))
+                for term, tf in Counter(tokens).items():
+                    entries.setdefault(term, []).append((start + offset, tf))
+            lengths[field] = np.array(field_lengths, dtype=np.int32)
+            postings[field] = {}
+            for term, pairs in entries.items():
+                pairs = np.array(pairs, dtype=np.int32)
+                rows, tfs = pairs[:, 0], pairs[:, 1]
+                postings[field][term] = (rows, tfs, int(tfs.max()), int(lengths[field][rows - start].min()))
+            self.doc_lengths[field] = np.concatenate([self.doc_lengths[field], lengths[field]])
+        self._segments.append(_PostingsSegment(start, postings, lengths))
+
+    def _term_postings(self, field: str, term: str) -> tuple:
+        """Return the rows and term frequencies of ``term`` in ``field`` across all segments."""
+        found = [segment.postings[field][term] for segment in self._segments if term in segment.postings[field]]
+        if not found:
+            return _EMPTY, _EMPTY
+        if len(found) == 1:
+            return found[0][:2]
+        return np.concatenate([rows for rows, *_ in found]), np.concatenate([tfs for _, tfs, *_ in found])
+
+    def _term_bounds(self, field: str, term: str, tfs, rows) -> tuple:
+        """Return the largest term frequency and smallest field length for ``term``."""
+        found = [segment.postings[field][term] for segment in self._segments if term in segment.postings[field]]
+        if len(found) == 1:
+            return found[0][2:]
+        return int(tfs.max()), int(self.doc_lengths[field][rows].min())
+
+    def _saturation(self, tf, length, avg_length):
+        """BM25 term-frequency saturation, without the IDF factor."""
+        return tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+
+    def _contributions(self, field: str, rows, tfs, weight: float, avg_length: float):
+        """Boosted BM25 contributions of one term in ``field``; replaced rows score zero."""
+        return weight * self._saturation(tfs, self.doc_lengths[field][rows], avg_length) * self.alive[rows]
+
+
+def _build_analyzer():
+    """Tokenizer shared with the TF–IDF index: lowercase words minus English stop words."""
+    return TfidfVectorizer(stop_words="english").build_analyzer()
+
+
+def _dedupe(bill_ids: list, documents: list) -> tuple:
+    """Keep only the last document given for each bill id, preserving order."""
+    latest = dict(zip(bill_ids, documents))
+    return list(latest.keys()), list(latest.values())
+
+
+def _atomic_dump(path: str, payload) -> None:
+    """Pickle ``payload`` to a temporary file next to ``path`` and move it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _read(path: str):
+    """Unpickle ``path``, converting read failures into :class:`IndexFormatError`."""
+    try:
+        with open(path, "rb") as handle:
+            return pickle.load(handle)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError) as e:
+        raise IndexFormatError(f"Could not read search index file {path}: {e}") from e
@@ -0,0 +1,353 @@
+import math
+import pickle
+import random
+import threading
+from collections import Counter
+from unittest.mock import patch
+import numpy as np
+import pytest
+from backend.search_index import (
+    TfidfSearchIndex, BM25SearchIndex, IndexFormatError, INDEX_FORMAT_VERSION, MANIFEST_NAME,
+    index_lock, parse_field_boosts, _read
+)
+
+TITLE_ONLY = {"title": 1.0}
+
+def titles(*texts):
+    """
+    Wrap plain strings as title-only documents.
+    """
+    return [{"title": text} for text in texts]
+
+BILL_IDS = [1, 2, 3]
+DOCUMENTS = titles(
+    "Clean Water Act amendments for rural water systems",
+    "National defense authorization for fiscal year 2024",
+    "Water infrastructure financing and drinking water safety",
+)
+
+@pytest.fixture
+def index():
+    return TfidfSearchIndex().build(BILL_IDS, DOCUMENTS)
+
+def test_search_ranks_matching_bills(index):
+    """
+    Test that only bills containing the query terms are returned, best match first.
+    """
+    results = index.search("drinking water")
+    assert [bill_id for bill_id, _ in results] == [3, 1]
+    assert results[0][1] > results[1][1] > 0
+
+def test_search_respects_top_k(index):
+    """
+    Test that the number of results is capped at top_k.
+    """
+    assert len(index.search("water", top_k=1)) == 1
+
+def test_search_unknown_terms(index):
+    """
+    Test that queries with no indexed terms return no results.
+    """
+    assert index.search("zebra") == []
+    assert index.search("") == []
+
+def test_empty_index():
+    """
+    Test that an index built from no documents answers every query with no results.
+    """
+    index = TfidfSearchIndex().build([], [])
+    assert len(index) == 0
+    assert index.search("water") == []
+
+def test_upsert_adds_new_documents(index):
+    """
+    Test that documents added incrementally become searchable.
+    """
+    index.refresh_ratio = 1.0
+    index.upsert([4], titles("Veterans health care access"))
+    assert len(index) == 4
+    assert [bill_id for bill_id, _ in index.search("veterans")] == [4]
+    assert index.updates_since_refresh == 1
+
+def test_upsert_replaces_existing_documents(index):
+    """
+    Test that re-indexing a bill replaces its old document instead of duplicating it.
+    """
+    index.refresh_ratio = 1.0
+    index.upsert([2], titles("Drinking water standards for schools"))
+    assert len(index) == 3
+    assert index.search("defense") == []
+    assert 2 in [bill_id for bill_id, _ in index.search("drinking water")]
+
+def test_upsert_refreshes_idf_after_enough_updates(index):
+    """
+    Test that IDF statistics are refreshed and segments merged once the share of
+    changed documents passes the refresh ratio.
+    """
+    index.refresh_ratio = 0.3
+    index.upsert([4], titles("Veterans health care access"))
+    assert index.updates_since_refresh == 1
+    index.upsert([5], titles("Veterans housing assistance"))
+    assert index.updates_since_refresh == 0
+    assert index.bill_ids == [1, 2, 3, 4, 5]
+
+    rebuilt = TfidfSearchIndex().build(
+        BILL_IDS + [4, 5],
+        DOCUMENTS + titles("Veterans health care access", "Veterans housing assistance")
+    )
+    assert index.search("veterans housing") == rebuilt.search("veterans housing")
+
+def test_copy_is_independent(index):
+    """
+    Test that updating a copy leaves the original index untouched.
+    """
+    updated = index.copy().upsert([4], titles("Veterans health care access"))
+    assert updated.search("veterans")
+    assert index.search("veterans") == []
+
+def test_save_and_load_round_trip(index, tmp_path):
+    """
+    Test that a saved index, including incremental segments, loads back and
+    produces identical rankings.
+    """
+    index.refresh_ratio = 1.0
+    index.upsert([2], titles("Drinking water standards for schools"))
+    index.save(str(tmp_path))
+    loaded = TfidfSearchIndex.load(str(tmp_path))
+    assert len(loaded) == 3
+    assert loaded.search("water") == index.search("water")
+
+def test_save_removes_merged_segments(index, tmp_path):
+    """
+    Test that segments merged away by a refresh are deleted from disk.
+    """
+    index.refresh_ratio = 1.0
+    index.upsert([4], titles("Veterans health care access"))
+    index.save(str(tmp_path))
+    assert len(list(tmp_path.glob("segment-*.pkl"))) == 2
+    index.refresh().save(str(tmp_path))
+    assert len(list(tmp_path.glob("segment-*.pkl"))) == 1
+
+def test_save_keeps_segments_of_other_writers(index, tmp_path):
+    """
+    Test that saving only deletes segments the saved index merged away itself, unless
+    it replaces the stored index.
+    """
+    index.save(str(tmp_path))
+    stored = {path.name for path in tmp_path.glob("segment-*.pkl")}
+    other = TfidfSearchIndex().build([4], titles("Veterans health care access"))
+    other.save(str(tmp_path))
+    assert stored < {path.name for path in tmp_path.glob("segment-*.pkl")}
+
+    other.build([5], titles("Veterans housing assistance")).save(str(tmp_path), replace=True)
+    assert len(list(tmp_path.glob("segment-*.pkl"))) == 1
+    assert [bill_id for bill_id, _ in TfidfSearchIndex.load(str(tmp_path)).search("veterans")] == [5]
+
+def test_index_lock_is_exclusive(tmp_path):
+    """
+    Test that a second holder of the index lock waits until the first releases it.
+    """
+    acquired = threading.Event()
+    def hold():
+        with index_lock(str(tmp_path)):
+            acquired.set()
+
+    with index_lock(str(tmp_path)):
+        thread = threading.Thread(target=hold)
+        thread.start()
+        assert not acquired.wait(0.2)
+    assert acquired.wait(5)
+    thread.join()
+
+def test_load_rejects_other_format_versions(index, tmp_path):
+    """
+    Test that indexes written in another format version are rejected.
+    """
+    with open(tmp_path / MANIFEST_NAME, "wb") as handle:
+        pickle.dump({"format_version": INDEX_FORMAT_VERSION + 1, "kind": "tfidf"}, handle)
+    with pytest.raises(IndexFormatError):
+        TfidfSearchIndex.load(str(tmp_path))
+    with pytest.raises(IndexFormatError):
+        TfidfSearchIndex.load(str(tmp_path / "missing"))
+
+def brute_force_bm25(documents, query, k1=1.2, b=0.75):
+    """
+    Score every document with textbook BM25, for comparison with the inverted index.
+    """
+    analyzer = BM25SearchIndex()._analyzer
+    tokenized = [analyzer(document) for document in documents]
+    avg_length = max(sum(len(tokens) for tokens in tokenized) / len(tokenized), 1.0)
+    scores = [0.0] * len(documents)
+    for term in set(analyzer(query)):
+        df = sum(1 for tokens in tokenized if term in tokens)
+        if not df:
+            continue
+        idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+        for row, tokens in enumerate(tokenized):
+            tf = Counter(tokens)[term]
+            if tf:
+                scores[row] += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(tokens) / avg_length))
+    return scores
+
+@pytest.fixture
+def bm25_index():
+    return BM25SearchIndex().build(BILL_IDS, DOCUMENTS)
+
+def test_bm25_ranks_matching_bills(bm25_index):
+    """
+    Test that BM25 only returns bills containing the query terms, best match first.
+    """
+    results = bm25_index.search("drinking water")
+    assert [bill_id for bill_id, _ in results] == [3, 1]
+    assert bm25_index.search("zebra") == []
+    assert bm25_index.search("") == []
+
+def test_bm25_matches_brute_force_scores():
+    """
+    Test that the pruned top-k search returns the same ranking and scores as
+    scoring every document exhaustively.
+    """
+    rng = random.Random(7)
+    vocabulary = [f"term{i}" for i in range(60)]
+    documents = [
+        " ".join(rng.choices(vocabulary, weights=range(60, 0, -1), k=rng.randint(5, 40)))
+        for _ in range(300)
+    ]
+    index = BM25SearchIndex(boosts=TITLE_ONLY).build(list(range(300)), titles(*documents))
+    for query in ["term0 term1 term2 term3", "term5 term40", "term59", "term2 term2 term30 term31"]:
+        expected = brute_force_bm25(documents, query)
+        ranked = sorted(range(300), key=lambda row: -expected[row])[:5]
+        results = index.search(query, top_k=5)
+        assert [bill_id for bill_id, _ in results] == ranked
+        for bill_id, score in results:
+            assert score == pytest.approx(expected[bill_id])
+
+def test_bm25_early_termination():
+    """
+    Test that once the remaining query terms cannot change the top-k set, their
+    postings are only probed for the top-k documents, and scores stay exact.
+    """
+    documents = [
+        " ".join(["rare"] * (i if i < 20 else 0) + ["common"] + [f"filler{j}" for j in range(40 - i % 20)])
+        for i in range(300)
+    ]
+    index = BM25SearchIndex(boosts=TITLE_ONLY).build(list(range(300)), titles(*documents))
+    with patch.object(np, "searchsorted", wraps=np.searchsorted) as searchsorted:
+        results = index.search("rare common", top_k=5)
+    assert searchsorted.call_count == 1
+    assert [bill_id for bill_id, _ in results] == [19, 18, 17, 16, 15]
+    expected = brute_force_bm25(documents, "rare common")
+    for bill_id, score in results:
+        assert score == pytest.approx(expected[bill_id])
+
+def test_bm25_upsert_and_refresh(bm25_index):
+    """
+    Test that incremental updates are searchable, replace old documents, and
+    survive compaction.
+    """
+    bm25_index.refresh_ratio = 1.0
+    bm25_index.upsert([2, 4], titles("Drinking water standards for schools", "Veterans health care access"))
+    assert len(bm25_index) == 4
+    assert bm25_index.search("defense") == []
+    assert [bill_id for bill_id, _ in bm25_index.search("veterans")] == [4]
+
+    before = bm25_index.search("drinking water")
+    bm25_index.refresh()
+    assert bm25_index.bill_ids == [1, 3, 2, 4]
+    assert [bill_id for bill_id, _ in bm25_index.search("drinking water")] == [bill_id for bill_id, _ in before]
+
+def test_bm25_save_and_load_round_trip(bm25_index, tmp_path):
+    """
+    Test that a saved BM25 index, including pending postings, loads back intact.
+    """
+    bm25_index.refresh_ratio = 1.0
+    bm25_index.upsert([4], titles("Veterans health care access"))
+    bm25_index.save(str(tmp_path))
+    loaded = BM25SearchIndex.load(str(tmp_path))
+    assert loaded.search("water veterans") == bm25_index.search("water veterans")
+    with pytest.raises(IndexFormatError):
+        TfidfSearchIndex.load(str(tmp_path))
+
+@pytest.mark.parametrize("index_type", [TfidfSearchIndex, BM25SearchIndex])
+def test_load_reuses_segments_of_previous_index(index_type, tmp_path):
+    """
+    Test that an update is saved as a new segment next to a small manifest, and that
+    loading it over a previously loaded index only reads the new segment.
+    """
+    index = index_type(boosts=TITLE_ONLY, refresh_ratio=1.0).build(BILL_IDS, DOCUMENTS)
+    index.save(str(tmp_path))
+    first = index_type.load(str(tmp_path))
+
+    updated = first.copy()
+    updated.refresh_ratio = 1.0
+    updated.upsert([4], titles("Veterans health care access"))
+    updated.save(str(tmp_path))
+    with open(tmp_path / MANIFEST_NAME, "rb") as handle:
+        manifest = pickle.load(handle)
+    assert not {"postings", "pending", "doc_lengths"} & set(manifest)
+    assert len(manifest["segments"]) == 2
+
+    with patch("backend.search_index._read", wraps=_read) as read:
+        second = index_type.load(str(tmp_path), previous=first)
+    assert [call.args[0] for call in read.call_args_list] == [
+        str(tmp_path / MANIFEST_NAME), str(tmp_path / manifest["segments"][1][0])
+    ]
+    assert second._segments[0] is first._segments[0]
+    assert second.search("water veterans") == updated.search("water veterans")
+    assert index_type.load(str(tmp_path)).search("water veterans") == updated.search("water veterans")
+
+FIELDED_IDS = [1, 2]
+FIELDED_DOCUMENTS = [
+    {"title": "Wildfire prevention", "ai_summary": "Funds forest management.", "full_text": "forest " * 50},
+    {"title": "Forest service appropriations", "ai_summary": "Funds the forest service.", "full_text": "wildfire " * 200},
+]
+
+@pytest.mark.parametrize("index_type", [TfidfSearchIndex, BM25SearchIndex])
+def test_title_matches_outrank_full_text_matches(index_type):
+    """
+    Test that with the default boosts a title match beats many full-text mentions.
+    """
+    index = index_type().build(FIELDED_IDS, FIELDED_DOCUMENTS)
+    assert [bill_id for bill_id, _ in index.search("wildfire")] == [1, 2]
+
+@pytest.mark.parametrize("index_type", [TfidfSearchIndex, BM25SearchIndex])
+def test_zero_boost_skips_field(index_type):
+    """
+    Test that a field with a zero boost is not indexed at all.
+    """
+    boosts = parse_field_boosts("full_text=0")
+    index = index_type(boosts=boosts).build(FIELDED_IDS, FIELDED_DOCUMENTS)
+    assert index.fields == ["title", "ai_summary"]
+    assert [bill_id for bill_id, _ in index.search("wildfire")] == [1]
+
+@pytest.mark.parametrize("index_type", [TfidfSearchIndex, BM25SearchIndex])
+def test_boosts_survive_save_and_load(index_type, tmp_path):
+    """
+    Test that the field boosts an index was built with are persisted.
+    """
+    boosts = {"title": 2.0, "ai_summary": 1.0}
+    index_type(boosts=boosts).build(FIELDED_IDS, FIELDED_DOCUMENTS).save(str(tmp_path))
+    assert index_type.load(str(tmp_path)).boosts == boosts
+
+@pytest.mark.parametrize("index_type", [TfidfSearchIndex, BM25SearchIndex])
+def test_search_restricted_to_bill_ids(index_type):
+    """
+    Test that restricting a search to some bills ranks only those, with unchanged scores.
+    """
+    index = index_type().build(BILL_IDS, DOCUMENTS)
+    unrestricted = dict(index.search("water", top_k=10))
+    results = index.search("water", top_k=1, bill_ids=[3, 2, 99])
+    assert [bill_id for bill_id, _ in results] == [3]
+    assert results[0][1] == pytest.approx(unrestricted[3])
+    assert index.search("water", bill_ids=[]) == []
+
+def test_parse_field_boosts():
+    """
+    Test parsing of boost specifications and rejection of unknown fields.
+    """
+    assert parse_field_boosts("") == {"title": 3.0, "ai_summary": 1.5, "full_text": 0.5}
+    assert parse_field_boosts("title=5, full_text=0")["full_text"] == 0.0
+    with pytest.raises(ValueError):
+        parse_field_boosts("sponsor=2")
+    with pytest.raises(ValueError):
+        parse_field_boosts("title=-1")
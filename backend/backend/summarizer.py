@@ -0,0 +1,319 @@
+"""
+AI Summary Clients
+
+The language-model side of bill summarization, kept apart from scraping so that
+summaries can be produced by a separate job queue at its own pace. Summary jobs talk
+to a ``SummaryClient``; ``OpenAISummaryClient`` calls the OpenAI chat API, while
+``StubSummaryClient`` answers locally and deterministically for tests, benchmarks and
+offline runs.
+
+Summaries are deduplicated by content: ``summary_cache_key`` identifies a summary by
+the normalized text together with the model and prompt version, so identical texts
+(companion bills, re-introductions, re-scrapes) are only ever sent to the model once.
+
+Long bills are summarized map-reduce style by ``ChunkedSummarizer``: the full text is
+split into token-bounded chunks, the chunks are summarized concurrently and their
+summaries are combined into the final one. Chunk boundaries are content-defined, so an
+amendment only changes the chunks around it and cached summaries of the others are
+reused when the bill is summarized again.
+"""
+
+import hashlib
+import math
+import re
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import openai
+
+DEFAULT_MODEL = "gpt-4o"
+DEFAULT_MAX_TOKENS = 300
+
+# Instructions sent with every bill text.
+SUMMARY_PROMPT = (
+    "You are a professional congressional analyst. Summarize the following bill text "
+    "concisely and objectively in 6-8 sentences."
+)
+# Instructions for one chunk of a long bill, and for combining the chunk summaries.
+CHUNK_PROMPT = (
+    "You are a professional congressional analyst. The following is one part of a longer "
+    "bill. Summarize its provisions concisely and objectively in 3-5 sentences."
+)
+REDUCE_PROMPT = (
+    "You are a professional congressional analyst. The following are summaries of the "
+    "consecutive parts of one bill. Combine them into a single concise and objective "
+    "summary of the whole bill in 6-8 sentences."
+)
+# Bump whenever the prompts or the request parameters change, so that summaries
+# cached under the old prompts are no longer reused.
+PROMPT_VERSION = "1"
+# Prompt version of cached chunk summaries, which answer CHUNK_PROMPT.
+CHUNK_PROMPT_VERSION = PROMPT_VERSION + "/chunk"
+
+# Rough size of a token in English text; used instead of a model-specific tokenizer.
+CHARS_PER_TOKEN = 4
+# Largest chunk sent to the model, in estimated tokens.
+DEFAULT_CHUNK_TOKENS = 3000
+DEFAULT_CHUNK_WORKERS = 4
+# About one sentence in this many ends a chunk once it is half full.
+BOUNDARY_MODULUS = 8
+
+# Sentence ends, and the section headings of bill text ("SEC. 2.", "SECTION 1.").
+_SENTENCE_BREAK = re.compile(r"(?<=[.;:])\s+|\s+(?=SEC(?:TION)?\.\s+\d)")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of ``text``."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def chunk_text(text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> list:
+    """
+    Split a text into chunks of at most ``max_tokens`` estimated tokens.
+
+    The text is cut between sentences or before section headings. Once a chunk is half
+    full it ends after any sentence whose hash is divisible by ``BOUNDARY_MODULUS``, so
+    boundaries depend on the nearby text rather than on the position: inserting or
+    removing text only changes the chunks around the edit. Sentences longer than a
+    chunk are cut between words.
+
+    Args:
+        text (str): The text to split.
+        max_tokens (int): Largest chunk size in estimated tokens.
+    Returns:
+        list[str]: The chunks, in order; empty for a blank text.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    sentences = []
+    for sentence in _SENTENCE_BREAK.split(normalize_summary_text(text)):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            sentences.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            sentences.append(sentence)
+
+    chunks, current, size = [], [], 0
+    for sentence in sentences:
+        if current and size + 1 + len(sentence) > max_chars:
+            chunks.append(" ".join(current))
+            current, size = [], 0
+        current.append(sentence)
+        size += len(sentence) + (1 if size else 0)
+        if size >= max_chars // 2 and zlib.crc32(sentence.encode("utf-8")) % BOUNDARY_MODULUS == 0:
+            chunks.append(" ".join(current))
+            current, size = [], 0
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def normalize_summary_text(text: str) -> str:
+    """Collapse runs of whitespace, which do not change what a summary says."""
+    return " ".join(text.split())
+
+
+def summary_cache_key(text: str, model: str, prompt_version: str = PROMPT_VERSION) -> str:
+    """
+    Identify the summary of a text produced by a model and prompt.
+
+    Args:
+        text (str): The text sent for summarization.
+        model (str): The model producing the summary.
+        prompt_version (str): Version of the prompt used.
+    Returns:
+        str: Hex SHA-256 digest of the normalized text, model and prompt version.
+    """
+    digest = hashlib.sha256()
+    for part in (model, prompt_version, normalize_summary_text(text)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SummaryClient:
+    """
+    Interface of the language-model clients that summarize bill text.
+
+    Implementations must be safe to call from several threads at once.
+
+    Attributes:
+        model (str): Identifies the model producing the summaries.
+    """
+
+    model = None
+
+    def summarize(self, text: str, prompt: str = SUMMARY_PROMPT) -> str:
+        """
+        Summarize a bill text.
+
+        Args:
+            text (str): The text to summarize.
+            prompt (str): Instructions for the model, e.g. ``CHUNK_PROMPT`` for part of a bill.
+        Returns:
+            str: The summary.
+        Raises:
+            Exception: If the summary could not be produced; the job is retried later.
+        """
+        raise NotImplementedError
+
+
+class OpenAISummaryClient(SummaryClient):
+    """
+    Summarizes bill text with the OpenAI chat completion API.
+
+    Attributes:
+        model (str): The chat model to use.
+        max_tokens (int): Longest summary requested, in tokens.
+    """
+
+    def __init__(self, model: str = DEFAULT_MODEL, max_tokens: int = DEFAULT_MAX_TOKENS):
+        self.model = model
+        self.max_tokens = max_tokens
+
+    def summarize(self, text: str, prompt: str = SUMMARY_PROMPT) -> str:
+        response = openai.ChatCompletion.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": text}
+            ],
+            max_tokens=self.max_tokens
+        )
+        return response.choices[0].message.content
+
+
+class StubSummaryClient(SummaryClient):
+    """
+    Local stand-in for a language model: the summary is the first sentences of the text.
+
+    Attributes:
+        model (str): Always ``"stub"``.
+        sentences (int): Number of leading sentences kept.
+        latency (float): Seconds each call sleeps, to simulate a remote model.
+        calls (int): Number of texts summarized so far.
+    """
+
+    model = "stub"
+
+    def __init__(self, sentences: int = 3, latency: float = 0.0, sleep=time.sleep):
+        self.sentences = sentences
+        self.latency = latency
+        self.calls = 0
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def summarize(self, text: str, prompt: str = SUMMARY_PROMPT) -> str:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            self._sleep(self.latency)
+        parts = [part.strip() for part in text.split(". ") if part.strip()]
+        summary = ". ".join(parts[:self.sentences])
+        return summary if summary.endswith(".") else summary + "."
+
+
+class ChunkedSummarizer:
+    """
+    Map-reduce summarizer for texts longer than one model request.
+
+    Texts within ``chunk_tokens`` are summarized with a single request. Longer texts
+    are split with ``chunk_text``; the chunks are summarized by up to ``workers``
+    threads at once, and the chunk summaries are combined with ``REDUCE_PROMPT``,
+    in several rounds if they do not fit one request together.
+
+    Chunk summaries are looked up in and added to ``cache``, a dict from
+    ``summary_cache_key`` (with ``CHUNK_PROMPT_VERSION``) to summary that callers may
+    preload, e.g. from a database; summaries generated since the last call to
+    ``take_generated`` are collected so callers can persist them.
+
+    Attributes:
+        client (SummaryClient): The model answering the requests.
+        chunk_tokens (int): Largest request size in estimated tokens.
+        workers (int): Number of chunks summarized concurrently per text.
+        cache (dict): Known chunk summaries by key.
+    """
+
+    def __init__(self, client: SummaryClient, chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+                 workers: int = DEFAULT_CHUNK_WORKERS, cache: dict = None):
+        self.client = client
+        self.chunk_tokens = chunk_tokens
+        self.workers = workers
+        self.cache = {} if cache is None else cache
+        self._generated = {}
+        self._lock = threading.Lock()
+
+    @property
+    def model(self) -> str:
+        return self.client.model
+
+    def chunk_keys(self, text: str) -> list:
+        """Return the cache keys of the chunk summaries ``summarize`` needs for ``text``."""
+        if estimate_tokens(text) <= self.chunk_tokens:
+            return []
+        return [self._chunk_key(chunk) for chunk in chunk_text(text, self.chunk_tokens)]
+
+    def take_generated(self) -> dict:
+        """Return the chunk summaries generated since the last call, and forget them."""
+        with self._lock:
+            generated, self._generated = self._generated, {}
+        return generated
+
+    def summarize(self, text: str) -> str:
+        """
+        Summarize a text of any length.
+
+        Args:
+            text (str): The text to summarize.
+        Returns:
+            str: The summary.
+        Raises:
+            Exception: If any request to the model failed; chunk summaries that
+            succeeded are still cached.
+        """
+        if estimate_tokens(text) <= self.chunk_tokens:
+            return self.client.summarize(text)
+        summaries = self._map(chunk_text(text, self.chunk_tokens), CHUNK_PROMPT, cached=True)
+        # Reduce in rounds until the summaries fit into one request.
+        while estimate_tokens("\n\n".join(summaries)) > self.chunk_tokens and len(summaries) > 1:
+            groups, group = [], []
+            for summary in summaries:
+                if group and estimate_tokens("\n\n".join(group + [summary])) > self.chunk_tokens:
+                    groups.append(group)
+                    group = []
+                group.append(summary)
+            groups.append(group)
+            if len(groups) == len(summaries):
+                break
+            summaries = self._map(["\n\n".join(group) for group in groups], REDUCE_PROMPT)
+        return self.client.summarize("\n\n".join(summaries), prompt=REDUCE_PROMPT)
+
+    def _chunk_key(self, chunk: str) -> str:
+        return summary_cache_key(chunk, self.model, CHUNK_PROMPT_VERSION)
+
+    def _map(self, texts: list, prompt: str, cached: bool = False) -> list:
+        """Summarize ``texts`` concurrently, reusing and filling the cache if ``cached``."""
+        keys = [self._chunk_key(text) if cached else None for text in texts]
+        with self._lock:
+            results = [self.cache.get(key) if cached else None for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+
+        def summarize(i):
+            summary = self.client.summarize(texts[i], prompt=prompt)
+            if cached:
+                with self._lock:
+                    self.cache[keys[i]] = summary
+                    self._generated[keys[i]] = summary
+            return summary
+
+        if len(missing) <= 1 or self.workers <= 1:
+            summaries = [summarize(i) for i in missing]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(missing))) as executor:
+                summaries = list(executor.map(summarize, missing))
+        for i, summary in zip(missing, summaries):
+            results[i] = summary
+        return results
@@ -0,0 +1,128 @@
+from unittest.mock import patch, MagicMock
+
+import threading
+
+from backend.summarizer import (
+    OpenAISummaryClient, StubSummaryClient, ChunkedSummarizer, SUMMARY_PROMPT, CHUNK_PROMPT,
+    REDUCE_PROMPT, chunk_text, estimate_tokens, summary_cache_key
+)
+
+
+def test_openai_client_sends_prompt_and_text():
+    """
+    Test that the OpenAI client sends the summary prompt and the bill text to the configured model.
+    """
+    response = MagicMock()
+    response.choices[0].message.content = "A summary."
+    client = OpenAISummaryClient(model="test-model", max_tokens=50)
+    with patch("backend.summarizer.openai.ChatCompletion.create", return_value=response) as create:
+        assert client.summarize("Bill text") == "A summary."
+    create.assert_called_once_with(
+        model="test-model",
+        messages=[
+            {"role": "system", "content": SUMMARY_PROMPT},
+            {"role": "user", "content": "Bill text"}
+        ],
+        max_tokens=50
+    )
+
+
+def test_stub_client_is_deterministic():
+    """
+    Test that the stub keeps the leading sentences, simulates latency and counts its calls.
+    """
+    sleeps = []
+    client = StubSummaryClient(sentences=2, latency=0.5, sleep=sleeps.append)
+    text = "First sentence. Second sentence. Third sentence."
+    assert client.summarize(text) == "First sentence. Second sentence."
+    assert client.summarize(text) == client.summarize(text)
+    assert client.summarize("No period") == "No period."
+    assert client.calls == 4
+    assert sleeps == [0.5] * 4
+
+
+def test_summary_cache_key():
+    """
+    Test that cache keys ignore whitespace but change with the text, model and prompt version.
+    """
+    key = summary_cache_key("Be it enacted.  By the\nCongress.", "gpt-4o")
+    assert key == summary_cache_key(" Be it enacted. By the Congress. ", "gpt-4o")
+    assert key != summary_cache_key("Be it enacted. By the Senate.", "gpt-4o")
+    assert key != summary_cache_key("Be it enacted. By the Congress.", "stub")
+    assert key != summary_cache_key("Be it enacted. By the Congress.", "gpt-4o", prompt_version="2")
+    assert len(key) == 64
+
+
+BILL_TEXT = " ".join(f"SEC. {n}. The Secretary shall carry out program {n}; funds are authorized." for n in range(300))
+
+
+def test_chunk_text_bounds_and_stability():
+    """
+    Test that chunks stay within the token budget, keep every word in order, and that
+    an edit only changes the chunks around it.
+    """
+    chunks = chunk_text(BILL_TEXT, max_tokens=300)
+    assert len(chunks) > 10
+    assert all(estimate_tokens(chunk) <= 300 for chunk in chunks)
+    assert " ".join(chunks) == BILL_TEXT
+
+    edited = chunk_text(BILL_TEXT.replace("program 150;", "program 150 and program 151;"), max_tokens=300)
+    assert len(set(chunks) ^ set(edited)) <= 4
+
+    words = chunk_text("word " * 1000, max_tokens=100)
+    assert all(len(chunk) <= 400 and set(chunk.split()) == {"word"} for chunk in words)
+    assert sum(len(chunk.split()) for chunk in words) == 1000
+    assert chunk_text("   ") == []
+
+
+class RecordingClient(StubSummaryClient):
+    """Stub that records the prompt of each request and the threads serving them."""
+
+    def __init__(self):
+        super().__init__(sentences=1)
+        self.prompts = []
+        self.threads = set()
+
+    def summarize(self, text, prompt=SUMMARY_PROMPT):
+        with self._lock:
+            self.prompts.append(prompt)
+            self.threads.add(threading.get_ident())
+        return super().summarize(text, prompt)
+
+
+def test_chunked_summarizer_map_reduce():
+    """
+    Test that long texts are summarized chunk by chunk in parallel and then reduced,
+    that short texts take one request, and that cached chunks are not requested again.
+    """
+    client = RecordingClient()
+    summarizer = ChunkedSummarizer(client, chunk_tokens=300, workers=4)
+    assert summarizer.summarize("Short bill. It does one thing.") == "Short bill."
+    assert client.prompts == [SUMMARY_PROMPT]
+
+    client.prompts.clear()
+    summarizer.summarize(BILL_TEXT)
+    chunks = len(chunk_text(BILL_TEXT, 300))
+    assert client.prompts.count(CHUNK_PROMPT) == chunks
+    assert client.prompts[-1] == REDUCE_PROMPT
+    assert len(client.threads) > 1
+    generated = summarizer.take_generated()
+    assert sorted(generated) == sorted(set(summarizer.chunk_keys(BILL_TEXT)))
+    assert summarizer.take_generated() == {}
+
+    client.prompts.clear()
+    fresh = ChunkedSummarizer(client, chunk_tokens=300, cache=dict(generated))
+    fresh.summarize(BILL_TEXT)
+    assert CHUNK_PROMPT not in client.prompts
+
+
+def test_chunked_summarizer_reduces_in_rounds():
+    """
+    Test that chunk summaries too long for one request are combined in several rounds.
+    """
+    client = RecordingClient()
+    client.sentences = 6
+    summarizer = ChunkedSummarizer(client, chunk_tokens=300, workers=1)
+    summarizer.summarize(BILL_TEXT)
+    assert client.prompts.count(REDUCE_PROMPT) > 1
+    assert client.prompts[-1] == REDUCE_PROMPT
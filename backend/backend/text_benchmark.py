@@ -0,0 +1,180 @@
+"""
+Bill Text Extraction Benchmark
+
+Compares time and peak memory of two ways to get the ``<pre>`` text of formatted
+bill text:
+
+- ``soup``: the original path, building a ``BeautifulSoup(..., "html.parser")`` tree
+  of the whole document and calling ``get_text`` on its ``<pre>`` element.
+- ``stream``: :func:`~backend.bill_text.extract_pre_text`, feeding the HTML in
+  chunks to the incremental :class:`~backend.bill_text.PreTextExtractor`.
+
+Documents are synthetic bills shaped like congress.gov's formatted text, or the
+formatted texts recorded in a scraper response cache (``--cache-dir``), i.e. real
+bills. Run from the ``backend`` directory::
+
+    python -m backend.text_benchmark --sections 2000
+    python -m backend.text_benchmark --cache-dir scrape_cache
+
+Both paths must produce the same text; the benchmark stops if they do not.
+
+With ``--parse-workers N`` it also measures the scraper's parse stage: the documents
+parsed by :func:`~backend.bill_text.parse_bill_html` on N threads, which share one
+interpreter, and on N worker processes, which scale with cores.
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import random
+import textwrap
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from .bill_text import extract_pre_text, parse_bill_html, DEFAULT_CHUNK_SIZE
+
+_WORDS = (
+    "Secretary shall establish program grants States eligible entities fiscal year "
+    "appropriated funds amount section subsection paragraph provision Federal agency "
+    "report Congress regulation requirement described under title chapter pursuant"
+).split()
+
+
+def make_bill_html(sections: int, seed: int = 0) -> str:
+    """
+    Generate a bill document shaped like congress.gov's formatted text.
+
+    It has the bracketed header, the literal ``<DOC>`` and ``<all>`` markers, section
+    headings, wrapped and indented lines, character references, links and non-ASCII
+    characters.
+
+    Args:
+        sections (int): Number of sections; each is roughly 1 KB.
+        seed (int): Random seed.
+    Returns:
+        str: The HTML document.
+    """
+    rng = random.Random(seed)
+    lines = [
+        "<html><body><pre>",
+        "[Congressional Bills 118th Congress]",
+        "[From the U.S. Government Publishing Office]",
+        f"[H.R. {seed + 1} Introduced in House (IH)]",
+        "",
+        "<DOC>",
+        "",
+        "118th CONGRESS",
+        "  2d Session",
+        f"                                H. R. {seed + 1}",
+        "",
+        "To amend title 42, United States Code, &amp; for other purposes.",
+        "",
+        "    Be it enacted by the Senate and House of Representatives of the United",
+        "States of America in Congress assembled,",
+    ]
+    for number in range(1, sections + 1):
+        lines += ["", f"SEC. {number}. {' '.join(rng.choices(_WORDS, k=3)).upper()}.", ""]
+        for paragraph in range(rng.randint(1, 3)):
+            words = rng.choices(_WORDS, k=rng.randint(20, 60))
+            if rng.random() < 0.3:
+                words.insert(rng.randrange(len(words)), "&sect;&nbsp;" + str(rng.randint(1, 9999)))
+            if rng.random() < 0.2:
+                words.insert(rng.randrange(len(words)), "``naïve fee&#8212;schedule''")
+            if rng.random() < 0.1:
+                words.insert(rng.randrange(len(words)),
+                             f'<a href="https://www.govinfo.gov/link/uscode/42/{number}">42 U.S.C. {number}</a>')
+            if rng.random() < 0.1:
+                words.insert(rng.randrange(len(words)), "&lt;amount&gt;")
+            lines += textwrap.wrap(f"    ({chr(ord('a') + paragraph)}) " + " ".join(words), width=70,
+                                   break_long_words=False, break_on_hyphens=False)
+    lines += ["", "                                 &lt;all&gt;", "<all>", "</pre></body></html>"]
+    return "\n".join(lines)
+
+
+def soup_text(html: str) -> str:
+    """The original extraction: a full BeautifulSoup tree, then ``get_text`` of ``<pre>``."""
+    content = BeautifulSoup(html, "html.parser").find("pre")
+    return content.get_text(separator=" ", strip=True) if content else None
+
+
+def stream_text(html: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """The streaming extraction, fed in chunks as a response body would be."""
+    return extract_pre_text(html[i:i + chunk_size] for i in range(0, len(html), chunk_size))
+
+
+def cached_documents(cache_dir: str) -> list:
+    """Return the formatted bill texts recorded in a scraper response cache directory."""
+    documents = []
+    for path in glob.glob(os.path.join(cache_dir, "*", "*.json.gz")):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry["status_code"] == 200 and entry["url"].endswith(".htm"):
+            documents.append(entry["text"])
+    return documents
+
+
+def measure(extract, documents: list) -> dict:
+    """Run ``extract`` over ``documents``, returning total seconds and the largest peak memory in MB."""
+    seconds, peak = 0.0, 0
+    for document in documents:
+        tracemalloc.start()
+        start = time.perf_counter()
+        extract(document)
+        seconds += time.perf_counter() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {"seconds": seconds, "peak_mb": peak / 2 ** 20}
+
+
+def parallel_seconds(executor_type, workers: int, documents: list) -> float:
+    """Seconds a pool of ``workers`` takes to parse every document with ``parse_bill_html``, once started."""
+    bodies = [document.encode("utf-8") for document in documents]
+    with executor_type(max_workers=workers) as executor:
+        list(executor.map(parse_bill_html, [b"<pre></pre>"] * workers))
+        start = time.perf_counter()
+        list(executor.map(parse_bill_html, bodies))
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=2000, help="Sections per synthetic bill (about 1 KB each)")
+    parser.add_argument("--bills", type=int, default=3, help="Number of synthetic bills")
+    parser.add_argument("--cache-dir", help="Benchmark the formatted texts recorded in this response cache instead")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Characters fed per chunk")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="Also compare parsing on this many threads and processes")
+    args = parser.parse_args()
+
+    if args.cache_dir:
+        documents = cached_documents(args.cache_dir)
+        if not documents:
+            parser.error(f"no formatted bill texts recorded in {args.cache_dir}")
+    else:
+        documents = [make_bill_html(args.sections, seed) for seed in range(args.bills)]
+    size_mb = sum(len(document) for document in documents) / 2 ** 20
+    print(f"Documents: {len(documents)}, {size_mb:.1f} MB of HTML")
+
+    for document in documents:
+        if soup_text(document) != stream_text(document, args.chunk_size):
+            raise SystemExit("Extracted texts differ between BeautifulSoup and the streaming parser")
+
+    print(f"{'mode':<8}{'seconds':>10}{'MB/s':>10}{'peak MB':>10}")
+    for name, extract in (("soup", soup_text), ("stream", lambda html: stream_text(html, args.chunk_size))):
+        stats = measure(extract, documents)
+        print(f"{name:<8}{stats['seconds']:>10.2f}{size_mb / stats['seconds']:>10.1f}{stats['peak_mb']:>10.1f}")
+
+    if args.parse_workers:
+        print(f"\n{'workers':<10}{'seconds':>10}{'MB/s':>10}")
+        for name, executor_type in (("threads", ThreadPoolExecutor), ("processes", ProcessPoolExecutor)):
+            seconds = parallel_seconds(executor_type, args.parse_workers, documents)
+            print(f"{name:<10}{seconds:>10.2f}{size_mb / seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,41 +30,14 @@ export default function AdvancedSearchPage() {
             let data = [];
 
             try {
+                const options = { chamber, startDate, endDate };
                 if (sortBy == "relevancy") {
-                    data = await searchBillsByRelevancy(keyword);
+                    data = await searchBillsByRelevancy(keyword, options);
                 }
                 else {
-                    data = await searchBills(keyword);
-                    data.sort((a, b) => {
-                        switch (sortBy) {
-                            case 'newest':
-                                return new Date(b.latest_action_date).getTime() - new Date(a.latest_action_date).getTime();
-                            case 'oldest':
-                                return new Date(a.latest_action_date).getTime() - new Date(b.latest_action_date).getTime();
-                            case 'most-votes':
-                                return b.vote_count - a.vote_count;
-                            default:
-                                return 0;
-                        }
-                    });
-                }
-
-                if (chamber != "all") {
-                    if (chamber == "House")
-                        data = data.filter(bill => bill.origin_chamber === "House");
-                    else
-                        data = data.filter(bill => bill.origin_chamber === "Senate");
+                    data = await searchBills(keyword, { ...options, sort: sortBy as 'newest' | 'oldest' | 'most-votes' });
                 }
 
-                const isWithinRange = (bill: Bill, startDate: string, endDate: string) => {
-                    const billDates = [bill.latest_action_date, bill.created_at]
-                        .filter(date => date) // Ensure the field exists
-                        .map(date => new Date(date).toISOString().split('T')[0]); // Convert & format
-                
-                    return billDates.some(date => date >= startDate && date <= endDate);
-                };
-                data = data.filter(bill => isWithinRange(bill, startDate, endDate))
-
                 setBills(data);
                 console.log(data);
             }
@@ -29,14 +29,31 @@ export async function getTrendingBills(): Promise<Bill[]> {
   return response.json();
 }
 
-export async function searchBills(keyword: string): Promise<Bill[]> {
-  const response = await fetch(`${API_BASE}/search?keyword=${encodeURIComponent(keyword)}`);
+export interface SearchOptions {
+  chamber?: string;
+  startDate?: string;
+  endDate?: string;
+  sort?: 'relevance' | 'newest' | 'oldest' | 'most-votes';
+}
+
+// Filters and sorting are applied by the server before the result limit.
+function searchQuery(keyword: string, { chamber, startDate, endDate, sort }: SearchOptions): string {
+  const params = new URLSearchParams({ keyword });
+  if (chamber && chamber !== 'all') params.set('chamber', chamber);
+  if (startDate) params.set('start_date', startDate);
+  if (endDate) params.set('end_date', endDate);
+  if (sort) params.set('sort', sort);
+  return params.toString();
+}
+
+export async function searchBills(keyword: string, options: SearchOptions = {}): Promise<Bill[]> {
+  const response = await fetch(`${API_BASE}/search?${searchQuery(keyword, options)}`);
   if (!response.ok) throw new Error('Failed to search bills');
   return response.json();
 }
 
-export async function searchBillsByRelevancy(keyword: string): Promise<Bill[]> {
-  const response = await fetch(`${API_BASE}/search_tfidf?keyword=${encodeURIComponent(keyword)}`);
+export async function searchBillsByRelevancy(keyword: string, options: SearchOptions = {}): Promise<Bill[]> {
+  const response = await fetch(`${API_BASE}/search_tfidf?${searchQuery(keyword, options)}`);
   if (!response.ok) throw new Error('Failed to advanced search bills');
   return response.json();
 }